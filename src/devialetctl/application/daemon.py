@@ -1,23 +1,69 @@
 import asyncio
+import contextlib
+import functools
 import logging
+import random
 import time
-from typing import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Awaitable, Callable, Iterator
 
+from devialetctl.application.deferred_gateway import DeferredVolumeGateway
+from devialetctl.application.event_queue import CoalescingEventQueue, EventQueueStats
+from devialetctl.application.metrics import render_daemon_metrics
 from devialetctl.application.router import EventRouter
 from devialetctl.application.service import VolumeService
+from devialetctl.application.tx_scheduler import (
+    CecTxScheduler,
+    TxOutcome,
+    TxPriority,
+    TxSchedulerStats,
+)
 from devialetctl.domain.events import InputEvent, InputEventType
 from devialetctl.domain.policy import EventPolicy
-from devialetctl.infrastructure.cec_adapter import CecKernelAdapter
+from devialetctl.infrastructure.adaptive_timeout import background_requests
+from devialetctl.infrastructure.capture_file import CaptureWriter
+from devialetctl.infrastructure.cec_adapter import (
+    CEC_PHYS_ADDR_INVALID,
+    CecKernelAdapter,
+    CecTrafficStats,
+    CecTxResult,
+)
 from devialetctl.infrastructure.config import DaemonConfig
 from devialetctl.infrastructure.devialet_gateway import DevialetHttpGateway
+from devialetctl.infrastructure.device_watcher import DeviceNodeWatcher
+from devialetctl.infrastructure.flight_recorder import (
+    FlightRecorder,
+    combine_recorders,
+    dump_on_signal,
+    recording,
+)
 from devialetctl.infrastructure.keyboard_adapter import KeyboardAdapter
+from devialetctl.infrastructure.metrics_server import MetricsServer
+from devialetctl.infrastructure.state_store import AudioStateSnapshot, AudioStateStore
+from devialetctl.infrastructure.tracing import (
+    EventTrace,
+    EventTracer,
+    JsonlTraceSink,
+    TraceStageStats,
+    untraced,
+)
 
 LOG = logging.getLogger(__name__)
 _SAMSUNG_VENDOR_92_SUPPORTED_MODES = {0x01, 0x03, 0x04, 0x05, 0x06}
 _SAMSUNG_MODEL_NAME = "Devialet"
+# Samsung vendor subcommands that write to the speaker and must stay serialized.
+_SAMSUNG_VENDOR_IO_SUBCOMMANDS = {0x96}
 _VENDOR_COMPAT_VENDOR_ID: dict[str, int] = {
     "samsung": 0x0000F0,
 }
+_CEC_KERNEL_EVENT_KINDS = {
+    InputEventType.CEC_STATE_CHANGE,
+    InputEventType.CEC_HOTPLUG,
+    InputEventType.CEC_MESSAGES_LOST,
+}
+# FEATURE_ABORT(GIVE_AUDIO_STATUS, "not in correct mode to respond"): the TV may retry later.
+_GIVE_AUDIO_STATUS_ABORT_FRAME = "50:00:71:01"
 
 
 def _fixed_system_frame(frame: str) -> Callable[["DaemonRunner", CecKernelAdapter], str]:
@@ -42,10 +88,47 @@ _CEC_SYSTEM_RESPONSE_MAP: dict[InputEventType, _CecSystemFrameBuilder] = {
 }
 
 
+@dataclass
+class CecDeadlineStats:
+    misses: int = 0
+    fallback_replies: int = 0
+    feature_aborts: int = 0
+    corrective_reports: int = 0
+
+
+@dataclass
+class DaemonActivityStats:
+    watcher_polls: int = 0
+    watcher_failures: int = 0
+    watcher_skips: dict[str, int] = field(default_factory=dict)
+    policy_drops: int = 0
+    policy_drops_by_kind: dict[str, int] = field(default_factory=dict)
+    audio_status_cache_hits: int = 0
+    audio_status_cache_misses: int = 0
+
+    def skip_watcher_poll(self, reason: str) -> None:
+        self.watcher_skips[reason] = self.watcher_skips.get(reason, 0) + 1
+
+    def drop_by_policy(self, kind: str, count: int = 1) -> None:
+        self.policy_drops += count
+        self.policy_drops_by_kind[kind] = self.policy_drops_by_kind.get(kind, 0) + count
+
+
 class DaemonRunner:
-    def __init__(self, cfg: DaemonConfig, gateway: DevialetHttpGateway) -> None:
+    def __init__(
+        self,
+        cfg: DaemonConfig,
+        gateway: DevialetHttpGateway | DeferredVolumeGateway,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random | None = None,
+    ) -> None:
         self.cfg = cfg
         self.gateway = gateway
+        # Every deadline and window below reads this clock; the event loop's own clock
+        # drives the sleeps, so a virtual-time loop passes ``loop.time`` here.
+        self.clock = clock
+        # Restart backoff jitter; seeded by replays so reruns are reproducible.
+        self.rng = rng or random.Random()
         self._external_watch_interval_s = 0.5
         self._external_watch_suspend_s = 0.8
         self._external_watch_suspend_until = 0.0
@@ -53,11 +136,63 @@ class DaemonRunner:
         self._cached_volume: int | None = None
         self._cached_muted: bool | None = None
         self._vendor_state_byte: int = 0x14
+        self._state_store = AudioStateStore(cfg.state_file) if cfg.state_file else None
+        self._state_save_interval_s = 5.0
+        self._state_saved: AudioStateSnapshot | None = None
+        self._state_saved_at = float("-inf")
+        # Restored values answer the first requests; speaker writes wait for a live read.
+        self._audio_state_restored = False
+        self._restore_audio_state()
+        # CEC followers are expected to answer within ~1s; keep margin for the TX itself.
+        self._cec_reply_deadline_s = 0.8
+        self.deadline_stats = CecDeadlineStats()
+        self._background_tasks: set[asyncio.Task] = set()
+        self._cec_queue_size = 32
+        self.queue_stats = EventQueueStats()
+        self.event_queue: CoalescingEventQueue | None = None
+        self._cec_tx_frames_per_s = 20.0
+        self._cec_tx_burst = 6
+        self.tx_stats = TxSchedulerStats()
+        self._tx_scheduler: CecTxScheduler | None = None
+        self._reconcile_delay_s = 0.3
+        self._reconcile_due_at = 0.0
+        self._reconcile_task: asyncio.Task | None = None
+        self._adapter: CecKernelAdapter | None = None
+        # Builds the CEC adapter from the daemon's options; replays swap in a recording.
+        self.adapter_factory: Callable[..., CecKernelAdapter] | None = None
+        # A replay has no device to come back: its adapter errors end the run instead.
+        self.restart_cec_reader = True
+        self._stop_event: asyncio.Event | None = None
+        self.restart_counts: dict[str, int] = {}
+        # Shared by every adapter instance, so counters survive CEC reconnects.
+        self.cec_stats = CecTrafficStats()
+        self.activity_stats = DaemonActivityStats()
+        self.serve_metrics = cfg.metrics_port is not None
+        # Last few minutes of CEC/HTTP traffic, dumped on SIGUSR1 or over the metrics port.
+        self.flight_recorder = (
+            FlightRecorder(cfg.flight_recorder_size, clock=clock)
+            if cfg.flight_recorder_size > 0
+            else None
+        )
+        self.handle_dump_signal = True
+        # Long captures go to an append-only binary file (same records as the ring).
+        self.capture = CaptureWriter(cfg.capture_file, clock=clock) if cfg.capture_file else None
+        self._recorder = combine_recorders(self.flight_recorder, self.capture)
+        # Per-event RX -> speaker -> TX timelines, for the trace file and metrics.
+        self.trace_stats = TraceStageStats()
+        self._trace_sink = JsonlTraceSink(cfg.trace_file) if cfg.trace_file else None
+        self.tracer: EventTracer | None = None
+        if self._trace_sink is not None or cfg.metrics_port is not None:
+            sinks = [self.trace_stats]
+            if self._trace_sink is not None:
+                sinks.append(self._trace_sink)
+            self.tracer = EventTracer(sinks=sinks, clock=clock)
         self.router = EventRouter(
             service=VolumeService(gateway),
             policy=EventPolicy(
                 dedupe_window_s=cfg.dedupe_window_s,
                 min_interval_s=cfg.min_interval_s,
+                clock=clock,
             ),
         )
 
@@ -80,84 +215,367 @@ class DaemonRunner:
                 LOG.debug("handled keyboard event=%s key=%s", event.kind.value, event.key)
 
     def _run_cec_with_backoff(self) -> None:
+        asyncio.run(self.run_cec_async())
+
+    async def run_cec_async(self) -> None:
+        """The CEC daemon on the caller's event loop (``run_cec_forever`` owns one)."""
+        await self._supervise_cec_async()
+
+    async def _supervise_cec_async(self) -> None:
+        # One long-lived loop: cache, lock, watcher and HTTP pool survive CEC reconnects;
+        # only the component that failed is restarted.
+        self._io_lock = asyncio.Lock()
+        stop_event = asyncio.Event()
+        self._stop_event = stop_event
+        async with contextlib.AsyncExitStack() as stack:
+            if hasattr(self.gateway, "session"):
+                await stack.enter_async_context(self.gateway.session())
+            stack.enter_context(recording(self._recorder))
+            if self.flight_recorder is not None and self.handle_dump_signal:
+                stack.enter_context(dump_on_signal(self.dump_flight_recorder))
+            if self.serve_metrics:
+                await stack.enter_async_context(self._metrics_server().serve())
+            stack.enter_context(self._abort_on_target_resolution_failure())
+            watcher = asyncio.create_task(
+                self._supervise_component_async(
+                    "watcher",
+                    lambda: self._watch_external_audio_state_async(None, stop_event),
+                    stop_event,
+                )
+            )
+            try:
+                await self._supervise_component_async(
+                    "cec reader",
+                    lambda: self._run_cec_async(self._new_cec_adapter()),
+                    stop_event,
+                    wake=self._wait_for_cec_device_return,
+                    restart=self.restart_cec_reader,
+                )
+            finally:
+                stop_event.set()
+                await watcher
+                self._io_lock = None
+                self._stop_event = None
+                self._persist_audio_state(force=True)
+                if self.tracer is not None:
+                    self.tracer.flush(force=True)
+                if self._trace_sink is not None:
+                    self._trace_sink.close()
+                if self.capture is not None:
+                    self.capture.close()
+
+    def stop(self) -> None:
+        """Ask the CEC loop to exit once the current adapter session ends."""
+        if self._stop_event is not None:
+            self._stop_event.set()
+
+    def _metrics_server(self) -> MetricsServer:
+        routes = {}
+        if self.flight_recorder is not None:
+            routes["/debug/flight-recorder"] = self.flight_recorder.dumps
+        return MetricsServer(
+            render=lambda: render_daemon_metrics([self]),
+            host=self.cfg.metrics_host,
+            port=int(self.cfg.metrics_port or 0),
+            routes=routes,
+        )
+
+    def dump_flight_recorder(self) -> str | None:
+        if self.flight_recorder is None:
+            return None
+        stamp = time.strftime("%Y%m%dT%H%M%S")
+        device = Path(self.cfg.cec_device).name
+        path = Path(self.cfg.flight_recorder_dir or ".") / f"flight-recorder-{device}-{stamp}.jsonl"
+        try:
+            count = self.flight_recorder.dump(str(path))
+        except OSError as exc:
+            LOG.warning("cannot dump flight recorder to %s: %s", path, exc)
+            return None
+        LOG.warning("flight recorder: dumped %d records to %s", count, path)
+        return str(path)
+
+    @contextlib.contextmanager
+    def _abort_on_target_resolution_failure(self) -> Iterator[None]:
+        # CEC is claimed while the target is still being resolved; a resolution failure
+        # (no speaker found, unknown --system) stays fatal, as it was before parallel startup.
+        if not isinstance(self.gateway, DeferredVolumeGateway):
+            yield
+            return
+        main = asyncio.current_task()
+        failures: list[BaseException] = []
+
+        def _on_resolved(task: asyncio.Task) -> None:
+            if task.cancelled():
+                return
+            if task.exception() is not None:
+                failures.append(task.exception())
+                main.cancel()
+            elif not self._has_warm_audio_cache():
+                # Only now is it known whose saved state may be reused.
+                self._restore_audio_state()
+
+        resolution = self.gateway.start()
+        resolution.add_done_callback(_on_resolved)
+        try:
+            yield
+        except asyncio.CancelledError:
+            if failures:
+                raise failures[0] from None
+            raise
+        finally:
+            resolution.remove_done_callback(_on_resolved)
+
+    async def _supervise_component_async(
+        self,
+        name: str,
+        run: Callable[[], Awaitable[None]],
+        stop_event: asyncio.Event,
+        wake: Callable[[], Awaitable[None] | None] | None = None,
+        restart: bool = True,
+    ) -> None:
         backoff_s = self.cfg.reconnect_delay_s
         max_backoff_s = max(self.cfg.reconnect_delay_s, 20.0)
-        while True:
+        while not stop_event.is_set():
             try:
-                adapter = CecKernelAdapter(
-                    device=self.cfg.cec_device,
-                    osd_name=self.cfg.cec_osd_name,
-                    vendor_id=self._vendor_id_for_profile(),
-                    announce_vendor_id=self._should_spoof_vendor_id(),
-                    spoof_vendor_id=self._should_spoof_vendor_id(),
-                )
-                asyncio.run(self._run_cec_async(adapter))
+                await run()
                 backoff_s = self.cfg.reconnect_delay_s
-            except KeyboardInterrupt:
-                raise
             except Exception as exc:
-                LOG.exception("daemon cycle failed, retrying: %s", exc)
-                time.sleep(backoff_s)
+                if not restart:
+                    raise
+                self.restart_counts[name] = self.restart_counts.get(name, 0) + 1
+                LOG.exception("daemon %s failed, restarting: %s", name, exc)
+                # Jitter keeps several daemons from hammering a shared resource in lockstep.
+                delay_s = backoff_s * self.rng.uniform(0.5, 1.0)
+                await self._backoff_wait_async(delay_s, stop_event, wake() if wake else None)
                 backoff_s = min(max_backoff_s, backoff_s * 2.0)
 
+    @staticmethod
+    async def _backoff_wait_async(
+        delay_s: float,
+        stop_event: asyncio.Event,
+        wake: Awaitable[None] | None,
+    ) -> None:
+        waiters = [asyncio.ensure_future(stop_event.wait())]
+        if wake is not None:
+            waiters.append(asyncio.ensure_future(wake))
+        _done, pending = await asyncio.wait(
+            waiters,
+            timeout=delay_s,
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    def _wait_for_cec_device_return(self) -> Awaitable[None] | None:
+        # Only a vanished node shortens the backoff; other failures keep the full delay.
+        watcher = DeviceNodeWatcher(self.cfg.cec_device)
+        if watcher.is_ready():
+            return None
+        LOG.info("cec device %s is unavailable; waiting for it to reappear", self.cfg.cec_device)
+        return watcher.wait_ready()
+
+    def _new_cec_adapter(self) -> CecKernelAdapter:
+        options = {}
+        if self.tracer is not None:
+            # The kernel reports each transmit's status and tx_ts back to the tracer.
+            options["tx_listener"] = self._on_cec_tx_result
+            self.tracer.kernel_tx_results = True
+        if self._recorder is not None:
+            options["recorder"] = self._recorder
+        factory = self.adapter_factory or CecKernelAdapter
+        return factory(
+            device=self.cfg.cec_device,
+            osd_name=self.cfg.cec_osd_name,
+            vendor_id=self._vendor_id_for_profile(),
+            announce_vendor_id=self._should_spoof_vendor_id(),
+            spoof_vendor_id=self._should_spoof_vendor_id(),
+            stats=self.cec_stats,
+            clock=self.clock,
+            **options,
+        )
+
     async def _run_cec_async(self, adapter: CecKernelAdapter) -> None:
-        self._io_lock = asyncio.Lock()
-        stop_event = asyncio.Event()
-        watcher = asyncio.create_task(self._watch_external_audio_state_async(adapter, stop_event))
+        queue = CoalescingEventQueue(maxsize=self._cec_queue_size, stats=self.queue_stats)
+        self.event_queue = queue
+        tx_task: asyncio.Task | None = None
+        if hasattr(adapter, "send_tx"):
+            self._tx_scheduler = CecTxScheduler(
+                send=functools.partial(self._transmit, adapter),
+                frames_per_s=self._cec_tx_frames_per_s,
+                burst=self._cec_tx_burst,
+                stats=self.tx_stats,
+                clock=self.clock,
+            )
+            tx_task = asyncio.create_task(self._tx_scheduler.run())
+        handler = asyncio.create_task(self._handle_queued_cec_events_async(adapter, queue))
+        self._adapter = adapter
         try:
+            # Keep reading frames while the handler waits on the speaker, so the kernel
+            # receive queue never overflows; protocol-only replies are sent inline.
             async for event in adapter.async_events():
-                await self._handle_cec_event_async(adapter, event)
+                deadline = self.clock() + self._cec_reply_deadline_s
+                trace = self.tracer.begin(event) if self.tracer is not None else None
+                with self._traced(trace):
+                    handled = await self._handle_cec_event_without_io_async(adapter, event)
+                if handled:
+                    self._finish_trace(trace)
+                    continue
+                queue.put(event, deadline, trace)
         finally:
-            stop_event.set()
-            await watcher
-            self._io_lock = None
+            self._adapter = None
+            queue.close()
+            await handler
+            if self._reconcile_task is not None:
+                self._reconcile_task.cancel()
+                await asyncio.gather(self._reconcile_task, return_exceptions=True)
+                self._reconcile_task = None
+            # Late audio-status fetches would correct the TV through a closed adapter.
+            late_fetches = list(self._background_tasks)
+            for task in late_fetches:
+                task.cancel()
+            await asyncio.gather(*late_fetches, return_exceptions=True)
+            self._background_tasks.clear()
+            if tx_task is not None:
+                tx_task.cancel()
+                await asyncio.gather(tx_task, return_exceptions=True)
+                # The adapter is closed by now: queued frames have nowhere to go.
+                dropped = self._tx_scheduler.drop_pending()
+                if dropped:
+                    LOG.debug("dropped %d queued CEC frames at adapter teardown", dropped)
+            self._tx_scheduler = None
+            self.event_queue = None
+
+    async def _handle_queued_cec_events_async(
+        self,
+        adapter: CecKernelAdapter,
+        queue: CoalescingEventQueue,
+    ) -> None:
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            if item.trace is not None:
+                self.tracer.mark_dequeued(item.trace)
+            try:
+                with self._traced(item.trace):
+                    await self._handle_cec_event_async(
+                        adapter, item.event, item.deadline, repeats=item.repeats
+                    )
+            except Exception as exc:
+                LOG.warning("failed to handle CEC event=%s: %s", item.event.kind.value, exc)
+            finally:
+                self._finish_trace(item.trace)
+
+    def _traced(self, trace: EventTrace | None) -> contextlib.AbstractContextManager:
+        if self.tracer is None:
+            return contextlib.nullcontext()
+        return self.tracer.activate(trace)
+
+    def _finish_trace(self, trace: EventTrace | None) -> None:
+        if trace is not None:
+            self.tracer.finish(trace)
 
-    async def _handle_cec_event_async(self, adapter: CecKernelAdapter, event: InputEvent) -> None:
+    def _on_cec_tx_result(self, result: CecTxResult) -> None:
+        self.tracer.record_tx_result(result.frame, result.tx_status, result.tx_ts_ns, result.ok)
+
+    async def _handle_cec_event_async(
+        self,
+        adapter: CecKernelAdapter,
+        event: InputEvent,
+        deadline: float | None = None,
+        repeats: int = 1,
+    ) -> None:
+        if deadline is None:
+            deadline = self.clock() + self._cec_reply_deadline_s
+        # Protocol-only replies never touch the speaker: answer them right away so
+        # they don't queue behind an in-flight watcher poll or volume update.
+        if await self._handle_cec_event_without_io_async(adapter, event):
+            return
+        if event.kind == InputEventType.GIVE_AUDIO_STATUS:
+            await self._answer_give_audio_status_async(adapter, deadline)
+            return
         # Pause external Devialet polling while we process inbound CEC commands,
         # so watcher reads don't race with in-flight push/update handling.
         self._suspend_external_watch_for_push()
         async with self._require_io_lock():
-            if self._handle_cec_system_request(adapter, event.kind):
-                return
             if event.kind == InputEventType.SAMSUNG_VENDOR_COMMAND:
-                if self._is_samsung_vendor_compat_enabled():
-                    await self._handle_samsung_vendor_command_async(adapter, event)
-                else:
-                    LOG.debug("ignored Samsung vendor command (compat disabled)")
-                return
-            if event.kind == InputEventType.SAMSUNG_VENDOR_COMMAND_WITH_ID:
-                if self._is_samsung_vendor_compat_enabled():
-                    self._handle_samsung_vendor_command_with_id(event)
-                else:
-                    LOG.debug("ignored Samsung vendor command-with-id (compat disabled)")
+                await self._handle_samsung_vendor_command_async(adapter, event)
                 return
             if event.kind == InputEventType.SET_AUDIO_VOLUME_LEVEL:
-                await self._handle_set_audio_volume_level_async(adapter, event)
-                return
-            if event.kind == InputEventType.GIVE_AUDIO_STATUS:
-                await self._report_audio_status_async(adapter)
+                await self._handle_set_audio_volume_level_async(adapter, event, deadline)
                 return
             if not self.router.policy.should_emit(event):
+                self.activity_stats.drop_by_policy(event.kind.value, repeats)
                 return
-            if event.kind == InputEventType.VOLUME_UP:
-                await self._relative_step_async(delta=1, fallback=self.gateway.volume_up_async)
-                self._update_cache_after_relative_event(event.kind)
-                LOG.debug("handled event=%s key=%s", event.kind.value, event.key)
-                await self._report_audio_status_async(adapter)
-                return
-            if event.kind == InputEventType.VOLUME_DOWN:
-                await self._relative_step_async(delta=-1, fallback=self.gateway.volume_down_async)
-                self._update_cache_after_relative_event(event.kind)
+            if event.kind in {InputEventType.VOLUME_UP, InputEventType.VOLUME_DOWN}:
+                if event.kind == InputEventType.VOLUME_UP:
+                    await self._relative_step_async(
+                        delta=repeats, fallback=self.gateway.volume_up_async
+                    )
+                else:
+                    await self._relative_step_async(
+                        delta=-repeats, fallback=self.gateway.volume_down_async
+                    )
+                self._update_cache_after_relative_event(event.kind, repeats)
                 LOG.debug("handled event=%s key=%s", event.kind.value, event.key)
-                await self._report_audio_status_async(adapter)
+                self._schedule_audio_state_reconcile(adapter)
+                # With a cold cache the reconcile reports the real value once it is known.
+                if self._has_warm_audio_cache():
+                    await self._report_audio_status_async(adapter, deadline)
                 return
             if event.kind == InputEventType.MUTE:
                 await self.gateway.mute_toggle_async()
                 self._update_cache_after_relative_event(event.kind)
                 LOG.debug("handled event=%s key=%s", event.kind.value, event.key)
-                await self._report_audio_status_async(adapter)
+                await self._report_audio_status_async(adapter, deadline)
                 return
 
+    async def _handle_cec_event_without_io_async(
+        self,
+        adapter: CecKernelAdapter,
+        event: InputEvent,
+    ) -> bool:
+        if self._handle_cec_system_request(adapter, event.kind):
+            return True
+        if event.kind in _CEC_KERNEL_EVENT_KINDS:
+            self._handle_cec_kernel_event(adapter, event)
+            return True
+        if event.kind == InputEventType.SAMSUNG_VENDOR_COMMAND:
+            if not self._is_samsung_vendor_compat_enabled():
+                LOG.debug("ignored Samsung vendor command (compat disabled)")
+                return True
+            if event.vendor_subcommand in _SAMSUNG_VENDOR_IO_SUBCOMMANDS:
+                return False
+            await self._handle_samsung_vendor_command_async(adapter, event)
+            return True
+        if event.kind == InputEventType.SAMSUNG_VENDOR_COMMAND_WITH_ID:
+            if self._is_samsung_vendor_compat_enabled():
+                self._handle_samsung_vendor_command_with_id(event)
+            else:
+                LOG.debug("ignored Samsung vendor command-with-id (compat disabled)")
+            return True
+        if event.kind == InputEventType.GIVE_AUDIO_STATUS and self._has_warm_audio_cache():
+            self.activity_stats.audio_status_cache_hits += 1
+            await self._report_audio_status_async(adapter, priority=TxPriority.REPLY)
+            return True
+        return False
+
+    def _handle_cec_kernel_event(self, adapter: CecKernelAdapter, event: InputEvent) -> None:
+        if event.kind == InputEventType.CEC_STATE_CHANGE and event.value == CEC_PHYS_ADDR_INVALID:
+            LOG.info("CEC physical address lost; waiting for the TV link to come back")
+            return
+        if event.kind == InputEventType.CEC_HOTPLUG and not event.value:
+            return
+        # The TV (re)appeared or we missed frames: push our state instead of waiting
+        # for the next request, then confirm it against the speaker.
+        if self._has_warm_audio_cache():
+            self._report_audio_status_for_state(
+                adapter, int(self._cached_volume), bool(self._cached_muted)
+            )
+        self._schedule_audio_state_reconcile(adapter)
+        LOG.debug("resynced audio status after kernel event=%s", event.kind.value)
+
     def _handle_cec_system_request(self, adapter: CecKernelAdapter, kind: InputEventType) -> bool:
         frame_builder = _CEC_SYSTEM_RESPONSE_MAP.get(kind)
         if frame_builder is None:
@@ -166,25 +584,92 @@ class DaemonRunner:
         if not frame:
             LOG.debug("cannot build CEC system response frame for event=%s", kind.value)
             return True
-        sent = self._send_tx(adapter, frame)
-        if sent:
-            LOG.debug("sent CEC system response frame: %s", frame)
-        else:
-            LOG.debug("cannot send CEC system response frame: %s", frame)
+        outcome = self._send_tx(adapter, frame)
+        LOG.debug("CEC system response frame %s: %s", outcome.value, frame)
         return True
 
-    async def _report_audio_status_async(self, adapter: CecKernelAdapter) -> None:
+    async def _answer_give_audio_status_async(
+        self,
+        adapter: CecKernelAdapter,
+        deadline: float,
+    ) -> None:
+        self.activity_stats.audio_status_cache_misses += 1
+        if not self._is_speaker_available():
+            # Circuit open: a fetch would fail fast anyway, answer from cache right away.
+            self._reply_audio_status_fallback(adapter)
+            return
+        # Cold cache: fetch under the I/O lock, but never answer later than the deadline.
+        # A late fetch keeps running and corrects the TV once the real value arrives.
+        fetch = asyncio.ensure_future(self._get_audio_state_serialized_async())
+        remaining_s = max(0.0, deadline - self.clock())
+        try:
+            volume, muted = await asyncio.wait_for(asyncio.shield(fetch), remaining_s)
+        except asyncio.TimeoutError:
+            self.deadline_stats.misses += 1
+            replied = self._reply_audio_status_fallback(adapter)
+            self._background_tasks.add(fetch)
+            fetch.add_done_callback(self._background_tasks.discard)
+            fetch.add_done_callback(
+                functools.partial(self._send_corrective_audio_status, adapter, replied)
+            )
+            return
+        except Exception as exc:
+            LOG.debug("failed to fetch CEC audio status: %s", exc)
+            self._reply_audio_status_fallback(adapter)
+            return
+        outcome = self._report_audio_status_for_state(adapter, volume, muted, TxPriority.REPLY)
+        LOG.debug("CEC audio status %s volume=%d muted=%s", outcome.value, volume, muted)
+
+    def _reply_audio_status_fallback(self, adapter: CecKernelAdapter) -> tuple[int, bool] | None:
+        # Half a state is no answer: reporting an unknown mute as "unmuted" would lie.
+        if not self._has_warm_audio_cache():
+            self._send_tx(adapter, _GIVE_AUDIO_STATUS_ABORT_FRAME)
+            self.deadline_stats.feature_aborts += 1
+            LOG.debug("audio state unknown; sent FEATURE_ABORT for GIVE_AUDIO_STATUS")
+            return None
+        volume = int(self._cached_volume)
+        muted = bool(self._cached_muted)
+        self._report_audio_status_for_state(adapter, volume, muted, TxPriority.REPLY)
+        self.deadline_stats.fallback_replies += 1
+        LOG.debug("sent CEC audio status from last known state volume=%d muted=%s", volume, muted)
+        return volume, muted
+
+    def _send_corrective_audio_status(
+        self,
+        adapter: CecKernelAdapter,
+        replied: tuple[int, bool] | None,
+        fetch: asyncio.Future,
+    ) -> None:
+        if fetch.cancelled():
+            return
+        exc = fetch.exception()
+        if exc is not None:
+            LOG.debug("late CEC audio status fetch failed: %s", exc)
+            return
+        volume, muted = fetch.result()
+        if replied == (volume, muted):
+            return
+        if self._report_audio_status_for_state(adapter, volume, muted):
+            self.deadline_stats.corrective_reports += 1
+            LOG.debug("sent corrective CEC audio status volume=%d muted=%s", volume, muted)
+
+    async def _report_audio_status_async(
+        self,
+        adapter: CecKernelAdapter,
+        deadline: float | None = None,
+        priority: TxPriority = TxPriority.REPORT,
+    ) -> None:
         try:
             volume, muted = await self._get_audio_state_async()
-            sent = self._report_audio_status_for_state(adapter, volume, muted)
-            if sent:
-                LOG.debug(
-                    "sent CEC audio status frame for cached state volume=%d muted=%s",
-                    volume,
-                    muted,
-                )
-            else:
-                LOG.debug("cannot send CEC audio status; adapter not writable")
+            if deadline is not None and self.clock() > deadline:
+                self.deadline_stats.misses += 1
+            outcome = self._report_audio_status_for_state(adapter, volume, muted, priority)
+            LOG.debug(
+                "CEC audio status for cached state %s volume=%d muted=%s",
+                outcome.value,
+                volume,
+                muted,
+            )
         except Exception as exc:
             LOG.debug("failed to report CEC audio status: %s", exc)
 
@@ -192,6 +677,7 @@ class DaemonRunner:
         self,
         adapter: CecKernelAdapter,
         event: InputEvent,
+        deadline: float | None = None,
     ) -> None:
         try:
             target_volume = event.value
@@ -205,7 +691,7 @@ class DaemonRunner:
             if event.muted is not None:
                 current_muted = (
                     self._cached_muted
-                    if self._cached_muted is not None
+                    if self._cached_muted is not None and not self._audio_state_restored
                     else await self.gateway.get_mute_state_async()
                 )
                 if bool(event.muted) != current_muted:
@@ -217,7 +703,7 @@ class DaemonRunner:
                 event.value,
                 event.muted,
             )
-            await self._report_audio_status_async(adapter)
+            await self._report_audio_status_async(adapter, deadline)
         except Exception as exc:
             LOG.debug("failed to handle CEC set_audio_volume_level: %s", exc)
 
@@ -236,11 +722,8 @@ class DaemonRunner:
                 self._sync_vendor_state_from_volume(self._cached_volume)
             state = self._vendor_state_byte
             frame = f"50:89:95:01:{state:02X}"
-            sent = self._send_tx(adapter, frame)
-            if sent:
-                LOG.debug("sent Samsung vendor sync response frame: %s", frame)
-            else:
-                LOG.debug("cannot send Samsung vendor sync response frame: %s", frame)
+            outcome = self._send_tx(adapter, frame)
+            LOG.debug("Samsung vendor sync response frame %s: %s", outcome.value, frame)
             return
 
         if subcommand == 0x92:
@@ -255,11 +738,8 @@ class DaemonRunner:
             model_name = _SAMSUNG_MODEL_NAME.encode("ascii", errors="ignore")[:14]
             if model_name:
                 frame = "50:89:88:" + ":".join(f"{byte:02X}" for byte in model_name)
-                sent = self._send_tx(adapter, frame)
-                if sent:
-                    LOG.debug("sent Samsung model-name response frame: %s", frame)
-                else:
-                    LOG.debug("cannot send Samsung model-name response frame: %s", frame)
+                outcome = self._send_tx(adapter, frame)
+                LOG.debug("Samsung model-name response frame %s: %s", outcome.value, frame)
             LOG.debug("handled Samsung vendor subcommand=0x88 payload=%s", payload)
             return
 
@@ -268,7 +748,7 @@ class DaemonRunner:
             if len(payload) >= 2:
                 candidate = payload[-1]
                 if 0 <= candidate <= 100:
-                    current = self._cached_volume
+                    current = self._live_cached_volume()
                     if current != candidate:
                         await self.gateway.set_volume_async(candidate)
                     self._vendor_state_byte = candidate
@@ -294,13 +774,20 @@ class DaemonRunner:
             self._cached_muted = cached_muted
         return cached_volume, cached_muted
 
-    def _update_cache_after_relative_event(self, kind: InputEventType) -> None:
+    async def _get_audio_state_serialized_async(self) -> tuple[int, bool]:
+        async with self._require_io_lock():
+            return await self._get_audio_state_async()
+
+    def _has_warm_audio_cache(self) -> bool:
+        return self._cached_volume is not None and self._cached_muted is not None
+
+    def _update_cache_after_relative_event(self, kind: InputEventType, steps: int = 1) -> None:
         if kind == InputEventType.VOLUME_UP and self._cached_volume is not None:
-            self._cached_volume = min(100, self._cached_volume + 1)
+            self._cached_volume = min(100, self._cached_volume + steps)
             self._sync_vendor_state_from_volume(self._cached_volume)
             return
         if kind == InputEventType.VOLUME_DOWN and self._cached_volume is not None:
-            self._cached_volume = max(0, self._cached_volume - 1)
+            self._cached_volume = max(0, self._cached_volume - steps)
             self._sync_vendor_state_from_volume(self._cached_volume)
             return
         if kind == InputEventType.MUTE and self._cached_muted is not None:
@@ -309,67 +796,168 @@ class DaemonRunner:
     def _sync_vendor_state_from_volume(self, volume: int) -> None:
         self._vendor_state_byte = max(0, min(100, int(volume)))
 
-    def _send_tx(self, adapter: CecKernelAdapter, frame: str) -> bool:
+    def _live_cached_volume(self) -> int | None:
+        # A restored volume is fine for replies, but must not drive absolute writes.
+        return None if self._audio_state_restored else self._cached_volume
+
+    def _store_live_audio_state(self, volume: int, muted: bool) -> bool:
+        changed = volume != self._cached_volume or muted != self._cached_muted
+        self._cached_volume = volume
+        self._cached_muted = muted
+        self._sync_vendor_state_from_volume(volume)
+        self._audio_state_restored = False
+        return changed
+
+    def _state_target(self) -> str | None:
+        if self.cfg.state_target is not None:
+            return self.cfg.state_target
+        # A discovered speaker is only known by its URL once discovery resolved it.
+        gateway = getattr(self.gateway, "resolved", self.gateway)
+        base_url = getattr(gateway, "base_url", None)
+        return f"url:{base_url}" if base_url else None
+
+    def _restore_audio_state(self) -> None:
+        if self._state_store is None:
+            return
+        target = self._state_target()
+        if target is None:
+            return
+        snapshot = self._state_store.load()
+        if snapshot is None:
+            return
+        if snapshot.target != target:
+            LOG.info(
+                "ignoring saved audio state of %s; daemon target is %s",
+                snapshot.target or "an unknown target",
+                target,
+            )
+            return
+        self._cached_volume = snapshot.volume
+        self._cached_muted = snapshot.muted
+        self._vendor_state_byte = snapshot.vendor_state
+        self._audio_state_restored = True
+        self._state_saved = snapshot
+        LOG.info(
+            "restored last known audio state volume=%d muted=%s",
+            snapshot.volume,
+            snapshot.muted,
+        )
+
+    def _persist_audio_state(self, force: bool = False) -> None:
+        if self._state_store is None or self._audio_state_restored:
+            return
+        if not self._has_warm_audio_cache():
+            return
+        target = self._state_target()
+        if target is None:
+            return
+        snapshot = AudioStateSnapshot(
+            volume=int(self._cached_volume),
+            muted=bool(self._cached_muted),
+            vendor_state=self._vendor_state_byte,
+            target=target,
+        )
+        if snapshot == self._state_saved:
+            return
+        now = self.clock()
+        if not force and now - self._state_saved_at < self._state_save_interval_s:
+            return
+        if self._state_store.save(snapshot):
+            self._state_saved = snapshot
+            self._state_saved_at = now
+
+    def _send_tx(
+        self,
+        adapter: CecKernelAdapter,
+        frame: str,
+        priority: TxPriority = TxPriority.REPLY,
+        coalesce_key: str | None = None,
+    ) -> TxOutcome:
+        # Truthy once accepted; a QUEUED frame is not on the bus yet (see TxOutcome).
         if not hasattr(adapter, "send_tx"):
-            return False
-        return bool(adapter.send_tx(frame))
+            return TxOutcome.FAILED
+        if self.tracer is not None:
+            self.tracer.record_tx_submit(frame)
+        if self._tx_scheduler is not None:
+            return self._tx_scheduler.submit(frame, priority, coalesce_key)
+        return TxOutcome.SENT if self._transmit(adapter, frame) else TxOutcome.FAILED
+
+    def _transmit(self, adapter: CecKernelAdapter, frame: str) -> bool:
+        ok = bool(adapter.send_tx(frame))
+        if self.tracer is not None:
+            self.tracer.record_tx_sent(frame, ok)
+        return ok
 
     def _report_audio_status_for_state(
         self,
         adapter: CecKernelAdapter,
         volume: int,
         muted: bool,
-    ) -> bool:
+        priority: TxPriority = TxPriority.REPORT,
+    ) -> TxOutcome:
         status = (0x80 if muted else 0x00) | (volume & 0x7F)
         frame = f"50:7A:{status:02X}"
-        return self._send_tx(adapter, frame)
+        # A newer audio status always supersedes one still waiting for bus time.
+        return self._send_tx(adapter, frame, priority, coalesce_key="50:7A")
 
     async def _watch_external_audio_state_async(
         self,
-        adapter: CecKernelAdapter,
+        adapter: CecKernelAdapter | None,
         stop_event: asyncio.Event,
     ) -> None:
+        # adapter=None follows the currently connected adapter across reconnects.
         while not stop_event.is_set():
-            changed, volume, muted = await self._poll_external_audio_state_once_async()
+            if self._is_speaker_available():
+                changed, volume, muted = await self._poll_external_audio_state_once_async()
+            else:
+                # Paused while the speaker's circuit is open; polls resume with the probe.
+                LOG.debug("external audio-state polling paused: speaker unreachable")
+                self.activity_stats.skip_watcher_poll("unavailable")
+                changed, volume, muted = False, 0, False
+            self._persist_audio_state()
             if changed:
-                sent = self._report_audio_status_for_state(adapter, volume, muted)
+                target = adapter if adapter is not None else self._adapter
+                sent = self._report_audio_status_for_state(target, volume, muted)
                 if sent:
                     LOG.debug(
                         "external audio-state changed; notified TV volume=%d muted=%s",
                         volume,
                         muted,
                     )
-            await asyncio.sleep(self._external_watch_interval_s)
+            try:
+                await asyncio.wait_for(stop_event.wait(), self._external_watch_interval_s)
+            except asyncio.TimeoutError:
+                pass
 
     async def _poll_external_audio_state_once_async(self) -> tuple[bool, int, bool]:
         async with self._require_io_lock():
             if self._is_external_watch_suspended():
+                self.activity_stats.skip_watcher_poll("suspended")
                 return False, 0, False
+            self.activity_stats.watcher_polls += 1
             try:
-                volume = max(0, min(100, int(await self.gateway.get_volume_async())))
-                muted = await self.gateway.get_mute_state_async()
+                with background_requests():
+                    volume = max(0, min(100, int(await self.gateway.get_volume_async())))
+                    muted = await self.gateway.get_mute_state_async()
             except Exception as exc:
+                self.activity_stats.watcher_failures += 1
                 LOG.debug("external audio-state polling failed: %s", exc)
                 return False, 0, False
 
-            if self._cached_volume is None or self._cached_muted is None:
-                self._cached_volume = volume
-                self._cached_muted = muted
-                self._sync_vendor_state_from_volume(volume)
+            if not self._has_warm_audio_cache():
+                self._store_live_audio_state(volume, muted)
                 return False, volume, muted
+            # A restored state that turns out stale is corrected on the TV right away.
+            return self._store_live_audio_state(volume, muted), volume, muted
 
-            changed = volume != self._cached_volume or muted != self._cached_muted
-            if changed:
-                self._cached_volume = volume
-                self._cached_muted = muted
-                self._sync_vendor_state_from_volume(volume)
-            return changed, volume, muted
+    def _is_speaker_available(self) -> bool:
+        return bool(getattr(self.gateway, "available", True))
 
     def _suspend_external_watch_for_push(self) -> None:
-        self._external_watch_suspend_until = time.monotonic() + self._external_watch_suspend_s
+        self._external_watch_suspend_until = self.clock() + self._external_watch_suspend_s
 
     def _is_external_watch_suspended(self) -> bool:
-        return time.monotonic() < self._external_watch_suspend_until
+        return self.clock() < self._external_watch_suspend_until
 
     def _require_io_lock(self) -> asyncio.Lock:
         if self._io_lock is None:
@@ -403,10 +991,45 @@ class DaemonRunner:
         return f"50:47:{payload}"
 
     async def _relative_step_async(self, delta: int, fallback) -> None:
+        # One round-trip per key press (merged repeats included): the cache is
+        # authoritative for the current value, and the native volumeUp/volumeDown
+        # endpoint covers a cold cache, one call per step.
+        current = self._live_cached_volume()
+        if current is None:
+            for _ in range(abs(delta)):
+                await fallback()
+            return
+        target = max(0, min(100, current + delta))
+        if target == current:
+            return
         try:
-            current = int(await self.gateway.get_volume_async())
-            target = max(0, min(100, current + delta))
-            if target != current:
-                await self.gateway.set_volume_async(target)
+            await self.gateway.set_volume_async(target)
         except Exception:
-            await fallback()
+            for _ in range(abs(delta)):
+                await fallback()
+
+    def _schedule_audio_state_reconcile(self, adapter: CecKernelAdapter) -> None:
+        # Debounced: a held key keeps pushing the reconcile back until it is released.
+        self._reconcile_due_at = self.clock() + self._reconcile_delay_s
+        if self._reconcile_task is None or self._reconcile_task.done():
+            # The reconcile outlives the event that scheduled it; keep it off that trace.
+            with untraced():
+                self._reconcile_task = asyncio.create_task(
+                    self._reconcile_audio_state_async(adapter)
+                )
+
+    async def _reconcile_audio_state_async(self, adapter: CecKernelAdapter) -> None:
+        while (remaining_s := self._reconcile_due_at - self.clock()) > 0:
+            await asyncio.sleep(remaining_s)
+        async with self._require_io_lock():
+            try:
+                with background_requests():
+                    volume = max(0, min(100, int(await self.gateway.get_volume_async())))
+                    muted = await self.gateway.get_mute_state_async()
+            except Exception as exc:
+                LOG.debug("audio-state reconcile failed: %s", exc)
+                return
+            changed = self._store_live_audio_state(volume, muted)
+        if changed:
+            self._report_audio_status_for_state(adapter, volume, muted)
+            LOG.debug("reconciled audio state; notified TV volume=%d muted=%s", volume, muted)
@@ -0,0 +1,98 @@
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from devialetctl.application.ports import VolumeGateway
+
+LOG = logging.getLogger(__name__)
+
+
+@dataclass
+class DeferredVolumeGateway(VolumeGateway):
+    """Volume gateway whose target is resolved in the background.
+
+    Lets the daemon claim CEC and answer protocol-only requests while discovery and
+    ``--system`` probing are still running; speaker calls made meanwhile wait for the
+    resolved gateway, in arrival order.
+    """
+
+    resolve: Callable[[], Awaitable[VolumeGateway]]
+    _gateway: VolumeGateway | None = field(default=None, init=False, repr=False)
+    _task: asyncio.Task | None = field(default=None, init=False, repr=False)
+    _stack: contextlib.AsyncExitStack | None = field(default=None, init=False, repr=False)
+
+    @property
+    def base_url(self) -> str:
+        return getattr(self._gateway, "base_url", "<resolving>")
+
+    @property
+    def resolved(self) -> VolumeGateway | None:
+        return self._gateway
+
+    @property
+    def is_ready(self) -> bool:
+        return self._gateway is not None
+
+    @property
+    def available(self) -> bool:
+        # Until resolved, calls wait for the target rather than failing fast.
+        return getattr(self._gateway, "available", True)
+
+    def start(self) -> asyncio.Task:
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._resolve_async())
+        return self._task
+
+    async def wait_ready(self) -> VolumeGateway:
+        if self._gateway is not None:
+            return self._gateway
+        # Shielded: a cancelled caller must not abort resolution for everyone else.
+        return await asyncio.shield(self.start())
+
+    @contextlib.asynccontextmanager
+    async def session(self) -> AsyncIterator["DeferredVolumeGateway"]:
+        """Resolve in the background and open the resolved gateway's session once known."""
+        async with contextlib.AsyncExitStack() as stack:
+            self._stack = stack
+            task = self.start()
+            try:
+                yield self
+            finally:
+                if not task.done():
+                    task.cancel()
+                    await asyncio.gather(task, return_exceptions=True)
+                self._stack = None
+
+    async def _resolve_async(self) -> VolumeGateway:
+        gateway = await self.resolve()
+        if self._stack is not None and hasattr(gateway, "session"):
+            await self._stack.enter_async_context(gateway.session())
+        self._gateway = gateway
+        LOG.info("target gateway: %s", self.base_url)
+        return gateway
+
+    async def fetch_json_async(self, path: str) -> dict[str, Any]:
+        return await (await self.wait_ready()).fetch_json_async(path)
+
+    async def systems_async(self) -> dict[str, Any]:
+        return await (await self.wait_ready()).systems_async()
+
+    async def get_volume_async(self) -> int:
+        return await (await self.wait_ready()).get_volume_async()
+
+    async def set_volume_async(self, volume: int) -> None:
+        await (await self.wait_ready()).set_volume_async(volume)
+
+    async def get_mute_state_async(self) -> bool:
+        return await (await self.wait_ready()).get_mute_state_async()
+
+    async def volume_up_async(self) -> None:
+        await (await self.wait_ready()).volume_up_async()
+
+    async def volume_down_async(self) -> None:
+        await (await self.wait_ready()).volume_down_async()
+
+    async def mute_toggle_async(self) -> None:
+        await (await self.wait_ready()).mute_toggle_async()
@@ -0,0 +1,94 @@
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from devialetctl.domain.events import InputEvent, InputEventType
+
+_COALESCIBLE_KEY_KINDS = {InputEventType.VOLUME_UP, InputEventType.VOLUME_DOWN}
+
+
+@dataclass
+class EventQueueStats:
+    enqueued: int = 0
+    coalesced: int = 0
+    dropped: int = 0
+    max_depth: int = 0
+
+
+@dataclass(frozen=True)
+class QueuedEvent:
+    event: InputEvent
+    deadline: float
+    # Opaque per-event trace handle, carried to the handler task (see tracing).
+    trace: Any = None
+    # Volume key presses merged into this entry while the queue was full.
+    repeats: int = 1
+
+
+@dataclass
+class CoalescingEventQueue:
+    """Bounded FIFO between CEC reception and handling.
+
+    Overflow policy:
+    - a pending SET_AUDIO_VOLUME_LEVEL is superseded by the latest one, which queues
+      behind the relative keys that arrived before it
+    - when full, a repeated volume key is merged into its latest pending entry, whose
+      ``repeats`` then carries every step (unless an absolute level queues behind it)
+    - when still full, the oldest pending event is dropped
+    """
+
+    maxsize: int = 32
+    stats: EventQueueStats = field(default_factory=EventQueueStats)
+    _items: deque[QueuedEvent] = field(default_factory=deque)
+    _ready: asyncio.Event = field(default_factory=asyncio.Event)
+    _closed: bool = False
+
+    @property
+    def depth(self) -> int:
+        return len(self._items)
+
+    def put(self, event: InputEvent, deadline: float, trace: Any = None) -> None:
+        item = QueuedEvent(event=event, deadline=deadline, trace=trace)
+        if event.kind == InputEventType.SET_AUDIO_VOLUME_LEVEL:
+            for pending in self._items:
+                if pending.event.kind == InputEventType.SET_AUDIO_VOLUME_LEVEL:
+                    # Absolute and relative changes must apply in arrival order.
+                    self._items.remove(pending)
+                    self._items.append(item)
+                    self.stats.coalesced += 1
+                    self._ready.set()
+                    return
+        if len(self._items) >= max(1, self.maxsize):
+            if event.kind in _COALESCIBLE_KEY_KINDS and self._merge_repeat(event.kind):
+                self.stats.coalesced += 1
+                return
+            self._items.popleft()
+            self.stats.dropped += 1
+        self._items.append(item)
+        self.stats.enqueued += 1
+        self.stats.max_depth = max(self.stats.max_depth, len(self._items))
+        self._ready.set()
+
+    def _merge_repeat(self, kind: InputEventType) -> bool:
+        for index in range(len(self._items) - 1, -1, -1):
+            pending = self._items[index]
+            if pending.event.kind == InputEventType.SET_AUDIO_VOLUME_LEVEL:
+                # A step merged before a later absolute level would be overwritten by it.
+                return False
+            if pending.event.kind == kind:
+                self._items[index] = replace(pending, repeats=pending.repeats + 1)
+                return True
+        return False
+
+    async def get(self) -> QueuedEvent | None:
+        while not self._items:
+            if self._closed:
+                return None
+            self._ready.clear()
+            await self._ready.wait()
+        return self._items.popleft()
+
+    def close(self) -> None:
+        self._closed = True
+        self._ready.set()
@@ -0,0 +1,137 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+from devialetctl.application.ports import VolumeGateway
+from devialetctl.infrastructure.adaptive_timeout import background_requests
+
+LOG = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FleetMember:
+    name: str
+    host: str
+    gateway: VolumeGateway
+
+
+@dataclass(frozen=True)
+class FleetStateChange:
+    name: str
+    volume: int | None
+    muted: bool | None
+    available: bool = True
+
+
+@dataclass
+class FleetStats:
+    polls: int = 0
+    failures: int = 0
+    changes: int = 0
+    skipped_busy: int = 0
+    max_lag_s: float = 0.0
+
+
+@dataclass
+class FleetPoller:
+    """Poll volume/mute of many systems from one loop, on a heap of staggered slots.
+
+    Members are spread evenly over ``interval_s`` (plus a little jitter), so request
+    load grows linearly with the fleet instead of arriving in bursts. A lagging loop
+    reschedules from "now" rather than catching up, and each host is capped at
+    ``per_host_limit`` concurrent polls. Only state changes are published.
+    """
+
+    members: list[FleetMember]
+    publish: Callable[[FleetStateChange], None]
+    interval_s: float = 5.0
+    jitter: float = 0.1
+    per_host_limit: int = 1
+    clock: Callable[[], float] = time.monotonic
+    rng: random.Random = field(default_factory=random.Random)
+    stats: FleetStats = field(default_factory=FleetStats)
+    _schedule: list[tuple[float, int, int]] = field(default_factory=list)
+    _seq: itertools.count = field(default_factory=itertools.count)
+    _host_limits: dict[str, asyncio.Semaphore] = field(default_factory=dict)
+    _in_flight: dict[int, asyncio.Task] = field(default_factory=dict)
+    _last: dict[int, FleetStateChange] = field(default_factory=dict)
+
+    @property
+    def slot_s(self) -> float:
+        return self.interval_s / max(1, len(self.members))
+
+    async def run(self, stop_event: asyncio.Event | None = None) -> None:
+        stop_event = stop_event or asyncio.Event()
+        self._seed_schedule()
+        try:
+            while self._schedule and not stop_event.is_set():
+                due, _seq, index = self._schedule[0]
+                delay_s = due - self.clock()
+                if delay_s > 0:
+                    try:
+                        await asyncio.wait_for(stop_event.wait(), delay_s)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                heapq.heappop(self._schedule)
+                self.stats.max_lag_s = max(self.stats.max_lag_s, -delay_s)
+                self._reschedule(index, due)
+                running = self._in_flight.get(index)
+                if running is not None and not running.done():
+                    # Still waiting on a slow host: skip this slot rather than pile up.
+                    self.stats.skipped_busy += 1
+                    continue
+                self._in_flight[index] = asyncio.create_task(self._poll_member(index))
+        finally:
+            tasks = list(self._in_flight.values())
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._in_flight.clear()
+
+    def _seed_schedule(self) -> None:
+        now = self.clock()
+        self._schedule = []
+        for index in range(len(self.members)):
+            offset = index * self.slot_s + self.rng.uniform(0.0, self.jitter * self.slot_s)
+            heapq.heappush(self._schedule, (now + offset, next(self._seq), index))
+
+    def _reschedule(self, index: int, due: float) -> None:
+        spread = self.jitter * self.slot_s
+        next_due = due + self.interval_s + self.rng.uniform(-spread, spread)
+        now = self.clock()
+        if next_due < now:
+            # Behind schedule: restart from now inside one slot instead of bursting.
+            next_due = now + self.rng.uniform(0.0, self.slot_s)
+        heapq.heappush(self._schedule, (next_due, next(self._seq), index))
+
+    def _host_limit(self, host: str) -> asyncio.Semaphore:
+        limit = self._host_limits.get(host)
+        if limit is None:
+            limit = asyncio.Semaphore(max(1, self.per_host_limit))
+            self._host_limits[host] = limit
+        return limit
+
+    async def _poll_member(self, index: int) -> None:
+        member = self.members[index]
+        async with self._host_limit(member.host):
+            try:
+                with background_requests():
+                    volume = max(0, min(100, int(await member.gateway.get_volume_async())))
+                    muted = bool(await member.gateway.get_mute_state_async())
+                state = FleetStateChange(name=member.name, volume=volume, muted=muted)
+            except Exception as exc:
+                self.stats.failures += 1
+                LOG.debug("fleet poll failed system=%s host=%s: %s", member.name, member.host, exc)
+                state = FleetStateChange(name=member.name, volume=None, muted=None, available=False)
+        self.stats.polls += 1
+        if self._last.get(index) == state:
+            return
+        self._last[index] = state
+        self.stats.changes += 1
+        self.publish(state)
@@ -0,0 +1,239 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable
+
+from devialetctl.infrastructure.circuit_breaker import CircuitState
+
+if TYPE_CHECKING:
+    from devialetctl.application.daemon import DaemonRunner
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+@dataclass
+class PrometheusExposition:
+    """Prometheus text format (0.0.4) builder; samples are grouped per metric family."""
+
+    _families: dict[str, tuple[str, str, list[str]]] = field(default_factory=dict)
+
+    def sample(
+        self,
+        name: str,
+        kind: str,
+        help_text: str,
+        value: float,
+        labels: dict[str, str] | None = None,
+        suffix: str = "",
+    ) -> None:
+        family = self._families.setdefault(name, (kind, help_text, []))
+        label_text = ""
+        if labels:
+            label_text = (
+                "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels.items()) + "}"
+            )
+        family[2].append(f"{name}{suffix}{label_text} {_format_value(value)}")
+
+    def counters(
+        self, name: str, help_text: str, values: dict[str, int], label: str, base: dict[str, str]
+    ) -> None:
+        for key, value in sorted(values.items()):
+            self.sample(name, "counter", help_text, value, {**base, label: key})
+
+    def histogram(self, name: str, help_text: str, histogram, labels: dict[str, str]) -> None:
+        for bound, count in histogram.cumulative():
+            le = "+Inf" if bound == float("inf") else _format_value(bound)
+            self.sample(name, "histogram", help_text, count, {**labels, "le": le}, "_bucket")
+        self.sample(name, "histogram", help_text, histogram.sum_s, labels, "_sum")
+        self.sample(name, "histogram", help_text, histogram.count, labels, "_count")
+
+    def render(self) -> str:
+        lines = []
+        for name, (kind, help_text, samples) in self._families.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+def _http_gateway(gateway):
+    # A deferred gateway exposes its stats only once the target is resolved.
+    return getattr(gateway, "resolved", gateway)
+
+
+def _render_runner(out: PrometheusExposition, runner: "DaemonRunner") -> None:
+    base = {"device": runner.cfg.cec_device}
+    cec = runner.cec_stats
+    out.counters(
+        "devialetctl_cec_rx_frames_total", "CEC frames received.", cec.rx_by_opcode, "opcode", base
+    )
+    out.counters(
+        "devialetctl_cec_tx_frames_total",
+        "CEC frames transmitted.",
+        cec.tx_by_opcode,
+        "opcode",
+        base,
+    )
+    out.counters(
+        "devialetctl_cec_tx_failures_total",
+        "CEC frames the kernel refused or failed to deliver (NACK, arbitration, retries).",
+        cec.tx_failures_by_opcode,
+        "opcode",
+        base,
+    )
+    tx = runner.tx_stats
+    out.counters(
+        "devialetctl_cec_tx_scheduler_total",
+        "CEC TX scheduler outcomes.",
+        {"coalesced": tx.coalesced, "deferred": tx.deferred, "dropped": tx.dropped},
+        "result",
+        base,
+    )
+    queue = runner.queue_stats
+    out.counters(
+        "devialetctl_cec_queue_events_total",
+        "CEC events through the handler queue.",
+        {"enqueued": queue.enqueued, "coalesced": queue.coalesced, "dropped": queue.dropped},
+        "result",
+        base,
+    )
+    out.sample(
+        "devialetctl_cec_queue_max_depth",
+        "gauge",
+        "Deepest CEC handler queue seen.",
+        queue.max_depth,
+        base,
+    )
+    deadline = runner.deadline_stats
+    out.counters(
+        "devialetctl_cec_reply_deadline_total",
+        "Audio-status replies affected by the CEC reply deadline.",
+        {
+            "miss": deadline.misses,
+            "fallback_reply": deadline.fallback_replies,
+            "feature_abort": deadline.feature_aborts,
+            "corrective_report": deadline.corrective_reports,
+        },
+        "outcome",
+        base,
+    )
+    activity = runner.activity_stats
+    out.sample(
+        "devialetctl_watcher_polls_total",
+        "counter",
+        "External audio-state polls.",
+        activity.watcher_polls,
+        base,
+    )
+    out.sample(
+        "devialetctl_watcher_poll_failures_total",
+        "counter",
+        "External audio-state polls that failed.",
+        activity.watcher_failures,
+        base,
+    )
+    out.counters(
+        "devialetctl_watcher_skips_total",
+        "External audio-state polls skipped.",
+        activity.watcher_skips,
+        "reason",
+        base,
+    )
+    out.sample(
+        "devialetctl_policy_drops_total",
+        "counter",
+        "Key events dropped by the dedupe/rate policy.",
+        activity.policy_drops,
+        base,
+    )
+    out.counters(
+        "devialetctl_audio_status_requests_total",
+        "GIVE_AUDIO_STATUS requests by how they were answered.",
+        {"cache": activity.audio_status_cache_hits, "speaker": activity.audio_status_cache_misses},
+        "source",
+        base,
+    )
+    answered = activity.audio_status_cache_hits + activity.audio_status_cache_misses
+    out.sample(
+        "devialetctl_audio_status_cache_hit_ratio",
+        "gauge",
+        "Share of GIVE_AUDIO_STATUS requests answered from cache.",
+        activity.audio_status_cache_hits / answered if answered else 0.0,
+        base,
+    )
+    out.counters(
+        "devialetctl_component_restarts_total",
+        "Daemon component restarts (CEC reconnects, watcher restarts).",
+        runner.restart_counts,
+        "component",
+        base,
+    )
+    for stage, histogram in sorted(runner.trace_stats.stages.items()):
+        out.histogram(
+            "devialetctl_event_stage_seconds",
+            "Per-event latency by stage, from CEC RX to the TX of the reply.",
+            histogram,
+            {**base, "stage": stage},
+        )
+
+
+def _render_gateway(out: PrometheusExposition, gateway) -> None:
+    target = {"target": gateway.breaker.name}
+    for (method, path), histogram in sorted(gateway.request_latency.items()):
+        out.histogram(
+            "devialetctl_http_request_duration_seconds",
+            "Speaker HTTP request latency.",
+            histogram,
+            {**target, "method": method, "endpoint": path},
+        )
+    for (method, path), errors in sorted(gateway.request_errors.items()):
+        out.sample(
+            "devialetctl_http_request_errors_total",
+            "counter",
+            "Speaker HTTP requests that failed at the transport level.",
+            errors,
+            {**target, "method": method, "endpoint": path},
+        )
+    breaker = gateway.breaker
+    out.sample(
+        "devialetctl_circuit_open",
+        "gauge",
+        "1 while the speaker's circuit breaker is not closed.",
+        0 if breaker.state == CircuitState.CLOSED else 1,
+        target,
+    )
+    out.sample(
+        "devialetctl_circuit_trips_total",
+        "counter",
+        "Circuit breaker trips.",
+        breaker.trips,
+        target,
+    )
+    out.sample(
+        "devialetctl_circuit_rejected_total",
+        "counter",
+        "Requests failed fast by an open circuit.",
+        breaker.rejected,
+        target,
+    )
+
+
+def render_daemon_metrics(runners: Iterable["DaemonRunner"]) -> str:
+    out = PrometheusExposition()
+    gateways = {}
+    for runner in runners:
+        _render_runner(out, runner)
+        gateway = _http_gateway(runner.gateway)
+        if hasattr(gateway, "request_latency"):
+            gateways[id(gateway)] = gateway
+    for gateway in gateways.values():
+        _render_gateway(out, gateway)
+    return out.render()
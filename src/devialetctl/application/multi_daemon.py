@@ -0,0 +1,75 @@
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass
+from typing import AsyncContextManager, Callable
+
+from devialetctl.application.daemon import DaemonRunner
+from devialetctl.application.metrics import render_daemon_metrics
+from devialetctl.infrastructure.flight_recorder import dump_on_signal
+from devialetctl.infrastructure.metrics_server import MetricsServer
+
+LOG = logging.getLogger(__name__)
+
+
+@dataclass
+class MultiDaemonRunner:
+    """Run several CEC bindings on one event loop.
+
+    Each binding keeps its own ``DaemonRunner`` (adapter, cache, policy, watcher);
+    ``shared_session`` holds resources all of them use, such as one HTTP pool; one
+    metrics endpoint (``metrics_port``) covers every binding, labelled by CEC device.
+    """
+
+    runners: list[DaemonRunner]
+    shared_session: Callable[[], AsyncContextManager] | None = None
+    metrics_host: str = "127.0.0.1"
+    metrics_port: int | None = None
+
+    def run_forever(self) -> None:
+        asyncio.run(self._run_async())
+
+    def dump_flight_recorders(self) -> list[str]:
+        return [path for runner in self.runners if (path := runner.dump_flight_recorder())]
+
+    def _flight_recorder_dumps(self) -> str:
+        return "".join(
+            runner.flight_recorder.dumps(device=runner.cfg.cec_device)
+            for runner in self.runners
+            if runner.flight_recorder is not None
+        )
+
+    async def _run_async(self) -> None:
+        for runner in self.runners:
+            # One endpoint and one dump signal below cover every binding.
+            runner.serve_metrics = False
+            runner.handle_dump_signal = False
+        async with contextlib.AsyncExitStack() as stack:
+            if self.shared_session is not None:
+                await stack.enter_async_context(self.shared_session())
+            stack.enter_context(dump_on_signal(self.dump_flight_recorders))
+            if self.metrics_port is not None:
+                server = MetricsServer(
+                    render=lambda: render_daemon_metrics(self.runners),
+                    host=self.metrics_host,
+                    port=self.metrics_port,
+                    routes={"/debug/flight-recorder": self._flight_recorder_dumps},
+                )
+                await stack.enter_async_context(server.serve())
+            tasks = [
+                asyncio.create_task(runner._supervise_cec_async(), name=runner.cfg.cec_device)
+                for runner in self.runners
+            ]
+            LOG.info(
+                "multi-binding daemon started: %s",
+                ", ".join(runner.cfg.cec_device for runner in self.runners),
+            )
+            try:
+                # A binding only ends on a fatal error; take the whole daemon down with it.
+                done, _pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task.result()
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,181 @@
+import asyncio
+import dataclasses
+import difflib
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from devialetctl.application.daemon import DaemonRunner
+from devialetctl.infrastructure.cec_replay import CecReplayAdapter, ReplayFrame
+from devialetctl.infrastructure.config import DaemonConfig
+from devialetctl.infrastructure.virtual_time import VirtualTimeEventLoop
+
+
+@dataclass
+class InMemorySpeaker:
+    """Speaker double for replays: volume/mute kept in memory, optional latency per call."""
+
+    volume: int = 30
+    muted: bool = False
+    latency_s: float = 0.0
+    calls: list[str] = field(default_factory=list)
+
+    async def _call(self, name: str) -> None:
+        self.calls.append(name)
+        if self.latency_s > 0:
+            await asyncio.sleep(self.latency_s)
+
+    async def systems_async(self) -> dict[str, Any]:
+        await self._call("systems")
+        return {"systems": [{"systemId": "replay", "name": "Replay"}]}
+
+    async def get_volume_async(self) -> int:
+        await self._call("get_volume")
+        return self.volume
+
+    async def set_volume_async(self, volume: int) -> None:
+        await self._call("set_volume")
+        self.volume = max(0, min(100, int(volume)))
+
+    async def get_mute_state_async(self) -> bool:
+        await self._call("get_mute_state")
+        return self.muted
+
+    async def volume_up_async(self) -> None:
+        await self._call("volume_up")
+        self.volume = min(100, self.volume + 1)
+
+    async def volume_down_async(self) -> None:
+        await self._call("volume_down")
+        self.volume = max(0, self.volume - 1)
+
+    async def mute_toggle_async(self) -> None:
+        await self._call("mute_toggle")
+        self.muted = not self.muted
+
+
+@dataclass
+class ReplayReport:
+    inbound: int
+    expected: list[str]
+    sent: list[str]
+    missing: list[str]
+    unexpected: list[str]
+    duration_s: float
+    reply_latencies_s: list[float]
+    speaker_calls: int
+
+    @property
+    def ok(self) -> bool:
+        return not self.missing and not self.unexpected
+
+    def to_dict(self) -> dict[str, Any]:
+        data = dataclasses.asdict(self)
+        data["ok"] = self.ok
+        return data
+
+
+def compare_replies(expected: list[str], sent: list[str]) -> tuple[list[str], list[str]]:
+    """Recorded replies missing from the replay, and replay replies never recorded (in order)."""
+    missing: list[str] = []
+    unexpected: list[str] = []
+    matcher = difflib.SequenceMatcher(a=expected, b=sent, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag in {"replace", "delete"}:
+            missing.extend(expected[i1:i2])
+        if tag in {"replace", "insert"}:
+            unexpected.extend(sent[j1:j2])
+    return missing, unexpected
+
+
+def _reply_latencies(adapter: CecReplayAdapter) -> list[float]:
+    # Each reply against the latest inbound frame delivered before it (replay time).
+    arrivals = [frame.offset_s / adapter.speed for frame in adapter.frames]
+    latencies = []
+    index = 0
+    for reply in adapter.sent:
+        while index < len(arrivals) and arrivals[index] <= reply.offset_s:
+            index += 1
+        if index:
+            latencies.append(reply.offset_s - arrivals[index - 1])
+    return latencies
+
+
+def offline_config(cfg: DaemonConfig, **overrides: Any) -> DaemonConfig:
+    """``cfg`` without side effects: no state, metrics, trace, capture or flight recorder."""
+    options: dict[str, Any] = {
+        "state_file": None,
+        "bindings": (),
+        "metrics_port": None,
+        "trace_file": None,
+        "capture_file": None,
+        "flight_recorder_size": 0,
+    }
+    options.update(overrides)
+    return dataclasses.replace(cfg, **options)
+
+
+def run_replay(
+    cfg: DaemonConfig,
+    frames: list[ReplayFrame],
+    gateway: Any,
+    speed: float = 1.0,
+    settle_s: float = 0.5,
+    virtual_time: bool = False,
+) -> tuple[DaemonRunner, CecReplayAdapter]:
+    """Run a ``DaemonRunner`` on ``frames`` until they are played out; returns both ends.
+
+    With ``virtual_time`` the session runs on a ``VirtualTimeEventLoop``: recorded pacing,
+    policy windows and watcher intervals are kept exactly but cost no wall time. The
+    gateway must then be in-memory (such as ``InMemorySpeaker``), not real HTTP.
+    An adapter error ends the replay and is raised instead of reconnecting.
+    """
+    loop = VirtualTimeEventLoop() if virtual_time else None
+    runner = DaemonRunner(
+        cfg=cfg,
+        gateway=gateway,
+        clock=loop.time if loop else time.monotonic,
+        rng=random.Random(0),
+    )
+    adapter = CecReplayAdapter(frames, speed=speed, settle_s=settle_s, on_finished=runner.stop)
+    runner.adapter_factory = adapter.bind
+    runner.restart_cec_reader = False
+    if loop is None:
+        runner.run_cec_forever()
+    else:
+        loop.run(runner.run_cec_async())
+    return runner, adapter
+
+
+def replay_session(
+    cfg: DaemonConfig,
+    frames: list[ReplayFrame],
+    expected: list[ReplayFrame] | None = None,
+    gateway: Any = None,
+    speed: float = 1.0,
+    settle_s: float = 0.5,
+    virtual_time: bool = False,
+) -> ReplayReport:
+    """Run a ``DaemonRunner`` on recorded CEC traffic and diff its replies against the recording.
+
+    No CEC device or speaker is needed: frames come from a ``CecReplayAdapter`` and the
+    gateway defaults to an ``InMemorySpeaker``. State, metrics and capture files are off.
+    """
+    speaker = gateway if gateway is not None else InMemorySpeaker()
+    _runner, adapter = run_replay(
+        offline_config(cfg), frames, speaker, speed, settle_s, virtual_time=virtual_time
+    )
+    sent = [reply.frame for reply in adapter.sent]
+    wanted = [reply.frame for reply in expected or []]
+    missing, unexpected = compare_replies(wanted, sent) if expected is not None else ([], [])
+    return ReplayReport(
+        inbound=len(frames),
+        expected=wanted,
+        sent=sent,
+        missing=missing,
+        unexpected=unexpected,
+        duration_s=(adapter.finished_s or 0.0) - (adapter.started_s or 0.0),
+        reply_latencies_s=_reply_latencies(adapter),
+        speaker_calls=len(getattr(speaker, "calls", [])),
+    )
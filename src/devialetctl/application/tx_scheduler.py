@@ -0,0 +1,151 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
+from typing import Callable
+
+LOG = logging.getLogger(__name__)
+
+
+class TxPriority(IntEnum):
+    REPLY = 0
+    REPORT = 1
+
+
+class TxOutcome(Enum):
+    """What ``submit`` did with a frame; truthy when the frame was accepted.
+
+    ``QUEUED`` frames wait for bus budget and may still fail or be dropped later;
+    only ``SENT`` means the adapter took the frame.
+    """
+
+    SENT = "sent"
+    QUEUED = "queued"
+    FAILED = "failed"
+
+    def __bool__(self) -> bool:
+        return self is not TxOutcome.FAILED
+
+
+@dataclass
+class TxSchedulerStats:
+    sent: int = 0
+    failed: int = 0
+    coalesced: int = 0
+    deferred: int = 0
+    dropped: int = 0
+
+
+@dataclass
+class CecTxScheduler:
+    """Token-bucket CEC transmit scheduler.
+
+    Frames go out immediately while the bus budget allows; otherwise they wait in
+    priority order (protocol replies before unsolicited reports). A frame submitted
+    with a ``coalesce_key`` replaces a still-pending frame with the same key.
+    """
+
+    send: Callable[[str], bool]
+    frames_per_s: float = 20.0
+    burst: int = 6
+    clock: Callable[[], float] = time.monotonic
+    stats: TxSchedulerStats = field(default_factory=TxSchedulerStats)
+    _pending: list[list] = field(default_factory=list)
+    _by_key: dict[str, list] = field(default_factory=dict)
+    _seq: itertools.count = field(default_factory=itertools.count)
+    _tokens: float | None = None
+    _refilled_at: float = 0.0
+    _wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def depth(self) -> int:
+        return len(self._pending)
+
+    def submit(
+        self,
+        frame: str,
+        priority: TxPriority = TxPriority.REPLY,
+        coalesce_key: str | None = None,
+    ) -> TxOutcome:
+        if coalesce_key is not None:
+            pending = self._by_key.get(coalesce_key)
+            if pending is not None:
+                pending[2] = frame
+                if int(priority) < pending[0]:
+                    pending[0] = int(priority)
+                    heapq.heapify(self._pending)
+                self.stats.coalesced += 1
+                return TxOutcome.QUEUED
+        seq = next(self._seq)
+        entry = [int(priority), seq, frame, coalesce_key]
+        heapq.heappush(self._pending, entry)
+        if coalesce_key is not None:
+            self._by_key[coalesce_key] = entry
+        results = self._pump()
+        if seq in results:
+            return TxOutcome.SENT if results[seq] else TxOutcome.FAILED
+        self.stats.deferred += 1
+        return TxOutcome.QUEUED
+
+    def drop_pending(self) -> int:
+        """Forget queued frames (their adapter is gone); returns how many were dropped."""
+        dropped = len(self._pending)
+        self._pending.clear()
+        self._by_key.clear()
+        self.stats.dropped += dropped
+        return dropped
+
+    async def run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self._pending:
+                await asyncio.sleep(self._seconds_until_token())
+                self._pump()
+
+    def _pump(self) -> dict[int, bool]:
+        self._refill()
+        results: dict[int, bool] = {}
+        while self._pending and self._tokens >= 1.0:
+            self._tokens -= 1.0
+            seq, ok = self._send_next()
+            results[seq] = ok
+        if self._pending:
+            self._wakeup.set()
+        return results
+
+    def _send_next(self) -> tuple[int, bool]:
+        _priority, seq, frame, key = heapq.heappop(self._pending)
+        if key is not None:
+            self._by_key.pop(key, None)
+        # A failing send must not kill the pump and strand the frames behind it.
+        try:
+            ok = bool(self.send(frame))
+        except Exception as exc:
+            LOG.warning("CEC transmit of %s failed: %s", frame, exc)
+            ok = False
+        if ok:
+            self.stats.sent += 1
+        else:
+            self.stats.failed += 1
+        return seq, ok
+
+    def _refill(self) -> None:
+        now = self.clock()
+        capacity = float(max(1, self.burst))
+        if self._tokens is None:
+            self._tokens = capacity
+        else:
+            elapsed = max(0.0, now - self._refilled_at)
+            self._tokens = min(capacity, self._tokens + elapsed * self.frames_per_s)
+        self._refilled_at = now
+
+    def _seconds_until_token(self) -> float:
+        self._refill()
+        missing = 1.0 - (self._tokens or 0.0)
+        if missing <= 0:
+            return 0.0
+        return missing / max(self.frames_per_s, 1e-6)
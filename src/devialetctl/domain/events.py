@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -19,6 +19,10 @@ class InputEventType(str, Enum):
     SET_AUDIO_VOLUME_LEVEL = "set_audio_volume_level"
     SAMSUNG_VENDOR_COMMAND = "samsung_vendor_command"
     SAMSUNG_VENDOR_COMMAND_WITH_ID = "samsung_vendor_command_with_id"
+    # Kernel CEC adapter events (value: physical address / HPD level / lost message count).
+    CEC_STATE_CHANGE = "cec_state_change"
+    CEC_HOTPLUG = "cec_hotplug"
+    CEC_MESSAGES_LOST = "cec_messages_lost"
 
 
 @dataclass(frozen=True)
@@ -31,3 +35,5 @@ class InputEvent:
     vendor_subcommand: int | None = None
     vendor_mode: int | None = None
     vendor_payload: tuple[int, ...] | None = None
+    # Kernel receive timestamp (CLOCK_MONOTONIC ns); metadata, not part of event identity.
+    rx_ts_ns: int | None = field(default=None, compare=False)
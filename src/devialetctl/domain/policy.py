@@ -1,5 +1,6 @@
 import time
 from dataclasses import dataclass, field
+from typing import Callable
 
 from devialetctl.domain.events import InputEvent
 
@@ -8,11 +9,13 @@ from devialetctl.domain.events import InputEvent
 class EventPolicy:
     dedupe_window_s: float = 0.08
     min_interval_s: float = 0.12
+    clock: Callable[[], float] = time.monotonic
     _last_seen_by_key: dict[str, float] = field(default_factory=dict)
-    _last_emit_ts: float = 0.0
+    # No emit yet: the first event passes whatever the clock origin (virtual clocks start at 0).
+    _last_emit_ts: float = float("-inf")
 
     def should_emit(self, event: InputEvent, now: float | None = None) -> bool:
-        ts = now if now is not None else time.monotonic()
+        ts = now if now is not None else self.clock()
         fingerprint = f"{event.source}:{event.key}:{event.kind.value}"
         last_seen = self._last_seen_by_key.get(fingerprint)
         if last_seen is not None and (ts - last_seen) < self.dedupe_window_s:
@@ -0,0 +1,82 @@
+import contextlib
+import contextvars
+from dataclasses import dataclass
+from typing import Iterator
+
+
+@dataclass
+class RttEstimator:
+    """Smoothed response time and its variance, computed as TCP computes RTO (RFC 6298)."""
+
+    alpha: float = 0.125
+    beta: float = 0.25
+    srtt_s: float | None = None
+    rttvar_s: float = 0.0
+    samples: int = 0
+
+    def observe(self, rtt_s: float) -> None:
+        rtt_s = max(0.0, float(rtt_s))
+        if self.srtt_s is None:
+            self.srtt_s = rtt_s
+            self.rttvar_s = rtt_s / 2.0
+        else:
+            self.rttvar_s = (1.0 - self.beta) * self.rttvar_s + self.beta * abs(self.srtt_s - rtt_s)
+            self.srtt_s = (1.0 - self.alpha) * self.srtt_s + self.alpha * rtt_s
+        self.samples += 1
+
+    def timeout_s(self, k: float, floor_s: float, ceiling_s: float) -> float:
+        """``srtt + k * rttvar`` clamped to the budget; the ceiling until a sample exists."""
+        if self.srtt_s is None:
+            return ceiling_s
+        return min(ceiling_s, max(floor_s, self.srtt_s + k * self.rttvar_s))
+
+
+@dataclass(frozen=True)
+class TimeoutBudget:
+    """How far above the estimate a request may wait, and its bounds.
+
+    ``ceiling_scale`` applies to the gateway's configured ``timeout_s``, which stays
+    the upper bound for every request. ``timeouts_trip_breaker`` is False for budgets
+    tighter than the foreground one: giving up early on a slow but healthy speaker
+    says nothing about its reachability.
+    """
+
+    name: str
+    k: float
+    connect_floor_s: float
+    read_floor_s: float
+    ceiling_scale: float = 1.0
+    timeouts_trip_breaker: bool = True
+
+
+USER_BUDGET = TimeoutBudget("user", k=4.0, connect_floor_s=0.3, read_floor_s=0.5)
+BACKGROUND_BUDGET = TimeoutBudget(
+    "background",
+    k=2.0,
+    connect_floor_s=0.15,
+    read_floor_s=0.25,
+    ceiling_scale=0.5,
+    timeouts_trip_breaker=False,
+)
+
+_BUDGET: contextvars.ContextVar[TimeoutBudget] = contextvars.ContextVar(
+    "devialetctl_timeout_budget", default=USER_BUDGET
+)
+
+
+def current_budget() -> TimeoutBudget:
+    return _BUDGET.get()
+
+
+@contextlib.contextmanager
+def background_requests() -> Iterator[None]:
+    """Run gateway requests made inside the block on the tighter background budget.
+
+    Used by polls nobody is waiting on (watcher, reconcile, fleet): a slow answer there
+    is better given up and retried on the next poll than allowed to hold the I/O lock.
+    """
+    token = _BUDGET.set(BACKGROUND_BUDGET)
+    try:
+        yield
+    finally:
+        _BUDGET.reset(token)
@@ -0,0 +1,197 @@
+import logging
+import mmap
+import os
+import struct
+import time
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator
+
+from devialetctl.infrastructure.flight_recorder import (
+    PAYLOAD_SIZE,
+    RECORD,
+    FlightRecord,
+    FrameRecorder,
+    RecordKind,
+    pack_record,
+)
+
+LOG = logging.getLogger(__name__)
+
+CAPTURE_MAGIC = b"DVCTLCAP"
+CAPTURE_VERSION = 1
+# magic, version, record size
+HEADER = struct.Struct("<8sHH4x")
+
+
+class CaptureWriter(FrameRecorder):
+    """Append-only binary capture of CEC frames and speaker requests.
+
+    The file is a 16-byte header followed by fixed 48-byte ``RECORD`` entries, the same
+    layout as the in-memory flight recorder. Each open appends a ``SESSION`` record
+    anchoring the monotonic timestamps to wall-clock time; endpoint names are written
+    once per session as ``ENDPOINT`` records (16-byte chunks) and referenced by id.
+    """
+
+    def __init__(
+        self, path: str, flush_interval_s: float = 1.0, clock: Callable[[], float] | None = None
+    ) -> None:
+        super().__init__(clock)
+        self.path = path
+        self.flush_interval_s = flush_interval_s
+        self.written = 0
+        self._file: BinaryIO | None = None
+        self._record = bytearray(RECORD.size)
+        self._last_flush_s = 0.0
+        self._failed = False
+
+    def _declare_endpoint(self, endpoint_id: int, endpoint: str) -> None:
+        super()._declare_endpoint(endpoint_id, endpoint)
+        if self._file is not None:
+            self._write_endpoint(endpoint_id, endpoint)
+
+    def _append(
+        self,
+        ts_s: float,
+        kind: RecordKind,
+        payload: bytes = b"",
+        kernel_ts_ns: int = 0,
+        status: int = 0,
+        latency_s: float = 0.0,
+        endpoint_id: int = 0,
+    ) -> None:
+        if self._failed:
+            return
+        try:
+            if self._file is None:
+                self._open(ts_s)
+            self._write(ts_s, kind, payload, kernel_ts_ns, status, latency_s, endpoint_id)
+            if ts_s - self._last_flush_s >= self.flush_interval_s:
+                self._file.flush()
+                self._last_flush_s = ts_s
+        except (OSError, ValueError) as exc:
+            LOG.warning("cannot write capture to %s: %s", self.path, exc)
+            self._failed = True
+            self.close()
+
+    def _open(self, ts_s: float) -> None:
+        target = Path(self.path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        size = target.stat().st_size if target.exists() else 0
+        if size > 0:
+            with open(target, "rb") as existing:
+                _check_header(existing.read(HEADER.size))
+            torn = (size - HEADER.size) % RECORD.size
+            if torn:
+                # Drop a record torn by a crash so new records stay aligned.
+                LOG.warning("dropping %d-byte torn record at the end of %s", torn, self.path)
+                os.truncate(target, size - torn)
+        file = open(target, "ab")
+        if file.tell() == 0:
+            file.write(HEADER.pack(CAPTURE_MAGIC, CAPTURE_VERSION, RECORD.size))
+        self._file = file
+        self._write(ts_s, RecordKind.SESSION, kernel_ts_ns=time.time_ns())
+        for endpoint_id, endpoint in self.endpoints.items():
+            self._write_endpoint(endpoint_id, endpoint)
+
+    def _write_endpoint(self, endpoint_id: int, endpoint: str) -> None:
+        data = endpoint.encode("utf-8")
+        for index, start in enumerate(range(0, max(len(data), 1), PAYLOAD_SIZE)):
+            chunk = data[start : start + PAYLOAD_SIZE]
+            self._write(0.0, RecordKind.ENDPOINT, chunk, 0, index, 0.0, endpoint_id)
+
+    def _write(
+        self,
+        ts_s: float,
+        kind: RecordKind,
+        payload: bytes = b"",
+        kernel_ts_ns: int = 0,
+        status: int = 0,
+        latency_s: float = 0.0,
+        endpoint_id: int = 0,
+    ) -> None:
+        pack_record(
+            self._record, 0, ts_s, kind, payload, kernel_ts_ns, status, latency_s, endpoint_id
+        )
+        self._file.write(self._record)
+        self.written += 1
+
+    def close(self) -> None:
+        file, self._file = self._file, None
+        if file is not None:
+            file.close()
+
+
+def _check_header(header: bytes) -> None:
+    if len(header) < HEADER.size:
+        raise ValueError("truncated capture header")
+    magic, version, record_size = HEADER.unpack_from(header)
+    if magic != CAPTURE_MAGIC:
+        raise ValueError("not a devialetctl capture file")
+    if version != CAPTURE_VERSION or record_size != RECORD.size:
+        raise ValueError(f"unsupported capture version {version} (record size {record_size})")
+
+
+CaptureRow = tuple[float, float | None, int, int, int, float, bytes, str, int]
+
+
+def read_capture_rows(path: str) -> Iterator[CaptureRow]:
+    """Yield ``(ts_s, wall_s, kind, kernel_ts_ns, status, latency_s, payload, endpoint,
+    session)``.
+
+    ``session`` counts the daemon runs appended to the file (0 for the first): ``ts_s``
+    is monotonic time, only comparable between records of the same session. The file is
+    memory-mapped, so multi-GB captures are scanned without being read into RAM; a torn
+    record at the end (daemon killed mid-write) is ignored.
+    """
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            _check_header(view[: HEADER.size])
+            end = HEADER.size + (size - HEADER.size) // RECORD.size * RECORD.size
+            wall_offset_s: float | None = None
+            session = -1
+            chunks: dict[int, bytes] = {}
+            names: dict[int, str] = {}
+            for offset in range(HEADER.size, end, RECORD.size):
+                ts_s, kernel_ts_ns, latency_s, status, endpoint_id, kind, length, payload = (
+                    RECORD.unpack_from(view, offset)
+                )
+                if kind == RecordKind.SESSION:
+                    wall_offset_s = kernel_ts_ns / 1e9 - ts_s
+                    session += 1
+                    chunks, names = {}, {}
+                    continue
+                if kind == RecordKind.ENDPOINT:
+                    previous = chunks.get(endpoint_id, b"") if status else b""
+                    chunks[endpoint_id] = previous + payload[:length]
+                    names[endpoint_id] = chunks[endpoint_id].decode("utf-8", "replace")
+                    continue
+                yield (
+                    ts_s,
+                    None if wall_offset_s is None else ts_s + wall_offset_s,
+                    kind,
+                    kernel_ts_ns,
+                    status,
+                    latency_s,
+                    payload[:length],
+                    names.get(endpoint_id, "") if kind == RecordKind.HTTP else "",
+                    max(session, 0),
+                )
+
+
+def read_capture(path: str) -> Iterator[FlightRecord]:
+    """Yield the records of a capture file lazily, oldest first."""
+    for row in read_capture_rows(path):
+        ts_s, wall_s, kind, kernel_ts_ns, status, latency_s, payload, endpoint, _session = row
+        yield FlightRecord(
+            ts_s=ts_s,
+            kind=RecordKind(kind),
+            kernel_ts_ns=kernel_ts_ns,
+            status=status,
+            latency_s=latency_s,
+            payload=payload,
+            endpoint=endpoint,
+            wall_s=wall_s,
+        )
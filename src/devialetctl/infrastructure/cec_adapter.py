@@ -1,14 +1,17 @@
 import asyncio
 import ctypes
+import dataclasses
 import errno
 import fcntl
 import logging
 import os
+import select
 import time
-from dataclasses import dataclass
-from typing import AsyncIterator
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable
 
 from devialetctl.domain.events import InputEvent, InputEventType
+from devialetctl.infrastructure.flight_recorder import FrameRecorder
 
 LOG = logging.getLogger(__name__)
 
@@ -23,6 +26,25 @@ CEC_OP_ALL_DEVTYPE_AUDIOSYSTEM = 0x08
 CEC_MODE_INITIATOR = 0x1
 CEC_MODE_FOLLOWER = 0x10
 CEC_LOG_ADDR_MASK_AUDIOSYSTEM = 1 << 5
+CEC_PHYS_ADDR_INVALID = 0xFFFF
+
+CEC_EVENT_STATE_CHANGE = 1
+CEC_EVENT_LOST_MSGS = 2
+CEC_EVENT_PIN_HPD_LOW = 5
+CEC_EVENT_PIN_HPD_HIGH = 6
+CEC_EVENT_FL_INITIAL_STATE = 1 << 0
+CEC_TX_STATUS_OK = 1 << 0
+CEC_TX_STATUS_ARB_LOST = 1 << 1
+CEC_TX_STATUS_NACK = 1 << 2
+CEC_TX_STATUS_LOW_DRIVE = 1 << 3
+CEC_TX_STATUS_ERROR = 1 << 4
+CEC_TX_STATUS_MAX_RETRIES = 1 << 5
+# Any of these in a TX status means the kernel had to retransmit the frame.
+CEC_TX_STATUS_RETRY_MASK = (
+    CEC_TX_STATUS_ARB_LOST | CEC_TX_STATUS_NACK | CEC_TX_STATUS_LOW_DRIVE | CEC_TX_STATUS_ERROR
+)
+# Frames awaiting their kernel TX status report; bounded in case reports get lost.
+_MAX_TX_IN_FLIGHT = 64
 _LOGICAL_ADDRESS_NAMES: dict[int, str] = {
     0x0: "TV",
     0x1: "Recorder 1",
@@ -137,6 +159,35 @@ class CecLogAddrs(ctypes.Structure):
     ]
 
 
+class CecEventStateChange(ctypes.Structure):
+    _fields_ = [
+        ("phys_addr", ctypes.c_uint16),
+        ("log_addr_mask", ctypes.c_uint16),
+        ("have_conn_info", ctypes.c_uint16),
+    ]
+
+
+class CecEventLostMsgs(ctypes.Structure):
+    _fields_ = [("lost_msgs", ctypes.c_uint32)]
+
+
+class _CecEventPayload(ctypes.Union):
+    _fields_ = [
+        ("state_change", CecEventStateChange),
+        ("lost_msgs", CecEventLostMsgs),
+        ("raw", ctypes.c_uint32 * 16),
+    ]
+
+
+class CecEvent(ctypes.Structure):
+    _fields_ = [
+        ("ts", ctypes.c_uint64),
+        ("event", ctypes.c_uint32),
+        ("flags", ctypes.c_uint32),
+        ("payload", _CecEventPayload),
+    ]
+
+
 def _IOC(direction: int, ioc_type: str, nr: int, size: int) -> int:
     return ((direction & 0x3) << 30) | ((size & 0x3FFF) << 16) | (ord(ioc_type) << 8) | nr
 
@@ -161,6 +212,7 @@ CEC_ADAP_S_LOG_ADDRS = _IOWR("a", 4, CecLogAddrs)
 CEC_ADAP_G_LOG_ADDRS = _IOR("a", 3, CecLogAddrs)
 CEC_TRANSMIT = _IOWR("a", 5, CecMsg)
 CEC_RECEIVE = _IOWR("a", 6, CecMsg)
+CEC_DQEVENT = _IOWR("a", 7, CecEvent)
 CEC_S_MODE = _IOW("a", 9, U32)
 
 
@@ -246,8 +298,8 @@ def format_cec_frame_human(frame: str) -> str:
     initiator = (header >> 4) & 0x0F
     destination = header & 0x0F
     opcode = parts[1]
-    initiator_name = _LOGICAL_ADDRESS_NAMES.get(initiator, f"LA{initiator:X}")
-    destination_name = _LOGICAL_ADDRESS_NAMES.get(destination, f"LA{destination:X}")
+    initiator_name = cec_logical_address_name(initiator)
+    destination_name = cec_logical_address_name(destination)
     if opcode == "89":
         opcode_name = "SAMSUNG_VENDOR_COMMAND"
         if len(parts) > 2:
@@ -256,11 +308,7 @@ def format_cec_frame_human(frame: str) -> str:
             except ValueError:
                 subcommand = None
             if subcommand is not None:
-                sub_name = _SAMSUNG_VENDOR_SUBCOMMAND_NAMES.get(
-                    subcommand,
-                    f"VENDOR_SUBCOMMAND_0x{subcommand:02X}",
-                )
-                opcode_name = f"{opcode_name} ({sub_name})"
+                opcode_name = f"{opcode_name} ({samsung_vendor_subcommand_name(subcommand)})"
     else:
         opcode_name = _CEC_OPCODE_NAMES.get(opcode, f"OPCODE_0x{opcode}")
     payload = ""
@@ -269,6 +317,63 @@ def format_cec_frame_human(frame: str) -> str:
     return f"{initiator_name} -> {destination_name} : {opcode_name}{payload}"
 
 
+def cec_opcode_label(frame: str) -> str:
+    """Opcode name of a frame for counters; ``POLL`` for header-only frames."""
+    parts = _parse_frame_parts(frame)
+    if len(parts) < 2:
+        return "POLL"
+    try:
+        return cec_opcode_name(int(parts[1], 16))
+    except ValueError:
+        return f"OPCODE_0x{parts[1]}"
+
+
+def cec_opcode_name(opcode: int) -> str:
+    if opcode == 0x89:
+        return "SAMSUNG_VENDOR_COMMAND"
+    return _CEC_OPCODE_NAMES.get(f"{opcode:02X}", f"OPCODE_0x{opcode:02X}")
+
+
+def cec_logical_address_name(address: int) -> str:
+    return _LOGICAL_ADDRESS_NAMES.get(address, f"LA{address:X}")
+
+
+def samsung_vendor_subcommand_name(subcommand: int) -> str:
+    return _SAMSUNG_VENDOR_SUBCOMMAND_NAMES.get(subcommand, f"VENDOR_SUBCOMMAND_0x{subcommand:02X}")
+
+
+@dataclass
+class CecTrafficStats:
+    rx_by_opcode: dict[str, int] = field(default_factory=dict)
+    tx_by_opcode: dict[str, int] = field(default_factory=dict)
+    tx_failures_by_opcode: dict[str, int] = field(default_factory=dict)
+
+    @staticmethod
+    def _count(counters: dict[str, int], frame: str) -> None:
+        label = cec_opcode_label(frame)
+        counters[label] = counters.get(label, 0) + 1
+
+    def record_rx(self, frame: str) -> None:
+        self._count(self.rx_by_opcode, frame)
+
+    def record_tx(self, frame: str, ok: bool) -> None:
+        self._count(self.tx_by_opcode if ok else self.tx_failures_by_opcode, frame)
+
+
+@dataclass(frozen=True)
+class CecTxResult:
+    """Kernel report of a finished non-blocking transmit."""
+
+    sequence: int
+    frame: str
+    tx_status: int
+    tx_ts_ns: int
+
+    @property
+    def ok(self) -> bool:
+        return bool(self.tx_status & CEC_TX_STATUS_OK)
+
+
 @dataclass
 class CecKernelAdapter:
     device: str = "/dev/cec0"
@@ -277,10 +382,27 @@ class CecKernelAdapter:
     announce_vendor_id: bool = False
     spoof_vendor_id: bool = False
     source: str = "cec"
+    confirm_claim: bool = True
+    stats: CecTrafficStats = field(default_factory=CecTrafficStats)
+    tx_listener: Callable[[CecTxResult], None] | None = None
+    recorder: FrameRecorder | None = None
+    clock: Callable[[], float] = time.monotonic
     _fd: int | None = None
     _effective_vendor_id: int | None = None
     _log_addrs_busy_retries: tuple[float, ...] = (0.1, 0.25, 0.5)
     _async_poll_interval_s: float = 0.05
+    _async_idle_timeout_s: float = 1.0
+    _claim_confirm_timeout_s: float = 2.0
+    _reclaim_pending: bool = False
+    # Re-claims back off from 1s to 60s while the claim keeps getting lost.
+    _reclaim_min_interval_s: float = 1.0
+    _reclaim_max_interval_s: float = 60.0
+    _reclaim_interval_s: float = 1.0
+    _reclaim_not_before: float = float("-inf")
+    _phys_addr: int | None = None
+    _deferred_events: list[InputEvent] = field(default_factory=list)
+    _tx_in_flight: dict[int, str] = field(default_factory=dict)
+    _last_rx_ts_ns: int | None = None
 
     def _vendor_broadcast_announce_frame(self) -> str:
         vid = int(self.vendor_id) & 0xFFFFFF
@@ -290,7 +412,7 @@ class CecKernelAdapter:
     def _has_audio_system_claim(addrs: CecLogAddrs) -> bool:
         return bool(addrs.log_addr_mask & CEC_LOG_ADDR_MASK_AUDIOSYSTEM)
 
-    def _configure(self, fd: int) -> None:
+    def _log_addrs_to_claim(self, fd: int) -> CecLogAddrs | None:
         mode = U32(value=CEC_MODE_INITIATOR | CEC_MODE_FOLLOWER)
         fcntl.ioctl(fd, CEC_S_MODE, mode)
 
@@ -303,7 +425,7 @@ class CecKernelAdapter:
                 "(mask=0x%04X), skipping logical-address claim",
                 int(current.log_addr_mask),
             )
-            return
+            return None
 
         addrs = CecLogAddrs()
         addrs.num_log_addrs = 1
@@ -320,14 +442,21 @@ class CecKernelAdapter:
         addrs.primary_device_type[0] = CEC_OP_PRIM_DEVTYPE_AUDIOSYSTEM
         addrs.log_addr_type[0] = CEC_LOG_ADDR_TYPE_AUDIOSYSTEM
         addrs.all_device_types[0] = CEC_OP_ALL_DEVTYPE_AUDIOSYSTEM
+        return addrs
+
+    async def _configure_async(self, fd: int) -> None:
+        addrs = self._log_addrs_to_claim(fd)
+        if addrs is None:
+            return
         retry_delays = (0.0,) + self._log_addrs_busy_retries
         for idx, delay_s in enumerate(retry_delays):
             if delay_s > 0:
-                time.sleep(delay_s)
+                await asyncio.sleep(delay_s)
             try:
+                # The fd is non-blocking, so the kernel only starts the claim here;
+                # completion is reported later as a CEC_EVENT_STATE_CHANGE.
                 fcntl.ioctl(fd, CEC_ADAP_S_LOG_ADDRS, addrs)
-                LOG.info("kernel cec adapter claimed logical address as Audio System")
-                return
+                break
             except OSError as exc:
                 if exc.errno != errno.EBUSY:
                     raise
@@ -343,6 +472,64 @@ class CecKernelAdapter:
                     len(retry_delays),
                     retry_delays[idx + 1],
                 )
+        if not self.confirm_claim:
+            LOG.info("kernel cec adapter started Audio System logical-address claim")
+            return
+        if await self._await_claim_confirmation(fd):
+            LOG.info("kernel cec adapter claimed logical address as Audio System")
+        else:
+            LOG.warning(
+                "CEC Audio System claim not confirmed within %.1fs; continuing",
+                self._claim_confirm_timeout_s,
+            )
+
+    async def _await_claim_confirmation(self, fd: int) -> bool:
+        # Watch POLLPRI only: frames arriving meanwhile stay queued for the receive
+        # loop instead of keeping this wait permanently readable.
+        poller = self._open_readiness_poller(fd, priority_only=True)
+        deadline = self.clock() + self._claim_confirm_timeout_s
+        try:
+            while True:
+                while (raw := self._read_kernel_event(fd)) is not None:
+                    if int(raw.event) != CEC_EVENT_STATE_CHANGE:
+                        event = self._input_event_from_kernel_event(raw)
+                        if event is not None:
+                            self._deferred_events.append(event)
+                        continue
+                    state = raw.payload.state_change
+                    self._phys_addr = int(state.phys_addr)
+                    if int(state.log_addr_mask) & CEC_LOG_ADDR_MASK_AUDIOSYSTEM:
+                        self._deferred_events.append(self._state_change_event(int(state.phys_addr)))
+                        return True
+                    LOG.debug(
+                        "CEC state change while claiming: log_addr_mask=0x%04X",
+                        int(state.log_addr_mask),
+                    )
+                remaining = deadline - self.clock()
+                if remaining <= 0:
+                    return False
+                await self._wait_readable(poller, timeout_s=remaining)
+        finally:
+            if poller is not None:
+                poller.close()
+
+    async def _reclaim_async(self, fd: int) -> None:
+        self._reclaim_pending = False
+        self._reclaim_not_before = self.clock() + self._reclaim_interval_s
+        self._reclaim_interval_s = min(self._reclaim_max_interval_s, self._reclaim_interval_s * 2)
+        current = CecLogAddrs()
+        fcntl.ioctl(fd, CEC_ADAP_G_LOG_ADDRS, current)
+        if self._has_audio_system_claim(current):
+            return
+        if int(current.num_log_addrs):
+            # The kernel still holds our configuration and is claiming it again itself;
+            # S_LOG_ADDRS now would only fail with EBUSY.
+            LOG.debug("CEC claim in progress in the kernel; not re-claiming")
+            return
+        LOG.warning("CEC Audio System claim lost; re-claiming logical address")
+        await self._configure_async(fd)
+        if self.announce_vendor_id and self.spoof_vendor_id:
+            self.send_tx(self._vendor_broadcast_announce_frame())
 
     def get_effective_vendor_id(self) -> int:
         if self._effective_vendor_id is not None:
@@ -362,6 +549,10 @@ class CecKernelAdapter:
             msg.msg[idx] = int(part, 16)
         return msg
 
+    @staticmethod
+    def _msg_bytes(msg: CecMsg) -> bytes:
+        return bytes(msg.msg)[: max(0, min(int(msg.len), CEC_MAX_MSG_SIZE))]
+
     @staticmethod
     def _frame_from_msg(msg: CecMsg) -> str:
         size = int(msg.len)
@@ -369,44 +560,187 @@ class CecKernelAdapter:
             return ""
         return ":".join(f"{int(msg.msg[i]):02X}" for i in range(size))
 
+    @staticmethod
+    def _read_kernel_event(fd: int) -> CecEvent | None:
+        raw = CecEvent()
+        try:
+            fcntl.ioctl(fd, CEC_DQEVENT, raw)
+        except OSError as exc:
+            if exc.errno in {errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR}:
+                return None
+            raise
+        return raw
+
+    def _dequeue_kernel_events(self, fd: int) -> list[InputEvent]:
+        events, self._deferred_events = self._deferred_events, []
+        while (raw := self._read_kernel_event(fd)) is not None:
+            event = self._input_event_from_kernel_event(raw)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def _state_change_event(self, phys_addr: int) -> InputEvent:
+        return InputEvent(
+            kind=InputEventType.CEC_STATE_CHANGE,
+            source=self.source,
+            key="CEC_EVENT_STATE_CHANGE",
+            value=phys_addr,
+        )
+
+    def _input_event_from_kernel_event(self, raw: CecEvent) -> InputEvent | None:
+        kind = int(raw.event)
+        initial = bool(raw.flags & CEC_EVENT_FL_INITIAL_STATE)
+        if kind == CEC_EVENT_STATE_CHANGE:
+            phys_addr = int(raw.payload.state_change.phys_addr)
+            mask = int(raw.payload.state_change.log_addr_mask)
+            LOG.info(
+                "CEC state change: phys_addr=%04X log_addr_mask=0x%04X%s",
+                phys_addr,
+                mask,
+                " (initial)" if initial else "",
+            )
+            previous_phys_addr, self._phys_addr = self._phys_addr, phys_addr
+            if mask & CEC_LOG_ADDR_MASK_AUDIOSYSTEM:
+                self._reclaim_interval_s = self._reclaim_min_interval_s
+            if phys_addr != CEC_PHYS_ADDR_INVALID and not initial:
+                if not mask & CEC_LOG_ADDR_MASK_AUDIOSYSTEM:
+                    # After a physical-address change the kernel re-claims by itself;
+                    # only a claim lost at the same address is ours to redo. The
+                    # receive loop runs it so the claim never blocks here.
+                    if phys_addr == previous_phys_addr:
+                        self._reclaim_pending = True
+                elif self.announce_vendor_id and self.spoof_vendor_id:
+                    self.send_tx(self._vendor_broadcast_announce_frame())
+            return self._state_change_event(phys_addr)
+        if kind == CEC_EVENT_LOST_MSGS:
+            lost = int(raw.payload.lost_msgs.lost_msgs)
+            LOG.warning("CEC receive queue overflow: %d message(s) lost", lost)
+            return InputEvent(
+                kind=InputEventType.CEC_MESSAGES_LOST,
+                source=self.source,
+                key="CEC_EVENT_LOST_MSGS",
+                value=lost,
+            )
+        if kind in {CEC_EVENT_PIN_HPD_LOW, CEC_EVENT_PIN_HPD_HIGH}:
+            level = 1 if kind == CEC_EVENT_PIN_HPD_HIGH else 0
+            LOG.info("CEC HPD pin %s", "high" if level else "low")
+            return InputEvent(
+                kind=InputEventType.CEC_HOTPLUG,
+                source=self.source,
+                key="CEC_EVENT_PIN_HPD",
+                value=level,
+            )
+        LOG.debug("ignored CEC kernel event=%d flags=0x%X", kind, int(raw.flags))
+        return None
+
+    @staticmethod
+    def _open_readiness_poller(fd: int, priority_only: bool = False) -> "select.epoll | None":
+        # Frames raise POLLIN and kernel events POLLPRI; an epoll fd folds both into
+        # plain readability that the asyncio loop can watch.
+        epoll_factory = getattr(select, "epoll", None)
+        if epoll_factory is None:
+            return None
+        mask = select.EPOLLPRI if priority_only else select.EPOLLIN | select.EPOLLPRI
+        try:
+            poller = epoll_factory()
+            poller.register(fd, mask)
+        except OSError as exc:
+            LOG.debug("cannot watch CEC fd with epoll, polling instead: %s", exc)
+            return None
+        return poller
+
+    async def _wait_readable(
+        self, poller: "select.epoll | None", timeout_s: float | None = None
+    ) -> None:
+        if timeout_s is None:
+            timeout_s = self._async_idle_timeout_s
+        if poller is None:
+            await asyncio.sleep(min(self._async_poll_interval_s, timeout_s))
+            return
+        loop = asyncio.get_running_loop()
+        ready = asyncio.Event()
+        loop.add_reader(poller.fileno(), ready.set)
+        try:
+            await asyncio.wait_for(ready.wait(), timeout_s)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            loop.remove_reader(poller.fileno())
+        poller.poll(0)
+
     def _receive_one_frame(self, fd: int) -> str:
         msg = CecMsg()
         msg.timeout = 0
         fcntl.ioctl(fd, CEC_RECEIVE, msg)
-        # Ignore internal TX status notifications.
+        # TX status notifications of our own non-blocking transmits are not frames.
         if msg.sequence and msg.tx_status and not msg.rx_status:
+            if self.recorder is not None:
+                self.recorder.record_cec_tx_status(
+                    self._msg_bytes(msg), int(msg.tx_status), int(msg.tx_ts)
+                )
+            self._complete_tx(msg)
             return ""
+        self._last_rx_ts_ns = int(msg.rx_ts) or None
+        if self.recorder is not None:
+            self.recorder.record_cec_rx(self._msg_bytes(msg), int(msg.rx_ts))
         return self._frame_from_msg(msg)
 
+    def _complete_tx(self, msg: CecMsg) -> None:
+        frame = self._tx_in_flight.pop(int(msg.sequence), None)
+        if frame is None:
+            return
+        result = CecTxResult(
+            sequence=int(msg.sequence),
+            frame=frame,
+            tx_status=int(msg.tx_status),
+            tx_ts_ns=int(msg.tx_ts),
+        )
+        # NACK, lost arbitration and exhausted retries only show up here.
+        self.stats.record_tx(frame, ok=result.ok)
+        if self.tx_listener is not None:
+            self.tx_listener(result)
+
     async def async_events(self) -> AsyncIterator[InputEvent]:
         LOG.info("starting kernel cec adapter (async): %s", self.device)
         fd = os.open(self.device, os.O_RDWR | os.O_NONBLOCK)
         self._fd = fd
+        poller = None
 
         try:
-            self._configure(fd)
+            await self._configure_async(fd)
             if self.announce_vendor_id and self.spoof_vendor_id:
                 self.send_tx(self._vendor_broadcast_announce_frame())
+            poller = self._open_readiness_poller(fd)
 
             while True:
+                for kernel_event in self._dequeue_kernel_events(fd):
+                    yield kernel_event
+                if self._reclaim_pending and self.clock() >= self._reclaim_not_before:
+                    await self._reclaim_async(fd)
+                    continue
                 try:
                     frame = self._receive_one_frame(fd)
                 except OSError as exc:
                     if exc.errno in {errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR}:
-                        await asyncio.sleep(self._async_poll_interval_s)
+                        await self._wait_readable(poller)
                         continue
                     raise
                 if not frame:
-                    await asyncio.sleep(self._async_poll_interval_s)
+                    await asyncio.sleep(0)
                     continue
+                self.stats.record_rx(frame)
                 LOG.info("CEC RX frame: %s", frame)
                 LOG.info("CEC RX decoded: %s -> %s", frame, format_cec_frame_human(frame))
                 event = parse_cec_frame(frame, source=self.source)
                 if event is not None:
+                    if self._last_rx_ts_ns is not None:
+                        event = dataclasses.replace(event, rx_ts_ns=self._last_rx_ts_ns)
                     yield event
                 await asyncio.sleep(0)
         finally:
             self._fd = None
+            if poller is not None:
+                poller.close()
             try:
                 os.close(fd)
             except OSError:
@@ -419,10 +753,24 @@ class CecKernelAdapter:
         upper_frame = frame.upper()
         LOG.info("CEC TX frame: %s", upper_frame)
         LOG.info("CEC TX decoded: %s -> %s", upper_frame, format_cec_frame_human(upper_frame))
+        msg = None
         try:
             msg = self._msg_from_frame(upper_frame)
             fcntl.ioctl(fd, CEC_TRANSMIT, msg)
-            return True
         except (ValueError, OSError) as exc:
+            self.stats.record_tx(upper_frame, ok=False)
+            if self.recorder is not None and msg is not None:
+                self.recorder.record_cec_tx(self._msg_bytes(msg), ok=False)
             LOG.warning("failed to transmit CEC frame %s: %s", upper_frame, exc)
             return False
+        if self.recorder is not None:
+            self.recorder.record_cec_tx(self._msg_bytes(msg), ok=True)
+        if not msg.sequence:
+            self.stats.record_tx(upper_frame, ok=True)
+            return True
+        # Non-blocking transmit: the kernel only queued the frame; its bus outcome is
+        # counted when the TX status arrives (_complete_tx).
+        if len(self._tx_in_flight) >= _MAX_TX_IN_FLIGHT:
+            self._tx_in_flight.pop(next(iter(self._tx_in_flight)))
+        self._tx_in_flight[int(msg.sequence)] = upper_frame
+        return True
@@ -0,0 +1,130 @@
+import asyncio
+import itertools
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable
+
+from devialetctl.domain.events import InputEvent
+from devialetctl.infrastructure.capture_file import read_capture_rows
+from devialetctl.infrastructure.cec_adapter import (
+    CEC_TX_STATUS_OK,
+    CecTrafficStats,
+    CecTxResult,
+    parse_cec_frame,
+)
+from devialetctl.infrastructure.flight_recorder import FrameRecorder, RecordKind
+
+LOG = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ReplayFrame:
+    offset_s: float
+    frame: str
+
+
+def _frame_text(payload: bytes) -> str:
+    return ":".join(f"{byte:02X}" for byte in payload)
+
+
+def load_replay_frames(path: str) -> tuple[list[ReplayFrame], list[ReplayFrame]]:
+    """Inbound frames and the replies the daemon sent, from a capture file.
+
+    Offsets are seconds since the first record; they never go backwards, even when a
+    capture spans several daemon runs.
+    """
+    inbound: list[ReplayFrame] = []
+    sent: list[ReplayFrame] = []
+    last_ts_s: float | None = None
+    offset_s = 0.0
+    for row in read_capture_rows(path):
+        ts_s, _wall_s, kind, _kernel_ts_ns, status, _latency_s, payload, _endpoint, _session = row
+        if kind not in (RecordKind.CEC_RX, RecordKind.CEC_TX):
+            continue
+        if last_ts_s is not None:
+            offset_s += max(0.0, ts_s - last_ts_s)
+        last_ts_s = ts_s
+        if kind == RecordKind.CEC_RX:
+            inbound.append(ReplayFrame(offset_s=offset_s, frame=_frame_text(payload)))
+        elif status:
+            sent.append(ReplayFrame(offset_s=offset_s, frame=_frame_text(payload)))
+    return inbound, sent
+
+
+@dataclass
+class CecReplayAdapter:
+    """Plays recorded inbound CEC frames into the daemon instead of ``/dev/cec*``.
+
+    Implements the ``async_events``/``send_tx`` surface of ``CecKernelAdapter``.
+    Frames keep their recorded spacing divided by ``speed`` (``math.inf`` plays them
+    back to back). Once the last frame was delivered and ``settle_s`` passed, the
+    stream ends and ``on_finished`` runs. Transmits are kept in ``sent``; their acks
+    are stamped with ``clock``, which ``bind`` takes from the daemon.
+    """
+
+    frames: list[ReplayFrame]
+    speed: float = 1.0
+    settle_s: float = 0.5
+    source: str = "cec"
+    on_finished: Callable[[], None] | None = None
+    stats: CecTrafficStats = field(default_factory=CecTrafficStats)
+    tx_listener: Callable[[CecTxResult], None] | None = None
+    recorder: FrameRecorder | None = None
+    clock: Callable[[], float] = time.monotonic
+    sent: list[ReplayFrame] = field(default_factory=list)
+    started_s: float | None = None
+    finished_s: float | None = None
+    _sequences: itertools.count = field(default_factory=lambda: itertools.count(1))
+
+    def __post_init__(self) -> None:
+        if not self.speed > 0:
+            raise ValueError(f"replay speed must be greater than 0: {self.speed}")
+
+    def bind(self, **options) -> "CecReplayAdapter":
+        """Adapter factory for ``DaemonRunner.adapter_factory``; keeps the daemon's hooks."""
+        for name in ("stats", "tx_listener", "recorder", "clock"):
+            if name in options:
+                setattr(self, name, options[name])
+        return self
+
+    def _now(self) -> float:
+        return asyncio.get_running_loop().time()
+
+    async def async_events(self) -> AsyncIterator[InputEvent]:
+        LOG.info("replaying %d CEC frames at %sx", len(self.frames), self.speed)
+        self.started_s = self._now()
+        for replay in self.frames:
+            delay_s = self.started_s + replay.offset_s / self.speed - self._now()
+            if delay_s > 0:
+                await asyncio.sleep(delay_s)
+            self.stats.record_rx(replay.frame)
+            if self.recorder is not None:
+                self.recorder.record_cec_rx(bytes.fromhex(replay.frame.replace(":", "")))
+            event = parse_cec_frame(replay.frame, source=self.source)
+            if event is not None:
+                yield event
+            await asyncio.sleep(0)
+        self.finished_s = self._now()
+        # Let queued handlers and paced TX replies drain before ending the session.
+        await asyncio.sleep(self.settle_s)
+        if self.on_finished is not None:
+            self.on_finished()
+
+    def send_tx(self, frame: str) -> bool:
+        upper_frame = frame.upper()
+        started_s = self.started_s if self.started_s is not None else self._now()
+        self.sent.append(ReplayFrame(offset_s=self._now() - started_s, frame=upper_frame))
+        self.stats.record_tx(upper_frame, ok=True)
+        if self.recorder is not None:
+            self.recorder.record_cec_tx(bytes.fromhex(upper_frame.replace(":", "")), ok=True)
+        if self.tx_listener is not None:
+            # The kernel reports the bus outcome asynchronously; replay acks at once.
+            result = CecTxResult(
+                sequence=next(self._sequences),
+                frame=upper_frame,
+                tx_status=CEC_TX_STATUS_OK,
+                tx_ts_ns=int(self.clock() * 1e9),
+            )
+            asyncio.get_running_loop().call_soon(self.tx_listener, result)
+        return True
@@ -0,0 +1,92 @@
+import logging
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable
+
+LOG = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of a request while the target is known to be unreachable."""
+
+
+@dataclass
+class CircuitBreaker:
+    """Per-target circuit breaker.
+
+    ``failure_threshold`` consecutive transport failures open the circuit: requests
+    then fail fast until ``reset_timeout_s`` has passed, after which a single probe is
+    let through (half-open). A failed probe re-opens the circuit with a doubled reset
+    timeout (capped at ``max_reset_timeout_s``); a successful one closes it.
+    """
+
+    name: str = ""
+    failure_threshold: int = 3
+    reset_timeout_s: float = 2.0
+    max_reset_timeout_s: float = 30.0
+    clock: Callable[[], float] = time.monotonic
+    state: CircuitState = CircuitState.CLOSED
+    failures: int = 0
+    trips: int = 0
+    rejected: int = 0
+    _open_until: float = 0.0
+    _backoff_s: float = 0.0
+    _probing: bool = False
+
+    def allows_request(self) -> bool:
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.OPEN:
+            return self.clock() >= self._open_until
+        return not self._probing
+
+    def acquire(self) -> bool:
+        """Admit a request; returns True when the caller must probe the target first."""
+        if self.state == CircuitState.CLOSED:
+            return False
+        if self.state == CircuitState.OPEN and self.clock() >= self._open_until:
+            self.state = CircuitState.HALF_OPEN
+        if self.state == CircuitState.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        self.rejected += 1
+        raise CircuitOpenError(f"{self.name or 'target'} is unreachable (circuit open)")
+
+    def abort_probe(self) -> None:
+        # The probe was cancelled before it could tell anything; let the next one through.
+        self._probing = False
+
+    def record_success(self) -> None:
+        if self.state != CircuitState.CLOSED:
+            LOG.info("circuit closed: %s is reachable again", self.name or "target")
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self._backoff_s = 0.0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        if self.state == CircuitState.HALF_OPEN:
+            self._trip(min(self.max_reset_timeout_s, self._backoff_s * 2.0))
+            return
+        self.failures += 1
+        if self.state == CircuitState.CLOSED and self.failures >= self.failure_threshold:
+            self._trip(self.reset_timeout_s)
+
+    def _trip(self, backoff_s: float) -> None:
+        self.state = CircuitState.OPEN
+        self._backoff_s = max(backoff_s, self.reset_timeout_s)
+        self._open_until = self.clock() + self._backoff_s
+        self._probing = False
+        self.trips += 1
+        LOG.warning(
+            "circuit open: %s unreachable, failing fast for %.1fs",
+            self.name or "target",
+            self._backoff_s,
+        )
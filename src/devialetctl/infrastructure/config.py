@@ -1,9 +1,10 @@
+import dataclasses
 import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field, ValidationError, field_validator
+from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
 
 from devialetctl.infrastructure.devialet_gateway import normalize_base_path
 
@@ -22,6 +23,40 @@ class RuntimeTarget:
     index: int | None = None
 
 
+@dataclass(frozen=True)
+class CecBinding:
+    """One CEC adapter bound to one Devialet system (multi-binding daemon)."""
+
+    cec_device: str
+    system: str | None = None
+    ip: str | None = None
+    port: int = 80
+    base_path: str = "/ipcontrol/v1"
+    cec_osd_name: str | None = None
+    cec_vendor_compat: str | None = None
+    state_file: str | None = None
+
+
+def target_identity(ip: str | None, port: int = 80, system: str | None = None) -> str | None:
+    """Stable name of the selected speaker, stored with its persisted audio state.
+
+    None when the speaker is left to discovery: only the resolved target names it.
+    """
+    if ip:
+        return f"ip:{ip}:{port}"
+    if system:
+        return f"system:{system}"
+    return None
+
+
+def _per_device_path(path: str | None, cec_device: str) -> str | None:
+    # One file per adapter: state.json -> state-cec1.json
+    if not path:
+        return path
+    base = Path(path)
+    return str(base.with_name(f"{base.stem}-{Path(cec_device).name}{base.suffix}"))
+
+
 @dataclass(frozen=True)
 class DaemonConfig:
     target: RuntimeTarget
@@ -32,6 +67,38 @@ class DaemonConfig:
     log_level: str = "INFO"
     dedupe_window_s: float = 0.08
     min_interval_s: float = 0.12
+    state_file: str | None = None
+    bindings: tuple[CecBinding, ...] = ()
+    metrics_host: str = "127.0.0.1"
+    metrics_port: int | None = None
+    trace_file: str | None = None
+    flight_recorder_size: int = 8192
+    flight_recorder_dir: str | None = None
+    capture_file: str | None = None
+    # Identity of the speaker this daemon drives; restored state of another is ignored.
+    state_target: str | None = None
+
+    def for_binding(self, binding: CecBinding) -> "DaemonConfig":
+        """Per-binding daemon config; unset binding fields fall back to this config."""
+        if binding.state_file is not None:
+            state_file = binding.state_file
+        else:
+            state_file = _per_device_path(self.state_file, binding.cec_device)
+        if binding.ip or binding.system:
+            state_target = target_identity(binding.ip, binding.port, binding.system)
+        else:
+            state_target = self.state_target
+        return dataclasses.replace(
+            self,
+            cec_device=binding.cec_device,
+            cec_osd_name=binding.cec_osd_name or self.cec_osd_name,
+            cec_vendor_compat=binding.cec_vendor_compat or self.cec_vendor_compat,
+            state_file=state_file,
+            state_target=state_target,
+            trace_file=_per_device_path(self.trace_file, binding.cec_device),
+            capture_file=_per_device_path(self.capture_file, binding.cec_device),
+            bindings=(),
+        )
 
 
 def _toml_error_type():
@@ -58,6 +125,47 @@ class _TargetConfigModel(BaseModel):
         return normalize_base_path(value)
 
 
+def _normalize_vendor_compat_value(value) -> str:
+    normalized = str(value).strip().lower()
+    if normalized not in {"none", "samsung"}:
+        raise ValueError("cec_vendor_compat must be one of: none, samsung")
+    return normalized
+
+
+class _BindingConfigModel(BaseModel):
+    cec_device: str
+    system: str | None = None
+    ip: str | None = None
+    port: int = 80
+    base_path: str = "/ipcontrol/v1"
+    cec_osd_name: str | None = None
+    cec_vendor_compat: str | None = None
+    state_file: str | None = None
+
+    @field_validator("port", mode="before")
+    @classmethod
+    def _reject_bool_numbers(cls, value):
+        if isinstance(value, bool):
+            raise ValueError("boolean values are not valid for numeric fields")
+        return value
+
+    @field_validator("base_path", mode="before")
+    @classmethod
+    def _normalize_base_path(cls, value):
+        return normalize_base_path(value)
+
+    @field_validator("cec_vendor_compat", mode="before")
+    @classmethod
+    def _normalize_vendor_compat(cls, value):
+        return None if value is None else _normalize_vendor_compat_value(value)
+
+    @model_validator(mode="after")
+    def _check_target_selection(self):
+        if self.ip and self.system:
+            raise ValueError("a binding selects its target by either ip or system, not both")
+        return self
+
+
 class _DaemonConfigModel(BaseModel):
     target: _TargetConfigModel = Field(default_factory=_TargetConfigModel)
     cec_device: str = "/dev/cec0"
@@ -67,11 +175,21 @@ class _DaemonConfigModel(BaseModel):
     log_level: str = "INFO"
     dedupe_window_s: float = 0.08
     min_interval_s: float = 0.12
+    state_file: str | None = None
+    bindings: list[_BindingConfigModel] = Field(default_factory=list)
+    metrics_host: str = "127.0.0.1"
+    metrics_port: int | None = Field(default=None, ge=0, le=65535)
+    trace_file: str | None = None
+    flight_recorder_size: int = Field(default=8192, ge=0)
+    flight_recorder_dir: str | None = None
+    capture_file: str | None = None
 
     @field_validator(
         "reconnect_delay_s",
         "dedupe_window_s",
         "min_interval_s",
+        "metrics_port",
+        "flight_recorder_size",
         mode="before",
     )
     @classmethod
@@ -88,10 +206,14 @@ class _DaemonConfigModel(BaseModel):
     @field_validator("cec_vendor_compat", mode="before")
     @classmethod
     def _normalize_vendor_compat(cls, value):
-        normalized = str(value).strip().lower()
-        if normalized not in {"none", "samsung"}:
-            raise ValueError("cec_vendor_compat must be one of: none, samsung")
-        return normalized
+        return _normalize_vendor_compat_value(value)
+
+    @model_validator(mode="after")
+    def _check_unique_binding_devices(self):
+        devices = [binding.cec_device for binding in self.bindings]
+        if len(devices) != len(set(devices)):
+            raise ValueError("each binding needs its own cec_device")
+        return self
 
 
 def _default_config_path() -> Path:
@@ -101,6 +223,13 @@ def _default_config_path() -> Path:
     return Path.home() / ".config" / "devialetctl" / "config.toml"
 
 
+def _default_state_path() -> Path:
+    xdg = os.getenv("XDG_STATE_HOME")
+    if xdg:
+        return Path(xdg) / "devialetctl" / "state.json"
+    return Path.home() / ".local" / "state" / "devialetctl" / "state.json"
+
+
 def _load_toml(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {}
@@ -126,6 +255,8 @@ def _merge_env_overrides(data: dict[str, Any]) -> dict[str, Any]:
     env_log_level = os.getenv("DEVIALETCTL_LOG_LEVEL")
     env_cec_device = os.getenv("DEVIALETCTL_CEC_DEVICE")
     env_cec_vendor_compat = os.getenv("DEVIALETCTL_CEC_VENDOR_COMPAT")
+    env_state_file = os.getenv("DEVIALETCTL_STATE_FILE")
+    env_metrics_port = os.getenv("DEVIALETCTL_METRICS_PORT")
     if env_ip is not None:
         target_data["ip"] = env_ip
     if env_port is not None:
@@ -138,6 +269,11 @@ def _merge_env_overrides(data: dict[str, Any]) -> dict[str, Any]:
         merged["cec_device"] = env_cec_device
     if env_cec_vendor_compat is not None:
         merged["cec_vendor_compat"] = env_cec_vendor_compat
+    if env_state_file is not None:
+        merged["state_file"] = env_state_file
+    if env_metrics_port is not None:
+        # An empty string disables the metrics endpoint.
+        merged["metrics_port"] = env_metrics_port or None
 
     merged["target"] = target_data
     return merged
@@ -167,4 +303,15 @@ def load_config(path: str | None = None) -> DaemonConfig:
         log_level=parsed.log_level,
         dedupe_window_s=parsed.dedupe_window_s,
         min_interval_s=parsed.min_interval_s,
+        # An empty string disables state persistence.
+        state_file=(
+            parsed.state_file if parsed.state_file is not None else str(_default_state_path())
+        ),
+        bindings=tuple(CecBinding(**binding.model_dump()) for binding in parsed.bindings),
+        metrics_host=parsed.metrics_host,
+        metrics_port=parsed.metrics_port,
+        trace_file=parsed.trace_file or None,
+        flight_recorder_size=parsed.flight_recorder_size,
+        flight_recorder_dir=parsed.flight_recorder_dir or str(_default_state_path().parent),
+        capture_file=parsed.capture_file or None,
     )
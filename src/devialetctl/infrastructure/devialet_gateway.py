@@ -1,9 +1,19 @@
-from dataclasses import dataclass
-from typing import Any
+import contextlib
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable
 
 import httpx
 
 from devialetctl.application.ports import VolumeGateway
+from devialetctl.infrastructure.adaptive_timeout import RttEstimator, current_budget
+from devialetctl.infrastructure.circuit_breaker import CircuitBreaker, CircuitOpenError
+from devialetctl.infrastructure.flight_recorder import active_recorder
+from devialetctl.infrastructure.latency_histogram import LatencyHistogram
+from devialetctl.infrastructure.tracing import trace_span
+
+# Cheapest endpoint to tell whether a sleeping/offline speaker answers again.
+_PROBE_PATH = "/devices/current"
 
 
 def normalize_base_path(value: str | None) -> str:
@@ -15,29 +25,199 @@ def normalize_base_path(value: str | None) -> str:
     return raw.rstrip("/") or "/ipcontrol/v1"
 
 
+@dataclass
+class SharedHttpPool:
+    """One pooled HTTP client shared by several gateways (multi-binding daemon)."""
+
+    timeout_s: float = 2.5
+    clock: Callable[[], float] | None = field(default=None, repr=False)
+    client: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
+
+    @contextlib.asynccontextmanager
+    async def session(self) -> AsyncIterator["SharedHttpPool"]:
+        self.client = httpx.AsyncClient(timeout=self.timeout_s)
+        try:
+            yield self
+        finally:
+            client, self.client = self.client, None
+            await client.aclose()
+
+    def gateway(
+        self, address: str, port: int = 80, base_path: str = "/ipcontrol/v1"
+    ) -> "DevialetHttpGateway":
+        return DevialetHttpGateway(
+            address, port, base_path, timeout_s=self.timeout_s, pool=self, clock=self.clock
+        )
+
+
 @dataclass
 class DevialetHttpGateway(VolumeGateway):
     address: str
     port: int = 80
     base_path: str = "/ipcontrol/v1"
     timeout_s: float = 2.5
+    pool: SharedHttpPool | None = field(default=None, repr=False)
+    breaker: CircuitBreaker = field(default_factory=CircuitBreaker, repr=False)
+    # The daemon's clock, for the breaker's reset timeouts (its own default otherwise).
+    clock: Callable[[], float] | None = field(default=None, repr=False)
+    _pooled: bool = field(default=False, init=False, repr=False)
+    _client: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
+    request_latency: dict[tuple[str, str], LatencyHistogram] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    request_errors: dict[tuple[str, str], int] = field(default_factory=dict, init=False, repr=False)
+    _connect_rtt: RttEstimator = field(default_factory=RttEstimator, init=False, repr=False)
+    _endpoint_rtt: dict[tuple[str, str], RttEstimator] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
     def __post_init__(self) -> None:
         self.base_path = normalize_base_path(self.base_path)
         self.base_url = f"http://{self.address}:{self.port}{self.base_path}"
+        if not self.breaker.name:
+            self.breaker.name = f"{self.address}:{self.port}"
+        if self.clock is not None:
+            self.breaker.clock = self.clock
+
+    @property
+    def available(self) -> bool:
+        """False while the circuit is open: calls would fail fast without I/O."""
+        return self.breaker.allows_request()
+
+    @contextlib.asynccontextmanager
+    async def session(self) -> AsyncIterator["DevialetHttpGateway"]:
+        """Keep one pooled HTTP client (keep-alive connections) for the session lifetime."""
+        self._pooled = True
+        try:
+            yield self
+        finally:
+            self._pooled = False
+            await self._close_client()
+
+    async def _close_client(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        with trace_span(f"{method} {path}"):
+            if self.breaker.acquire():
+                await self._probe()
+            try:
+                response = await self._send(method, path, **kwargs)
+            except httpx.TransportError as exc:
+                if self._trips_breaker(exc):
+                    self.breaker.record_failure()
+                raise
+            self.breaker.record_success()
+            return response
+
+    async def _probe(self) -> None:
+        try:
+            await self._send("GET", _PROBE_PATH)
+        except httpx.TransportError as exc:
+            if not self._trips_breaker(exc):
+                # Too tight a budget to judge the target: leave the probe to the next call.
+                self.breaker.abort_probe()
+                raise
+            self.breaker.record_failure()
+            raise CircuitOpenError(f"{self.breaker.name} did not answer the probe") from exc
+        except BaseException:
+            self.breaker.abort_probe()
+            raise
+        self.breaker.record_success()
+
+    @staticmethod
+    def _trips_breaker(exc: httpx.TransportError) -> bool:
+        if isinstance(exc, httpx.TimeoutException):
+            return current_budget().timeouts_trip_breaker
+        return True
+
+    def endpoint_rtt(self, method: str, path: str) -> RttEstimator:
+        key = (method, path)
+        estimator = self._endpoint_rtt.get(key)
+        if estimator is None:
+            estimator = RttEstimator()
+            self._endpoint_rtt[key] = estimator
+        return estimator
+
+    def latency_histogram(self, method: str, path: str) -> LatencyHistogram:
+        key = (method, path)
+        histogram = self.request_latency.get(key)
+        if histogram is None:
+            histogram = LatencyHistogram()
+            self.request_latency[key] = histogram
+        return histogram
+
+    def request_timeout(self, method: str, path: str) -> httpx.Timeout:
+        """Connect/read timeouts from the measured RTTs, bounded above by ``timeout_s``."""
+        budget = current_budget()
+        ceiling_s = self.timeout_s * budget.ceiling_scale
+        read_s = self.endpoint_rtt(method, path).timeout_s(budget.k, budget.read_floor_s, ceiling_s)
+        connect_s = self._connect_rtt.timeout_s(budget.k, budget.connect_floor_s, ceiling_s)
+        return httpx.Timeout(read_s, connect=connect_s, pool=ceiling_s)
+
+    async def _send(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        timeout = self.request_timeout(method, path)
+        connect_started: list[float] = []
+        connect_s: list[float] = []
+
+        async def trace(event: str, _info: dict) -> None:
+            # Only new connections report these; keep-alive reuse adds no connect sample.
+            if event == "connection.connect_tcp.started":
+                connect_started.append(time.monotonic())
+            elif event == "connection.connect_tcp.complete" and connect_started:
+                connect_s.append(time.monotonic() - connect_started[-1])
+                self._connect_rtt.observe(connect_s[-1])
+
+        started = time.monotonic()
+        try:
+            response = await self._dispatch(
+                method, path, timeout=timeout, extensions={"trace": trace}, **kwargs
+            )
+        except httpx.TransportError as exc:
+            key = (method, path)
+            self.request_errors[key] = self.request_errors.get(key, 0) + 1
+            recorder = active_recorder()
+            if recorder is not None:
+                recorder.record_http(method, path, 0, time.monotonic() - started)
+            if isinstance(exc, httpx.ConnectTimeout):
+                # Like a TCP retransmit timeout: back off so a flaky link gets more room.
+                self._connect_rtt.observe(timeout.connect * 2.0)
+            elif isinstance(exc, httpx.TimeoutException):
+                self.endpoint_rtt(method, path).observe(timeout.read * 2.0)
+            raise
+        elapsed_s = time.monotonic() - started
+        self.endpoint_rtt(method, path).observe(elapsed_s - sum(connect_s))
+        self.latency_histogram(method, path).observe(elapsed_s)
+        recorder = active_recorder()
+        if recorder is not None:
+            recorder.record_http(method, path, response.status_code, elapsed_s)
+        return response
+
+    async def _dispatch(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        if self.pool is not None and self.pool.client is not None:
+            # The shared pool drops broken connections itself; it is closed by its owner.
+            return await self.pool.client.request(method, self.base_url + path, **kwargs)
+        if not self._pooled:
+            async with httpx.AsyncClient(timeout=self.timeout_s) as client:
+                return await client.request(method, self.base_url + path, **kwargs)
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout_s)
+        try:
+            return await self._client.request(method, self.base_url + path, **kwargs)
+        except httpx.TransportError:
+            # Restart the pool so the next call does not reuse a broken connection.
+            await self._close_client()
+            raise
 
     async def _aget(self, path: str) -> dict[str, Any]:
-        async with httpx.AsyncClient(timeout=self.timeout_s) as client:
-            r = await client.get(self.base_url + path)
+        r = await self._request("GET", path)
         r.raise_for_status()
         return r.json()
 
     async def _apost(self, path: str, payload: dict[str, Any] | None = None) -> None:
-        async with httpx.AsyncClient(timeout=self.timeout_s) as client:
-            r = await client.post(
-                self.base_url + path,
-                json=(payload if payload is not None else {}),
-            )
+        r = await self._request("POST", path, json=(payload if payload is not None else {}))
         r.raise_for_status()
 
     async def fetch_json_async(self, path: str) -> dict[str, Any]:
@@ -0,0 +1,82 @@
+import asyncio
+import ctypes
+import ctypes.util
+import logging
+import os
+import sys
+from dataclasses import dataclass
+
+LOG = logging.getLogger(__name__)
+
+# inotify(7) constants (include/uapi/linux/inotify.h)
+_IN_ATTRIB = 0x00000004
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_WATCH_MASK = _IN_ATTRIB | _IN_MOVED_TO | _IN_CREATE
+
+
+def _inotify_watch(directory: str) -> int | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError) as exc:
+        LOG.debug("inotify unavailable: %s", exc)
+        return None
+    if fd < 0:
+        return None
+    if libc.inotify_add_watch(fd, os.fsencode(directory), _IN_WATCH_MASK) < 0:
+        LOG.debug("inotify watch failed dir=%s errno=%d", directory, ctypes.get_errno())
+        os.close(fd)
+        return None
+    return fd
+
+
+@dataclass
+class DeviceNodeWatcher:
+    """Wait for a device node (e.g. ``/dev/cec0``) to exist and be read/write accessible.
+
+    Uses inotify on the parent directory when available, so a re-enumerated adapter is
+    picked up as soon as udev creates the node; falls back to periodic polling.
+    """
+
+    path: str
+    poll_interval_s: float = 1.0
+
+    def is_ready(self) -> bool:
+        return os.access(self.path, os.R_OK | os.W_OK)
+
+    async def wait_ready(self) -> None:
+        if self.is_ready():
+            return
+        fd = _inotify_watch(os.path.dirname(self.path) or ".")
+        if fd is None:
+            while not self.is_ready():
+                await asyncio.sleep(self.poll_interval_s)
+            return
+
+        loop = asyncio.get_running_loop()
+        changed = asyncio.Event()
+        loop.add_reader(fd, changed.set)
+        try:
+            # Re-check after the watch is armed: the node may have appeared in between.
+            while not self.is_ready():
+                try:
+                    await asyncio.wait_for(changed.wait(), self.poll_interval_s)
+                except asyncio.TimeoutError:
+                    continue
+                changed.clear()
+                self._drain(fd)
+        finally:
+            loop.remove_reader(fd)
+            os.close(fd)
+        LOG.info("device node is available: %s", self.path)
+
+    @staticmethod
+    def _drain(fd: int) -> None:
+        try:
+            while os.read(fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
@@ -0,0 +1,334 @@
+import asyncio
+import contextlib
+import json
+import logging
+import math
+import random
+import threading
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Iterator
+
+from devialetctl.application.ports import Target
+
+LOG = logging.getLogger(__name__)
+
+LatencyModel = Callable[[random.Random], float]
+
+_VOLUME_PATH = "/systems/current/sources/current/soundControl/volume"
+_GROUP_SOURCE_PATH = "/groups/current/sources/current"
+_READ_TIMEOUT_S = 30.0
+_MAX_HEADER_LINES = 64
+
+
+def fixed_latency(seconds: float) -> LatencyModel:
+    return lambda _rng: seconds
+
+
+def uniform_latency(low_s: float, high_s: float) -> LatencyModel:
+    return lambda rng: rng.uniform(low_s, high_s)
+
+
+def lognormal_latency(median_s: float, sigma: float = 0.5, cap_s: float = 5.0) -> LatencyModel:
+    """Long-tailed service time, as Wi-Fi speakers show (median ``median_s``)."""
+    return lambda rng: min(cap_s, rng.lognormvariate(math.log(median_s), sigma))
+
+
+@dataclass
+class FakeDevice:
+    device_id: str
+    name: str
+    model: str = "Phantom I"
+    role: str = "Mono"
+    serial: str = ""
+    is_system_leader: bool = True
+    # Assigned when served (0 asks the OS for a free port).
+    port: int = 0
+
+
+@dataclass
+class FakeSystem:
+    system_id: str
+    name: str
+    devices: list[FakeDevice]
+    group_id: str = "group-1"
+    volume: int = 30
+    muted: bool = False
+    volume_step: int = 1
+
+
+@dataclass
+class FaultRule:
+    """Injected failure for matching requests (``path``/``method`` None match any).
+
+    ``status`` answers with that HTTP error; ``drop`` closes the connection without
+    answering; ``stall_s`` delays the answer (to trip client timeouts). ``remaining``
+    bounds how many requests the rule hits, ``probability`` makes it random.
+    """
+
+    path: str | None = None
+    method: str | None = None
+    status: int = 503
+    drop: bool = False
+    stall_s: float = 0.0
+    probability: float = 1.0
+    remaining: int | None = None
+
+    def matches(self, method: str, path: str, rng: random.Random) -> bool:
+        if self.remaining is not None and self.remaining <= 0:
+            return False
+        if self.path is not None and self.path != path:
+            return False
+        if self.method is not None and self.method != method:
+            return False
+        if self.probability < 1.0 and rng.random() >= self.probability:
+            return False
+        if self.remaining is not None:
+            self.remaining -= 1
+        return True
+
+
+@dataclass
+class FakeRequest:
+    device_id: str
+    method: str
+    path: str
+    status: int
+
+
+@dataclass
+class FakePhantomServer:
+    """In-process fake of the Devialet IP Control API, one localhost port per device.
+
+    Serves the endpoints the gateway and topology use (volume, volumeUp/Down,
+    mute/unmute, ``/devices/current``, ``/systems/current``, ``/systems``) over
+    HTTP/1.1 keep-alive, with configurable latency and fault injection. Devices of a
+    system share its volume/mute state, like a stereo pair does.
+    """
+
+    systems: list[FakeSystem]
+    host: str = "127.0.0.1"
+    base_path: str = "/ipcontrol/v1"
+    latency: LatencyModel | None = None
+    endpoint_latency: dict[str, LatencyModel] = field(default_factory=dict)
+    faults: list[FaultRule] = field(default_factory=list)
+    seed: int | None = None
+    requests: list[FakeRequest] = field(default_factory=list)
+    connections: int = 0
+    _rng: random.Random = field(init=False, repr=False)
+    _servers: list[asyncio.AbstractServer] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._rng = random.Random(self.seed)
+
+    @classmethod
+    def single(cls, volume: int = 30, muted: bool = False, **options) -> "FakePhantomServer":
+        device = FakeDevice(device_id="device-1", name="Phantom", serial="SN0001")
+        system = FakeSystem(
+            system_id="system-1", name="Living Room", devices=[device], volume=volume, muted=muted
+        )
+        return cls(systems=[system], **options)
+
+    @property
+    def system(self) -> FakeSystem:
+        return self.systems[0]
+
+    def targets(self) -> list[Target]:
+        return [
+            Target(address=self.host, port=device.port, base_path=self.base_path, name=device.name)
+            for system in self.systems
+            for device in system.devices
+        ]
+
+    @contextlib.asynccontextmanager
+    async def serve(self) -> AsyncIterator["FakePhantomServer"]:
+        try:
+            for system in self.systems:
+                for device in system.devices:
+                    server = await asyncio.start_server(
+                        lambda r, w, s=system, d=device: self._handle(s, d, r, w),
+                        self.host,
+                        device.port,
+                    )
+                    device.port = server.sockets[0].getsockname()[1]
+                    self._servers.append(server)
+            yield self
+        finally:
+            servers, self._servers = self._servers, []
+            for server in servers:
+                server.close()
+            for server in servers:
+                await server.wait_closed()
+
+    @contextlib.contextmanager
+    def serve_in_thread(self) -> Iterator["FakePhantomServer"]:
+        """Serve from a background event loop, for synchronous callers (CLI, topology)."""
+        ready = threading.Event()
+        stop: dict[str, Callable[[], None]] = {}
+        failure: list[BaseException] = []
+
+        async def _run() -> None:
+            done = asyncio.Event()
+            loop = asyncio.get_running_loop()
+            stop["set"] = lambda: loop.call_soon_threadsafe(done.set)
+            async with self.serve():
+                ready.set()
+                await done.wait()
+
+        def _main() -> None:
+            try:
+                asyncio.run(_run())
+            except BaseException as exc:  # surfaced to the caller below
+                failure.append(exc)
+                ready.set()
+
+        thread = threading.Thread(target=_main, name="fake-phantom", daemon=True)
+        thread.start()
+        ready.wait()
+        if failure:
+            raise failure[0]
+        try:
+            yield self
+        finally:
+            stop["set"]()
+            thread.join()
+
+    async def _handle(
+        self,
+        system: FakeSystem,
+        device: FakeDevice,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        self.connections += 1
+        try:
+            while True:
+                request_line = await asyncio.wait_for(reader.readline(), _READ_TIMEOUT_S)
+                if not request_line:
+                    return
+                headers: dict[str, str] = {}
+                for _ in range(_MAX_HEADER_LINES):
+                    line = await asyncio.wait_for(reader.readline(), _READ_TIMEOUT_S)
+                    if line in {b"", b"\r\n", b"\n"}:
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length") or 0)
+                body = await reader.readexactly(length) if length else b""
+                parts = request_line.decode("latin-1").split()
+                method = parts[0] if parts else ""
+                path = parts[1].split("?", 1)[0] if len(parts) > 1 else ""
+                keep_alive = headers.get("connection", "").lower() != "close"
+                if not await self._respond(system, device, method, path, body, writer, keep_alive):
+                    return
+                await writer.drain()
+                if not keep_alive:
+                    return
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError) as exc:
+            LOG.debug("fake phantom connection closed: %s", exc)
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _respond(
+        self,
+        system: FakeSystem,
+        device: FakeDevice,
+        method: str,
+        path: str,
+        body: bytes,
+        writer: asyncio.StreamWriter,
+        keep_alive: bool,
+    ) -> bool:
+        """Answer one request; False when the connection must be dropped."""
+        relative = path[len(self.base_path) :] if path.startswith(self.base_path) else None
+        model = self.endpoint_latency.get(relative or "", self.latency)
+        if model is not None:
+            await asyncio.sleep(max(0.0, model(self._rng)))
+        fault = next(
+            (rule for rule in self.faults if rule.matches(method, relative or path, self._rng)),
+            None,
+        )
+        if fault is not None:
+            if fault.stall_s > 0:
+                await asyncio.sleep(fault.stall_s)
+            if fault.drop:
+                self.requests.append(FakeRequest(device.device_id, method, path, 0))
+                return False
+            status, payload = fault.status, {"error": {"code": "Injected"}}
+        elif relative is None:
+            status, payload = 404, {"error": {"code": "NotFound"}}
+        else:
+            status, payload = self._route(system, device, method, relative, body)
+        self.requests.append(FakeRequest(device.device_id, method, relative or path, status))
+        data = json.dumps(payload).encode("utf-8")
+        reason = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+        head = (
+            f"HTTP/1.1 {status} {reason.get(status, 'Error')}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + data)
+        return True
+
+    def _route(
+        self, system: FakeSystem, device: FakeDevice, method: str, path: str, body: bytes
+    ) -> tuple[int, dict]:
+        if method == "GET":
+            if path == "/devices/current":
+                return 200, {
+                    "deviceId": device.device_id,
+                    "deviceName": device.name,
+                    "model": device.model,
+                    "role": device.role,
+                    "serial": device.serial,
+                    "systemId": system.system_id,
+                    "groupId": system.group_id,
+                    "isSystemLeader": device.is_system_leader,
+                }
+            if path == "/systems/current":
+                return 200, self._system_info(system)
+            if path == "/systems":
+                grouped = [s for s in self.systems if s.group_id == system.group_id]
+                return 200, {"systems": [self._system_info(s) for s in grouped]}
+            if path == _VOLUME_PATH:
+                return 200, {"volume": system.volume}
+            if path == _GROUP_SOURCE_PATH:
+                return 200, {
+                    "muteState": "muted" if system.muted else "unmuted",
+                    "playingState": "playing",
+                }
+        elif method == "POST":
+            if path == _VOLUME_PATH:
+                try:
+                    volume = int(json.loads(body or b"{}")["volume"])
+                except (KeyError, TypeError, ValueError):
+                    return 400, {"error": {"code": "InvalidValue"}}
+                system.volume = max(0, min(100, volume))
+                return 200, {}
+            if path == f"{_VOLUME_PATH}Up":
+                system.volume = min(100, system.volume + system.volume_step)
+                return 200, {}
+            if path == f"{_VOLUME_PATH}Down":
+                system.volume = max(0, system.volume - system.volume_step)
+                return 200, {}
+            if path == f"{_GROUP_SOURCE_PATH}/playback/mute":
+                system.muted = True
+                return 200, {}
+            if path == f"{_GROUP_SOURCE_PATH}/playback/unmute":
+                system.muted = False
+                return 200, {}
+        known_gets = {"/devices/current", "/systems/current", "/systems", _GROUP_SOURCE_PATH}
+        if path in known_gets or path.startswith(_VOLUME_PATH) or "/playback/" in path:
+            return 405, {"error": {"code": "MethodNotAllowed"}}
+        return 404, {"error": {"code": "NotFound"}}
+
+    @staticmethod
+    def _system_info(system: FakeSystem) -> dict:
+        return {
+            "systemId": system.system_id,
+            "systemName": system.name,
+            "groupId": system.group_id,
+            "deviceIds": [device.device_id for device in system.devices],
+        }
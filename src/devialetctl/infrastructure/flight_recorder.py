@@ -0,0 +1,289 @@
+import abc
+import asyncio
+import contextlib
+import contextvars
+import json
+import logging
+import os
+import signal
+import struct
+import time
+from dataclasses import dataclass
+from enum import IntEnum
+from pathlib import Path
+from typing import Callable, Iterator
+
+LOG = logging.getLogger(__name__)
+
+# mono_ts, kernel_ts_ns, latency_s, status, endpoint id, kind, length, payload (padded to 48)
+RECORD = struct.Struct("<dQfHHBB16s6x")
+PAYLOAD_SIZE = 16
+
+
+class RecordKind(IntEnum):
+    CEC_RX = 1
+    CEC_TX = 2
+    CEC_TX_STATUS = 3
+    HTTP = 4
+    # Capture-file bookkeeping (see capture_file.py); never returned by readers.
+    SESSION = 5
+    ENDPOINT = 6
+
+
+@dataclass(frozen=True)
+class FlightRecord:
+    ts_s: float
+    kind: RecordKind
+    kernel_ts_ns: int = 0
+    status: int = 0
+    latency_s: float = 0.0
+    payload: bytes = b""
+    endpoint: str = ""
+    # Wall-clock time, known for capture files (not for the in-memory ring).
+    wall_s: float | None = None
+
+    def to_dict(self) -> dict:
+        data = {"ts_s": round(self.ts_s, 6), "kind": self.kind.name.lower()}
+        if self.wall_s is not None:
+            data["wall_s"] = round(self.wall_s, 6)
+        if self.kind == RecordKind.HTTP:
+            data.update(
+                endpoint=self.endpoint, status=self.status, latency_s=round(self.latency_s, 6)
+            )
+        else:
+            data["frame"] = ":".join(f"{byte:02X}" for byte in self.payload)
+            data["kernel_ts_ns"] = self.kernel_ts_ns
+            if self.kind != RecordKind.CEC_RX:
+                data["status"] = self.status
+        return data
+
+
+class FrameRecorder(abc.ABC):
+    """Record API shared by the in-memory ring, the capture file and their tee.
+
+    Subclasses store fixed ``RECORD`` entries in ``_append``; endpoint strings are
+    interned once per recorder and announced through ``_declare_endpoint``. Records
+    are stamped with ``clock`` (the daemon's, so virtual-time runs stay consistent).
+    """
+
+    def __init__(self, clock: Callable[[], float] | None = None) -> None:
+        self.clock = clock or time.monotonic
+        self.endpoints: dict[int, str] = {}
+        self._endpoint_ids: dict[str, int] = {}
+
+    def record_cec_rx(self, payload: bytes, rx_ts_ns: int = 0) -> None:
+        self._append(self.clock(), RecordKind.CEC_RX, payload, kernel_ts_ns=rx_ts_ns)
+
+    def record_cec_tx(self, payload: bytes, ok: bool) -> None:
+        # status: 1 when the kernel accepted the transmit, 0 when it refused it.
+        self._append(self.clock(), RecordKind.CEC_TX, payload, status=int(ok))
+
+    def record_cec_tx_status(self, payload: bytes, tx_status: int, tx_ts_ns: int) -> None:
+        self._append(
+            self.clock(),
+            RecordKind.CEC_TX_STATUS,
+            payload,
+            kernel_ts_ns=tx_ts_ns,
+            status=tx_status,
+        )
+
+    def record_http(self, method: str, path: str, status: int, latency_s: float) -> None:
+        """``status`` is the HTTP status code, or 0 when the request failed in transport."""
+        key = f"{method} {path}"
+        endpoint_id = self._endpoint_ids.get(key)
+        if endpoint_id is None:
+            endpoint_id = len(self._endpoint_ids)
+            self._endpoint_ids[key] = endpoint_id
+            self._declare_endpoint(endpoint_id, key)
+        self._append(
+            self.clock(),
+            RecordKind.HTTP,
+            status=status,
+            latency_s=latency_s,
+            endpoint_id=endpoint_id,
+        )
+
+    def _declare_endpoint(self, endpoint_id: int, endpoint: str) -> None:
+        self.endpoints[endpoint_id] = endpoint
+
+    @abc.abstractmethod
+    def _append(
+        self,
+        ts_s: float,
+        kind: RecordKind,
+        payload: bytes = b"",
+        kernel_ts_ns: int = 0,
+        status: int = 0,
+        latency_s: float = 0.0,
+        endpoint_id: int = 0,
+    ) -> None:
+        """Store one record; ``ts_s`` is a monotonic timestamp."""
+
+
+def pack_record(
+    buffer: bytearray,
+    offset: int,
+    ts_s: float,
+    kind: RecordKind,
+    payload: bytes,
+    kernel_ts_ns: int,
+    status: int,
+    latency_s: float,
+    endpoint_id: int,
+) -> None:
+    RECORD.pack_into(
+        buffer,
+        offset,
+        ts_s,
+        kernel_ts_ns,
+        latency_s,
+        status & 0xFFFF,
+        endpoint_id,
+        int(kind),
+        min(len(payload), PAYLOAD_SIZE),
+        payload,
+    )
+
+
+class FlightRecorder(FrameRecorder):
+    """Fixed-size ring of the most recent CEC frames and speaker requests.
+
+    Records are packed into one preallocated ``bytearray`` (48 bytes each), so
+    recording is a single ``struct.pack_into`` with no allocation per frame and can
+    stay on with logging at WARNING. Endpoint strings are interned once.
+    """
+
+    def __init__(self, capacity: int = 8192, clock: Callable[[], float] | None = None) -> None:
+        super().__init__(clock)
+        self.capacity = max(1, int(capacity))
+        self._buffer = bytearray(RECORD.size * self.capacity)
+        self._written = 0
+
+    def __len__(self) -> int:
+        return min(self._written, self.capacity)
+
+    @property
+    def total_recorded(self) -> int:
+        return self._written
+
+    def _append(
+        self,
+        ts_s: float,
+        kind: RecordKind,
+        payload: bytes = b"",
+        kernel_ts_ns: int = 0,
+        status: int = 0,
+        latency_s: float = 0.0,
+        endpoint_id: int = 0,
+    ) -> None:
+        offset = (self._written % self.capacity) * RECORD.size
+        pack_record(
+            self._buffer,
+            offset,
+            ts_s,
+            kind,
+            payload,
+            kernel_ts_ns,
+            status,
+            latency_s,
+            endpoint_id,
+        )
+        self._written += 1
+
+    def records(self) -> list[FlightRecord]:
+        """Buffered records, oldest first."""
+        count = len(self)
+        first = self._written - count
+        records = []
+        for index in range(first, self._written):
+            offset = (index % self.capacity) * RECORD.size
+            ts_s, kernel_ts_ns, latency_s, status, endpoint_id, kind, length, payload = (
+                RECORD.unpack_from(self._buffer, offset)
+            )
+            kind = RecordKind(kind)
+            records.append(
+                FlightRecord(
+                    ts_s=ts_s,
+                    kind=kind,
+                    kernel_ts_ns=kernel_ts_ns,
+                    status=status,
+                    latency_s=latency_s,
+                    payload=payload[:length],
+                    endpoint=self.endpoints.get(endpoint_id, "") if kind == RecordKind.HTTP else "",
+                )
+            )
+        return records
+
+    def dumps(self, **labels: str) -> str:
+        return "".join(
+            json.dumps({**labels, **record.to_dict()}) + "\n" for record in self.records()
+        )
+
+    def dump(self, path: str) -> int:
+        """Write the buffer as JSON lines (atomically); returns the record count."""
+        records = self.dumps()
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_name(f".{target.name}.tmp")
+        tmp_path.write_text(records, encoding="utf-8")
+        os.replace(tmp_path, target)
+        return records.count("\n")
+
+
+class RecorderTee(FrameRecorder):
+    """Feeds the same records (same timestamps, same endpoint ids) to several recorders."""
+
+    def __init__(self, recorders: list[FrameRecorder]) -> None:
+        super().__init__(recorders[0].clock)
+        self.recorders = recorders
+
+    def _declare_endpoint(self, endpoint_id: int, endpoint: str) -> None:
+        for recorder in self.recorders:
+            recorder._declare_endpoint(endpoint_id, endpoint)
+
+    def _append(self, *args, **kwargs) -> None:
+        for recorder in self.recorders:
+            recorder._append(*args, **kwargs)
+
+
+def combine_recorders(*recorders: FrameRecorder | None) -> FrameRecorder | None:
+    present = [recorder for recorder in recorders if recorder is not None]
+    if not present:
+        return None
+    return present[0] if len(present) == 1 else RecorderTee(present)
+
+
+_ACTIVE: contextvars.ContextVar[FrameRecorder | None] = contextvars.ContextVar(
+    "devialetctl_flight_recorder", default=None
+)
+
+
+def active_recorder() -> FrameRecorder | None:
+    return _ACTIVE.get()
+
+
+@contextlib.contextmanager
+def dump_on_signal(callback: Callable[[], None], signum: int = signal.SIGUSR1) -> Iterator[None]:
+    """Run ``callback`` on the event loop whenever ``signum`` arrives (best effort)."""
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signum, callback)
+    except (NotImplementedError, RuntimeError, ValueError) as exc:
+        # Not the main thread, or no signal support on this platform.
+        LOG.debug("flight recorder dump signal unavailable: %s", exc)
+        yield
+        return
+    try:
+        yield
+    finally:
+        loop.remove_signal_handler(signum)
+
+
+@contextlib.contextmanager
+def recording(recorder: FrameRecorder | None) -> Iterator[None]:
+    """Make ``recorder`` receive the gateway requests of the tasks started inside."""
+    token = _ACTIVE.set(recorder)
+    try:
+        yield
+    finally:
+        _ACTIVE.reset(token)
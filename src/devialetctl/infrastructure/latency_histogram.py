@@ -0,0 +1,44 @@
+import bisect
+from dataclasses import dataclass, field
+
+# Upper bounds in seconds: LAN round-trips land in the low buckets, timeouts at the top.
+DEFAULT_LATENCY_BUCKETS_S: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+
+@dataclass
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (Prometheus ``le`` semantics, cumulative on export)."""
+
+    bounds_s: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS_S
+    counts: list[int] = field(default_factory=list)
+    sum_s: float = 0.0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            # The last slot is the implicit +Inf bucket.
+            self.counts = [0] * (len(self.bounds_s) + 1)
+
+    def observe(self, value_s: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds_s, value_s)] += 1
+        self.sum_s += value_s
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        total = 0
+        buckets = []
+        for bound, count in zip((*self.bounds_s, float("inf")), self.counts):
+            total += count
+            buckets.append((bound, total))
+        return buckets
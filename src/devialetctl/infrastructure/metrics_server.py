@@ -0,0 +1,84 @@
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable
+
+LOG = logging.getLogger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+_READ_TIMEOUT_S = 5.0
+_MAX_HEADER_LINES = 64
+
+
+@dataclass
+class MetricsServer:
+    """Minimal HTTP/1.0 endpoint serving ``GET /metrics`` from the daemon's own loop.
+
+    The body is rendered on each scrape, so it costs nothing between scrapes and
+    needs no extra thread or dependency. Binds to localhost unless told otherwise.
+    """
+
+    render: Callable[[], str]
+    host: str = "127.0.0.1"
+    port: int = 9464
+    # Extra read-only debug documents (JSON lines), e.g. the flight recorder.
+    routes: dict[str, Callable[[], str]] = field(default_factory=dict)
+    scrapes: int = 0
+    _server: asyncio.AbstractServer | None = field(default=None, init=False, repr=False)
+
+    @contextlib.asynccontextmanager
+    async def serve(self) -> AsyncIterator["MetricsServer"]:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        # Port 0 asks the OS for a free port; report the real one.
+        self.port = self._server.sockets[0].getsockname()[1]
+        LOG.info("metrics endpoint: http://%s:%d/metrics", self.host, self.port)
+        try:
+            yield self
+        finally:
+            server, self._server = self._server, None
+            server.close()
+            await server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), _READ_TIMEOUT_S)
+            for _ in range(_MAX_HEADER_LINES):
+                line = await asyncio.wait_for(reader.readline(), _READ_TIMEOUT_S)
+                if line in {b"", b"\r\n", b"\n"}:
+                    break
+            parts = request_line.decode("latin-1").split()
+            method = parts[0] if parts else ""
+            path = parts[1].split("?", 1)[0] if len(parts) > 1 else ""
+            if method != "GET":
+                self._respond(writer, "405 Method Not Allowed", "method not allowed\n")
+            elif path == "/metrics":
+                self.scrapes += 1
+                self._respond(writer, "200 OK", self.render(), PROMETHEUS_CONTENT_TYPE)
+            elif path in self.routes:
+                self._respond(writer, "200 OK", self.routes[path](), "application/x-ndjson")
+            else:
+                self._respond(writer, "404 Not Found", "not found\n")
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError) as exc:
+            LOG.debug("metrics request aborted: %s", exc)
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    @staticmethod
+    def _respond(
+        writer: asyncio.StreamWriter,
+        status: str,
+        body: str,
+        content_type: str = "text/plain; charset=utf-8",
+    ) -> None:
+        payload = body.encode("utf-8")
+        head = (
+            f"HTTP/1.0 {status}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + payload)
@@ -0,0 +1,55 @@
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+LOG = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AudioStateSnapshot:
+    volume: int
+    muted: bool
+    vendor_state: int
+    # Which speaker the state belongs to (see ``target_identity``); None in old files.
+    target: str | None = None
+
+
+@dataclass
+class AudioStateStore:
+    """Last known speaker audio state, persisted across daemon restarts."""
+
+    path: str
+
+    def load(self) -> AudioStateSnapshot | None:
+        try:
+            data = json.loads(Path(self.path).read_text(encoding="utf-8"))
+            snapshot = AudioStateSnapshot(
+                volume=int(data["volume"]),
+                muted=bool(data["muted"]),
+                vendor_state=int(data.get("vendor_state", data["volume"])),
+                target=str(data["target"]) if data.get("target") is not None else None,
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as exc:
+            LOG.warning("ignoring unreadable audio state file %s: %s", self.path, exc)
+            return None
+        if not (0 <= snapshot.volume <= 100 and 0 <= snapshot.vendor_state <= 0xFF):
+            LOG.warning("ignoring out-of-range audio state in %s", self.path)
+            return None
+        return snapshot
+
+    def save(self, snapshot: AudioStateSnapshot) -> bool:
+        path = Path(self.path)
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(asdict(snapshot)), encoding="utf-8")
+            # Atomic replace: a crash mid-write never leaves a truncated state file.
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            LOG.warning("cannot persist audio state to %s: %s", self.path, exc)
+            return False
+        return True
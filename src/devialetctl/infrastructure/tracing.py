@@ -0,0 +1,304 @@
+import contextlib
+import contextvars
+import itertools
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, TextIO
+
+from devialetctl.domain.events import InputEvent
+from devialetctl.infrastructure.latency_histogram import LatencyHistogram
+
+LOG = logging.getLogger(__name__)
+
+
+@dataclass
+class TraceSpan:
+    name: str
+    start_s: float
+    end_s: float | None = None
+    error: str | None = None
+
+
+@dataclass
+class TraceTx:
+    frame: str
+    submitted_s: float
+    sent_s: float | None = None
+    ok: bool | None = None
+    tx_status: int | None = None
+    tx_ts_ns: int | None = None
+
+
+@dataclass
+class EventTrace:
+    """Timeline of one inbound CEC event: RX, queueing, speaker calls and the TX replies.
+
+    Daemon timestamps come from the tracer's clock (``time.monotonic()`` seconds when
+    live); ``rx_ts_ns``/``tx_ts_ns`` are the kernel's CLOCK_MONOTONIC stamps, so both
+    clocks can be compared directly.
+    """
+
+    trace_id: int
+    kind: str
+    received_s: float
+    rx_ts_ns: int | None = None
+    dequeued_s: float | None = None
+    handled_s: float | None = None
+    spans: list[TraceSpan] = field(default_factory=list)
+    tx: list[TraceTx] = field(default_factory=list)
+    # Spans opened under this trace read the same clock as the tracer that began it.
+    clock: Callable[[], float] = field(default=time.monotonic, repr=False, compare=False)
+
+    def stage_durations(self) -> dict[str, float]:
+        stages: dict[str, float] = {}
+        if self.rx_ts_ns is not None:
+            stages["kernel_to_daemon"] = max(0.0, self.received_s - self.rx_ts_ns / 1e9)
+        if self.dequeued_s is not None:
+            stages["queue_wait"] = self.dequeued_s - self.received_s
+        if self.handled_s is not None:
+            stages["handle"] = self.handled_s - (self.dequeued_s or self.received_s)
+        gateway_s = sum(s.end_s - s.start_s for s in self.spans if s.end_s is not None)
+        if self.spans:
+            stages["gateway"] = gateway_s
+        sent = [tx.sent_s for tx in self.tx if tx.sent_s is not None]
+        if sent:
+            stages["rx_to_tx"] = max(sent) - self.received_s
+        tx_ts = [tx.tx_ts_ns for tx in self.tx if tx.tx_ts_ns]
+        if tx_ts and self.rx_ts_ns is not None:
+            stages["kernel_rx_to_tx"] = (max(tx_ts) - self.rx_ts_ns) / 1e9
+        return stages
+
+    def to_dict(self) -> dict[str, Any]:
+        def offset(value: float | None) -> float | None:
+            return None if value is None else round(value - self.received_s, 6)
+
+        return {
+            "trace_id": self.trace_id,
+            "kind": self.kind,
+            "received_s": self.received_s,
+            "rx_ts_ns": self.rx_ts_ns,
+            "dequeued_s": offset(self.dequeued_s),
+            "handled_s": offset(self.handled_s),
+            "spans": [
+                {
+                    "name": span.name,
+                    "start_s": offset(span.start_s),
+                    "end_s": offset(span.end_s),
+                    "error": span.error,
+                }
+                for span in self.spans
+            ],
+            "tx": [
+                {
+                    "frame": tx.frame,
+                    "submitted_s": offset(tx.submitted_s),
+                    "sent_s": offset(tx.sent_s),
+                    "ok": tx.ok,
+                    "tx_status": tx.tx_status,
+                    "tx_ts_ns": tx.tx_ts_ns,
+                }
+                for tx in self.tx
+            ],
+            "stages": {name: round(value, 6) for name, value in self.stage_durations().items()},
+        }
+
+
+_CURRENT: contextvars.ContextVar[EventTrace | None] = contextvars.ContextVar(
+    "devialetctl_trace", default=None
+)
+
+
+def current_trace() -> EventTrace | None:
+    return _CURRENT.get()
+
+
+@contextlib.contextmanager
+def trace_span(name: str, clock: Callable[[], float] | None = None) -> Iterator[None]:
+    """Record a span on the current trace; free when nothing is being traced.
+
+    Spans are timed with the trace's clock unless ``clock`` is given.
+    """
+    trace = _CURRENT.get()
+    if trace is None:
+        yield
+        return
+    clock = clock or trace.clock
+    span = TraceSpan(name=name, start_s=clock())
+    trace.spans.append(span)
+    try:
+        yield
+    except BaseException as exc:
+        span.error = type(exc).__name__
+        raise
+    finally:
+        span.end_s = clock()
+
+
+@contextlib.contextmanager
+def untraced() -> Iterator[None]:
+    """Detach follow-up work (debounced reconciles, ...) from the triggering trace."""
+    token = _CURRENT.set(None)
+    try:
+        yield
+    finally:
+        _CURRENT.reset(token)
+
+
+@dataclass
+class TraceStageStats:
+    """Trace sink aggregating per-stage latency histograms (exported as metrics)."""
+
+    stages: dict[str, LatencyHistogram] = field(default_factory=dict)
+
+    def __call__(self, trace: EventTrace) -> None:
+        for stage, value_s in trace.stage_durations().items():
+            histogram = self.stages.get(stage)
+            if histogram is None:
+                histogram = LatencyHistogram()
+                self.stages[stage] = histogram
+            histogram.observe(value_s)
+
+
+@dataclass
+class JsonlTraceSink:
+    """Trace sink appending one JSON object per finished trace."""
+
+    path: str
+    _file: TextIO | None = field(default=None, init=False, repr=False)
+
+    def __call__(self, trace: EventTrace) -> None:
+        try:
+            if self._file is None:
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(json.dumps(trace.to_dict(), separators=(",", ":")) + "\n")
+            self._file.flush()
+        except OSError as exc:
+            LOG.warning("cannot write trace to %s: %s", self.path, exc)
+
+    def close(self) -> None:
+        file, self._file = self._file, None
+        if file is not None:
+            file.close()
+
+
+@dataclass
+class TracerStats:
+    started: int = 0
+    exported: int = 0
+    dropped: int = 0
+
+
+@dataclass
+class EventTracer:
+    """Builds one ``EventTrace`` per inbound CEC event and hands finished ones to sinks.
+
+    A trace is exported once its handler finished and every reply it transmitted got
+    its kernel TX status (or ``tx_wait_s`` passed). TX replies are matched to traces by
+    frame, in submission order, since the TX scheduler may send them later.
+    """
+
+    sinks: list[Callable[[EventTrace], None]] = field(default_factory=list)
+    clock: Callable[[], float] = time.monotonic
+    tx_wait_s: float = 1.0
+    # Events coalesced or dropped by the queue are never handled; forget them eventually.
+    abandon_s: float = 30.0
+    max_open: int = 256
+    kernel_tx_results: bool = False
+    stats: TracerStats = field(default_factory=TracerStats)
+    _ids: itertools.count = field(default_factory=lambda: itertools.count(1))
+    _open: list[EventTrace] = field(default_factory=list)
+
+    def begin(self, event: InputEvent) -> EventTrace:
+        self.flush()
+        trace = EventTrace(
+            trace_id=next(self._ids),
+            kind=event.kind.value,
+            received_s=self.clock(),
+            rx_ts_ns=event.rx_ts_ns,
+            clock=self.clock,
+        )
+        self.stats.started += 1
+        self._open.append(trace)
+        if len(self._open) > self.max_open:
+            self._open.pop(0)
+            self.stats.dropped += 1
+        return trace
+
+    @contextlib.contextmanager
+    def activate(self, trace: EventTrace | None) -> Iterator[None]:
+        token = _CURRENT.set(trace)
+        try:
+            yield
+        finally:
+            _CURRENT.reset(token)
+
+    def mark_dequeued(self, trace: EventTrace) -> None:
+        trace.dequeued_s = self.clock()
+
+    def finish(self, trace: EventTrace) -> None:
+        trace.handled_s = self.clock()
+        self.flush()
+
+    def record_tx_submit(self, frame: str) -> None:
+        trace = _CURRENT.get()
+        if trace is not None:
+            trace.tx.append(TraceTx(frame=frame.upper(), submitted_s=self.clock()))
+
+    def record_tx_sent(self, frame: str, ok: bool) -> None:
+        tx = self._pending_tx(frame.upper(), lambda tx: tx.sent_s is None)
+        if tx is not None:
+            tx.sent_s = self.clock()
+            tx.ok = ok
+
+    def record_tx_result(self, frame: str, tx_status: int, tx_ts_ns: int, ok: bool) -> None:
+        tx = self._pending_tx(
+            frame.upper(), lambda tx: tx.sent_s is not None and tx.tx_status is None
+        )
+        if tx is not None:
+            tx.tx_status = tx_status
+            tx.tx_ts_ns = tx_ts_ns
+            tx.ok = ok
+        self.flush()
+
+    def flush(self, force: bool = False) -> None:
+        now = self.clock()
+        still_open = []
+        for trace in self._open:
+            if force or self._is_complete(trace, now):
+                self._export(trace)
+            elif trace.handled_s is None and now - trace.received_s >= self.abandon_s:
+                self.stats.dropped += 1
+            else:
+                still_open.append(trace)
+        self._open = still_open
+
+    def _pending_tx(self, frame: str, wanted: Callable[[TraceTx], bool]) -> TraceTx | None:
+        for trace in self._open:
+            for tx in trace.tx:
+                if tx.frame == frame and wanted(tx):
+                    return tx
+        return None
+
+    def _is_complete(self, trace: EventTrace, now: float) -> bool:
+        if trace.handled_s is None:
+            return False
+        if now - trace.handled_s >= self.tx_wait_s:
+            return True
+        for tx in trace.tx:
+            if tx.sent_s is None:
+                return False
+            if self.kernel_tx_results and tx.ok and tx.tx_status is None:
+                return False
+        return True
+
+    def _export(self, trace: EventTrace) -> None:
+        self.stats.exported += 1
+        for sink in self.sinks:
+            try:
+                sink(trace)
+            except Exception as exc:
+                LOG.warning("trace sink failed: %s", exc)
@@ -0,0 +1,93 @@
+import asyncio
+import selectors
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+class VirtualClock:
+    """Monotonic seconds that only move when the event loop would otherwise sleep."""
+
+    def __init__(self, start_s: float = 0.0) -> None:
+        self._now_s = start_s
+
+    def __call__(self) -> float:
+        return self._now_s
+
+    def advance(self, seconds: float) -> None:
+        if seconds > 0:
+            self._now_s += seconds
+
+
+class _VirtualTimeSelector(selectors.BaseSelector):
+    # Ready file descriptors (the loop's self-pipe, in-memory socket pairs) are served
+    # at once; a wait for the next timer jumps the clock instead of blocking.
+    def __init__(self, clock: VirtualClock) -> None:
+        self._selector = selectors.DefaultSelector()
+        self._clock = clock
+
+    def register(self, fileobj, events, data=None):
+        return self._selector.register(fileobj, events, data)
+
+    def unregister(self, fileobj):
+        return self._selector.unregister(fileobj)
+
+    def modify(self, fileobj, events, data=None):
+        return self._selector.modify(fileobj, events, data)
+
+    def select(self, timeout=None):
+        ready = self._selector.select(0)
+        if ready or timeout is not None and timeout <= 0:
+            return ready
+        if timeout is None:
+            # No timer pending: only another thread can wake the loop up.
+            return self._selector.select(None)
+        self._clock.advance(timeout)
+        return []
+
+    def close(self) -> None:
+        self._selector.close()
+
+    def get_map(self):
+        return self._selector.get_map()
+
+
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    """Deterministic asyncio loop running on a ``VirtualClock``.
+
+    ``asyncio.sleep``, ``wait_for`` timeouts and ``call_later`` complete as soon as
+    nothing else is runnable, with ``loop.time()`` advanced to their deadline, so an
+    hour of daemon timers runs in milliseconds. Pass ``loop.time`` as the clock of
+    ``DaemonRunner``/``EventPolicy`` so their windows follow the same time. Real I/O
+    with latency (sockets to other hosts or threads) is not simulated: the clock would
+    jump while it is in flight.
+    """
+
+    def __init__(self, start_s: float = 0.0) -> None:
+        self.clock = VirtualClock(start_s)
+        super().__init__(selector=_VirtualTimeSelector(self.clock))
+
+    def time(self) -> float:
+        return self.clock()
+
+    def run(self, main: Coroutine[Any, Any, T]) -> T:
+        """Like ``asyncio.run`` on this loop: run ``main``, then cancel leftovers and close."""
+        asyncio.set_event_loop(self)
+        try:
+            return self.run_until_complete(main)
+        finally:
+            try:
+                pending = [task for task in asyncio.all_tasks(self) if not task.done()]
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    self.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                self.run_until_complete(self.shutdown_asyncgens())
+            finally:
+                asyncio.set_event_loop(None)
+                self.close()
+
+
+def run_virtual(main: Coroutine[Any, Any, T], start_s: float = 0.0) -> T:
+    """Run ``main`` on a fresh ``VirtualTimeEventLoop`` and return its result."""
+    return VirtualTimeEventLoop(start_s).run(main)
@@ -0,0 +1,299 @@
+import dataclasses
+import math
+import platform
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from devialetctl.application.daemon import DaemonRunner
+from devialetctl.application.replay import offline_config, run_replay
+from devialetctl.domain.events import InputEventType
+from devialetctl.infrastructure.cec_replay import ReplayFrame
+from devialetctl.infrastructure.config import DaemonConfig
+from devialetctl.infrastructure.devialet_gateway import DevialetHttpGateway
+from devialetctl.infrastructure.fake_phantom import (
+    FakePhantomServer,
+    LatencyModel,
+    fixed_latency,
+    lognormal_latency,
+)
+from devialetctl.infrastructure.flight_recorder import RecordKind
+from devialetctl.interfaces.trace_analysis import (
+    CaptureColumns,
+    key_to_speaker_latencies,
+    latency_summary,
+    load_capture_columns,
+)
+
+BENCH_SCHEMA_VERSION = 2
+_VOLUME_UP_FRAME = "05:44:41"
+_VOLUME_DOWN_FRAME = "05:44:42"
+_RELEASE_FRAME = "05:45"
+# TVs send the release ~50-100 ms after a short press.
+_RELEASE_AFTER_S = 0.06
+_STEP_KINDS = (InputEventType.VOLUME_UP, InputEventType.VOLUME_DOWN)
+
+
+@dataclass(frozen=True)
+class BenchScenario:
+    name: str
+    description: str
+    frames: list[ReplayFrame]
+
+
+def key_presses(count: int, interval_s: float = 0.35, up: bool = True) -> BenchScenario:
+    """Separate short presses: press, release, pause."""
+    frame = _VOLUME_UP_FRAME if up else _VOLUME_DOWN_FRAME
+    frames = []
+    for index in range(count):
+        offset_s = index * interval_s
+        frames.append(ReplayFrame(offset_s, frame))
+        frames.append(ReplayFrame(offset_s + _RELEASE_AFTER_S, _RELEASE_FRAME))
+    return BenchScenario(
+        "key-press", f"{count} short volume presses every {interval_s * 1000:.0f} ms", frames
+    )
+
+
+def key_holds(
+    holds: int, hold_s: float = 1.5, repeat_s: float = 0.2, gap_s: float = 0.8, up: bool = True
+) -> BenchScenario:
+    """Held keys: the TV repeats USER_CONTROL_PRESSED every ``repeat_s`` until release."""
+    frame = _VOLUME_UP_FRAME if up else _VOLUME_DOWN_FRAME
+    repeats = max(1, int(hold_s / repeat_s))
+    frames = []
+    offset_s = 0.0
+    for _ in range(holds):
+        for index in range(repeats):
+            frames.append(ReplayFrame(offset_s + index * repeat_s, frame))
+        offset_s += repeats * repeat_s
+        frames.append(ReplayFrame(offset_s, _RELEASE_FRAME))
+        offset_s += gap_s
+    return BenchScenario(
+        "key-hold",
+        f"{holds} holds of {hold_s:g}s repeating every {repeat_s * 1000:.0f} ms",
+        frames,
+    )
+
+
+def volume_levels(
+    count: int, interval_s: float = 0.25, start: int = 20, step: int = 2
+) -> BenchScenario:
+    """Absolute SET_AUDIO_VOLUME_LEVEL (0x73) sweep, as from a TV volume slider."""
+    frames = [
+        ReplayFrame(index * interval_s, f"05:73:{max(0, min(100, start + index * step)):02X}")
+        for index in range(count)
+    ]
+    return BenchScenario(
+        "set-volume-level",
+        f"{count} SET_AUDIO_VOLUME_LEVEL steps every {interval_s * 1000:.0f} ms",
+        frames,
+    )
+
+
+def key_flood(count: int, interval_s: float = 0.02) -> BenchScenario:
+    """Presses faster than the speaker answers: exercises the policy and queue coalescing."""
+    frames = [ReplayFrame(index * interval_s, _VOLUME_UP_FRAME) for index in range(count)]
+    frames.append(ReplayFrame(count * interval_s, _RELEASE_FRAME))
+    return BenchScenario(
+        "key-flood", f"{count} presses every {interval_s * 1000:.0f} ms, no release", frames
+    )
+
+
+def default_scenarios() -> list[BenchScenario]:
+    return [key_presses(20), key_holds(3), volume_levels(20), key_flood(50)]
+
+
+def expected_volume(frames: list[ReplayFrame], initial: int) -> int:
+    """Speaker volume if every volume key and level frame was applied, in order."""
+    volume = initial
+    for replay in frames:
+        if replay.frame == _VOLUME_UP_FRAME:
+            volume = min(100, volume + 1)
+        elif replay.frame == _VOLUME_DOWN_FRAME:
+            volume = max(0, volume - 1)
+        elif replay.frame.startswith("05:73:"):
+            volume = max(0, min(100, int(replay.frame[6:8], 16) & 0x7F))
+    return volume
+
+
+def speaker_latency(rtt_ms: float, jitter: float = 0.0) -> LatencyModel:
+    """Service time of the fake speaker: fixed, or lognormal around ``rtt_ms`` when jittered."""
+    if jitter <= 0:
+        return fixed_latency(rtt_ms / 1000.0)
+    return lognormal_latency(rtt_ms / 1000.0, sigma=jitter)
+
+
+@dataclass
+class _ScenarioRun:
+    runner: DaemonRunner
+    columns: CaptureColumns
+    final_volume: int
+    wall_s: float
+
+
+def _play_scenario(
+    cfg: DaemonConfig,
+    scenario: BenchScenario,
+    latency: LatencyModel,
+    initial_volume: int,
+    seed: int,
+    settle_s: float,
+    speed: float,
+) -> _ScenarioRun:
+    server = FakePhantomServer.single(volume=initial_volume, latency=latency, seed=seed)
+    with tempfile.TemporaryDirectory(prefix="devialetctl-bench-") as tmp:
+        capture = str(Path(tmp) / "bench.bin")
+        with server.serve_in_thread():
+            target = server.targets()[0]
+            gateway = DevialetHttpGateway(
+                address=target.address, port=target.port, base_path=target.base_path
+            )
+            started = time.perf_counter()
+            runner, _adapter = run_replay(
+                offline_config(
+                    cfg,
+                    capture_file=capture,
+                    flight_recorder_size=cfg.flight_recorder_size,
+                ),
+                scenario.frames,
+                gateway,
+                speed=speed,
+                settle_s=settle_s,
+            )
+            wall_s = time.perf_counter() - started
+        columns = load_capture_columns(capture)
+    return _ScenarioRun(runner, columns, server.system.volume, wall_s)
+
+
+def _busy_s(columns: CaptureColumns) -> float:
+    # From the first CEC frame in to the last frame or request out.
+    rx_ts = [ts for ts, kind in zip(columns.ts_s, columns.kind) if kind == RecordKind.CEC_RX]
+    out_ts = [
+        ts
+        for ts, kind in zip(columns.ts_s, columns.kind)
+        if kind in (RecordKind.CEC_TX, RecordKind.HTTP)
+    ]
+    return (max(out_ts) - min(rx_ts)) if rx_ts and out_ts else 0.0
+
+
+def _failed_writes(columns: CaptureColumns) -> int:
+    return sum(
+        1
+        for endpoint, status in zip(columns.endpoint, columns.status)
+        if endpoint >= 0
+        and columns.endpoints[endpoint].startswith("POST ")
+        and (status == 0 or status >= 400)
+    )
+
+
+def dropped_steps(runner: DaemonRunner, failed_writes: int) -> int:
+    """Volume steps the daemon discarded or failed to apply, from its own counters.
+
+    Counts volume keys dropped by the dedupe/rate policy, events the full handler
+    queue discarded, and speaker writes that failed.
+    """
+    by_kind = runner.activity_stats.policy_drops_by_kind
+    policy = sum(by_kind.get(kind.value, 0) for kind in _STEP_KINDS)
+    return policy + runner.queue_stats.dropped + failed_writes
+
+
+def run_daemon_benchmark(
+    cfg: DaemonConfig,
+    scenario: BenchScenario,
+    rtt_ms: float = 30.0,
+    jitter: float = 0.0,
+    initial_volume: int = 30,
+    seed: int = 0,
+    settle_s: float = 1.0,
+) -> dict[str, Any]:
+    """Play ``scenario`` into a ``DaemonRunner`` talking HTTP to a local fake speaker.
+
+    The runner records a capture file, which is then analyzed like ``trace analyze``
+    does: key-to-write latency is measured from the key's arrival to the completed
+    speaker write (``POST``) it caused. Latency and dropped steps come from a run at
+    the scenario's pace; throughput from a second run with the frames back to back.
+    """
+    latency_model = speaker_latency(rtt_ms, jitter)
+    paced = _play_scenario(cfg, scenario, latency_model, initial_volume, seed, settle_s, speed=1.0)
+    unpaced = _play_scenario(
+        cfg, scenario, latency_model, initial_volume, seed, settle_s, speed=math.inf
+    )
+
+    columns = paced.columns
+    rx = sum(1 for kind in columns.kind if kind == RecordKind.CEC_RX)
+    http = [columns.endpoints[e] for e in columns.endpoint if e >= 0]
+    writes = sum(1 for endpoint in http if endpoint.startswith("POST "))
+    failed_writes = _failed_writes(columns)
+    keys = sum(
+        1
+        for replay in scenario.frames
+        if replay.frame in (_VOLUME_UP_FRAME, _VOLUME_DOWN_FRAME) or replay.frame[3:5] == "73"
+    )
+    expected = expected_volume(scenario.frames, initial_volume)
+    latency = latency_summary(key_to_speaker_latencies(columns))
+    latency.pop("histogram", None)
+    unpaced_rx = sum(1 for kind in unpaced.columns.kind if kind == RecordKind.CEC_RX)
+    unpaced_busy_s = _busy_s(unpaced.columns)
+    return {
+        "scenario": scenario.name,
+        "description": scenario.description,
+        "speaker_rtt_ms": rtt_ms,
+        "speaker_jitter": jitter,
+        "events": rx,
+        "key_presses": keys,
+        "wall_s": round(paced.wall_s, 6),
+        "busy_s": round(_busy_s(columns), 6),
+        "throughput": {
+            "events": unpaced_rx,
+            "busy_s": round(unpaced_busy_s, 6),
+            "events_per_s": round(unpaced_rx / unpaced_busy_s, 3) if unpaced_busy_s > 0 else None,
+            "dropped_steps": dropped_steps(unpaced.runner, _failed_writes(unpaced.columns)),
+        },
+        "key_to_write": latency,
+        "http_requests": len(http),
+        "speaker_writes": writes,
+        "failed_writes": failed_writes,
+        "requests_per_key": round(len(http) / keys, 3) if keys else None,
+        "writes_per_key": round(writes / keys, 3) if keys else None,
+        "cec_tx": sum(1 for kind in columns.kind if kind == RecordKind.CEC_TX),
+        "volume": {"initial": initial_volume, "expected": expected, "final": paced.final_volume},
+        "dropped_steps": dropped_steps(paced.runner, failed_writes),
+        "policy_drops": paced.runner.activity_stats.policy_drops,
+        "queue": dataclasses.asdict(paced.runner.queue_stats),
+    }
+
+
+def run_daemon_benchmarks(
+    cfg: DaemonConfig,
+    scenarios: list[BenchScenario],
+    **options: Any,
+) -> dict[str, Any]:
+    return {
+        "schema": BENCH_SCHEMA_VERSION,
+        "kind": "daemon",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [run_daemon_benchmark(cfg, scenario, **options) for scenario in scenarios],
+    }
+
+
+def render_daemon_benchmark_lines(report: dict[str, Any]) -> list[str]:
+    lines = []
+    for row in report["results"]:
+        latency = row["key_to_write"]
+        timing = (
+            f"p50={latency['p50_s'] * 1000:.1f}ms p90={latency['p90_s'] * 1000:.1f}ms "
+            f"p99={latency['p99_s'] * 1000:.1f}ms"
+            if latency["count"]
+            else "no writes"
+        )
+        lines.append(
+            f"{row['scenario']}: {row['events']} events, "
+            f"{row['throughput']['events_per_s']} events/s unpaced, "
+            f"key->write {timing}, {row['requests_per_key']} req/key, "
+            f"dropped steps={row['dropped_steps']} (policy drops={row['policy_drops']}, "
+            f"coalesced={row['queue']['coalesced']})"
+        )
+    return lines
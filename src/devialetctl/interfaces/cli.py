@@ -1,4 +1,5 @@
 import argparse
+import asyncio
 import dataclasses
 import json
 import logging
@@ -6,16 +7,20 @@ import os
 import sys
 
 from devialetctl.application.daemon import DaemonRunner
+from devialetctl.application.deferred_gateway import DeferredVolumeGateway
+from devialetctl.application.fleet import FleetMember, FleetPoller, FleetStateChange
+from devialetctl.application.multi_daemon import MultiDaemonRunner
 from devialetctl.application.ports import Target
 from devialetctl.application.service import VolumeService
-from devialetctl.infrastructure.config import load_config
-from devialetctl.infrastructure.devialet_gateway import DevialetHttpGateway
+from devialetctl.infrastructure.config import CecBinding, load_config, target_identity
+from devialetctl.infrastructure.devialet_gateway import DevialetHttpGateway, SharedHttpPool
 from devialetctl.infrastructure.mdns_gateway import MdnsDiscoveryGateway
 from devialetctl.infrastructure.upnp_gateway import UpnpDiscoveryGateway
 from devialetctl.interfaces.topology import (
     build_topology_tree,
     pick_target_by_system_name,
     render_topology_tree_lines,
+    system_targets,
 )
 
 LOG = logging.getLogger(__name__)
@@ -76,15 +81,106 @@ def _target_from_resolved(resolved: _EffectiveOptions) -> Target:
             name="manual",
         )
     services = _discover_targets(timeout_s=resolved.discover_timeout)
-    if resolved.system is not None:
+    return _target_from_services(services, resolved.system)
+
+
+def _target_from_services(services: list[Target], system: str | None) -> Target:
+    if system is not None:
         return pick_target_by_system_name(
             services,
-            resolved.system,
+            system,
             gateway_factory=DevialetHttpGateway,
         )
     return _pick(services)
 
 
+def _gateway_for_target(target: Target) -> DevialetHttpGateway:
+    return DevialetHttpGateway(target.address, target.port, target.base_path)
+
+
+def _daemon_gateway(
+    args, resolved: _EffectiveOptions
+) -> DevialetHttpGateway | DeferredVolumeGateway:
+    if args.input != "cec" or resolved.ip:
+        return _gateway_for_target(_target_from_resolved(resolved))
+
+    # Discovery and --system probing can take seconds; resolve them off-loop so the
+    # daemon claims CEC and answers the TV's ARC/system-audio handshake meanwhile.
+    async def _resolve() -> DevialetHttpGateway:
+        target = await asyncio.to_thread(_target_from_resolved, resolved)
+        return _gateway_for_target(target)
+
+    return DeferredVolumeGateway(resolve=_resolve)
+
+
+def _multi_daemon_runner(cfg, resolved: _EffectiveOptions) -> MultiDaemonRunner:
+    pool = SharedHttpPool()
+    discovery: list[asyncio.Future] = []
+
+    async def _services() -> list[Target]:
+        # One mDNS/UPnP pass serves every binding that selects its system by name.
+        if not discovery:
+            discovery.append(
+                asyncio.ensure_future(
+                    asyncio.to_thread(_discover_targets, resolved.discover_timeout)
+                )
+            )
+        return await asyncio.shield(discovery[0])
+
+    def _resolver(binding: CecBinding):
+        async def _resolve() -> DevialetHttpGateway:
+            if binding.ip:
+                target = Target(binding.ip, binding.port, binding.base_path, name="manual")
+            elif binding.system is None and resolved.ip:
+                target = _target_from_resolved(resolved)
+            else:
+                services = await _services()
+                target = await asyncio.to_thread(
+                    _target_from_services, services, binding.system or resolved.system
+                )
+            return pool.gateway(target.address, target.port, target.base_path)
+
+        return _resolve
+
+    runners = [
+        DaemonRunner(
+            cfg=cfg.for_binding(binding),
+            gateway=DeferredVolumeGateway(resolve=_resolver(binding)),
+        )
+        for binding in cfg.bindings
+    ]
+    return MultiDaemonRunner(
+        runners=runners,
+        shared_session=pool.session,
+        metrics_host=cfg.metrics_host,
+        metrics_port=cfg.metrics_port,
+    )
+
+
+def _print_fleet_change(change: FleetStateChange) -> None:
+    print(json.dumps(dataclasses.asdict(change), ensure_ascii=False), flush=True)
+
+
+async def _run_fleet(targets: list[Target], interval_s: float, per_host_limit: int) -> None:
+    pool = SharedHttpPool()
+    members = [
+        FleetMember(
+            name=target.name,
+            host=target.address,
+            gateway=pool.gateway(target.address, target.port, target.base_path),
+        )
+        for target in targets
+    ]
+    poller = FleetPoller(
+        members=members,
+        publish=_print_fleet_change,
+        interval_s=interval_s,
+        per_host_limit=per_host_limit,
+    )
+    async with pool.session():
+        await poller.run()
+
+
 def _configure_logging(level: str) -> None:
     logging.basicConfig(
         level=getattr(logging, level.upper(), logging.INFO),
@@ -96,21 +192,146 @@ def _configure_logging(level: str) -> None:
     logging.getLogger("httpcore").setLevel(logging.WARNING)
 
 
+def _positive_float(value: str) -> float:
+    number = float(value)
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0: {value}")
+    return number
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0: {value}")
+    return number
+
+
+def _non_negative_float(value: str) -> float:
+    number = float(value)
+    if not number >= 0:
+        raise argparse.ArgumentTypeError(f"must not be negative: {value}")
+    return number
+
+
+def _port(value: str) -> int:
+    # Same range as the config file's metrics_port (0 picks a free port).
+    number = int(value)
+    if not 0 <= number <= 65535:
+        raise argparse.ArgumentTypeError(f"must be a port between 0 and 65535: {value}")
+    return number
+
+
 def _validate_target_selection_args(parser: argparse.ArgumentParser, args) -> None:
     if args.ip and args.system:
         parser.error(
             "--ip and --system are not compatible: "
             "--ip disables discovery while --system requires discovery."
         )
-    if args.cmd in {"list", "tree"} and args.ip:
+    if args.cmd in {"list", "tree", "fleet"} and args.ip:
         parser.error(f"--ip is not supported with '{args.cmd}': this command is discovery-based.")
-    if args.cmd in {"list", "tree"} and args.system:
+    if args.cmd in {"list", "tree", "fleet"} and args.system:
         parser.error(
             f"--system is not supported with '{args.cmd}': "
             "this command already lists discovered systems."
         )
 
 
+def _replay_capture(args, cfg) -> None:
+    # Offline tooling is imported on demand so everyday commands start fast.
+    from devialetctl.application.replay import replay_session
+    from devialetctl.infrastructure.cec_replay import load_replay_frames
+
+    try:
+        inbound, expected = load_replay_frames(args.path)
+    except (OSError, ValueError) as exc:
+        print(f"Trace error: {exc}", file=sys.stderr)
+        raise SystemExit(2)
+    replay_cfg = cfg
+    if args.cec_vendor_compat is not None:
+        replay_cfg = dataclasses.replace(cfg, cec_vendor_compat=args.cec_vendor_compat)
+    report = replay_session(
+        replay_cfg, inbound, expected, speed=args.speed, virtual_time=args.virtual_time
+    )
+    if args.trace_json:
+        print(json.dumps(report.to_dict(), indent=2, ensure_ascii=False))
+    else:
+        print(
+            f"replayed {report.inbound} frames in {report.duration_s:.3f}s: "
+            f"{len(report.sent)} replies, {len(report.expected)} recorded"
+        )
+        for frame in report.missing:
+            print(f"  missing    {frame}")
+        for frame in report.unexpected:
+            print(f"  unexpected {frame}")
+    if not report.ok:
+        raise SystemExit(1)
+
+
+def _run_daemon_benchmark(args, cfg) -> None:
+    from devialetctl.interfaces.benchmark import (
+        default_scenarios,
+        render_daemon_benchmark_lines,
+        run_daemon_benchmarks,
+    )
+
+    available = default_scenarios()
+    unknown = sorted(set(args.scenarios or ()) - {scenario.name for scenario in available})
+    if unknown:
+        names = ", ".join(scenario.name for scenario in available)
+        print(
+            f"Bench error: unknown scenario(s): {', '.join(unknown)} (choose from {names})",
+            file=sys.stderr,
+        )
+        raise SystemExit(2)
+    scenarios = [
+        scenario for scenario in available if not args.scenarios or scenario.name in args.scenarios
+    ]
+    report = run_daemon_benchmarks(cfg, scenarios, rtt_ms=args.rtt_ms, jitter=args.jitter)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+            file.write("\n")
+    if args.bench_json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return
+    for line in render_daemon_benchmark_lines(report):
+        print(line)
+
+
+def _run_microbenchmarks(args) -> None:
+    from devialetctl.interfaces.microbench import (
+        compare_microbenchmarks,
+        render_microbenchmark_lines,
+        run_microbenchmarks,
+    )
+
+    try:
+        baseline = None
+        if args.baseline:
+            with open(args.baseline, encoding="utf-8") as file:
+                baseline = json.load(file)
+        report = run_microbenchmarks(args.only, min_time_s=args.min_time)
+    except (OSError, ValueError) as exc:
+        print(f"Bench error: {exc}", file=sys.stderr)
+        raise SystemExit(2)
+    comparison = (
+        compare_microbenchmarks(report, baseline, args.threshold) if baseline is not None else None
+    )
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+            file.write("\n")
+    if args.bench_json:
+        if comparison is not None:
+            report = {**report, "comparison": comparison}
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        for line in render_microbenchmark_lines(report, comparison):
+            print(line)
+    if comparison is not None and any(row["regressed"] for row in comparison):
+        raise SystemExit(1)
+
+
 def _dispatch_command(args, cfg, resolved: _EffectiveOptions) -> None:
     if args.cmd == "list":
         services = _discover_targets(timeout_s=resolved.discover_timeout)
@@ -134,8 +355,52 @@ def _dispatch_command(args, cfg, resolved: _EffectiveOptions) -> None:
             print(line)
         return
 
-    target = _target_from_resolved(resolved)
-    gateway = DevialetHttpGateway(target.address, target.port, target.base_path)
+    if args.cmd == "fleet":
+        services = _discover_targets(timeout_s=resolved.discover_timeout)
+        targets = (
+            system_targets(build_topology_tree(services, gateway_factory=DevialetHttpGateway))
+            if services
+            else []
+        )
+        if not targets:
+            print("No service detected.")
+            return
+        try:
+            asyncio.run(_run_fleet(targets, args.interval, args.per_host_limit))
+        except KeyboardInterrupt:
+            return
+        return
+
+    if args.cmd == "trace" and args.trace_cmd == "replay":
+        _replay_capture(args, cfg)
+        return
+
+    if args.cmd == "trace":
+        from devialetctl.interfaces.trace_analysis import (
+            analyze_capture,
+            render_capture_report_lines,
+        )
+
+        try:
+            reports = [analyze_capture(path) for path in args.paths]
+        except (OSError, ValueError) as exc:
+            print(f"Trace error: {exc}", file=sys.stderr)
+            raise SystemExit(2)
+        if args.trace_json:
+            print(json.dumps(reports, indent=2, ensure_ascii=False))
+            return
+        for report in reports:
+            for line in render_capture_report_lines(report):
+                print(line)
+        return
+
+    if args.cmd == "bench" and args.bench_cmd == "micro":
+        _run_microbenchmarks(args)
+        return
+
+    if args.cmd == "bench":
+        _run_daemon_benchmark(args, cfg)
+        return
 
     if args.cmd == "daemon":
         try:
@@ -150,7 +415,21 @@ def _dispatch_command(args, cfg, resolved: _EffectiveOptions) -> None:
                     if args.cec_vendor_compat is not None
                     else cfg.cec_vendor_compat
                 ),
+                metrics_port=(
+                    args.metrics_port if args.metrics_port is not None else cfg.metrics_port
+                ),
+                trace_file=args.trace_file if args.trace_file is not None else cfg.trace_file,
+                capture_file=(
+                    args.capture_file if args.capture_file is not None else cfg.capture_file
+                ),
+                state_target=target_identity(resolved.ip, resolved.port, resolved.system),
             )
+            if args.input == "cec" and daemon_cfg.bindings:
+                if args.cec_device is not None:
+                    raise ValueError("--cec-device cannot be combined with configured bindings")
+                _multi_daemon_runner(daemon_cfg, resolved).run_forever()
+                return
+            gateway = _daemon_gateway(args, resolved)
             runner = DaemonRunner(cfg=daemon_cfg, gateway=gateway)
             runner.run_forever(input_name=args.input)
             return
@@ -160,6 +439,7 @@ def _dispatch_command(args, cfg, resolved: _EffectiveOptions) -> None:
             print(f"Daemon error: {exc}", file=sys.stderr)
             raise SystemExit(2)
 
+    gateway = _gateway_for_target(_target_from_resolved(resolved))
     client = VolumeService(gateway)
     try:
         if args.cmd == "systems":
@@ -203,6 +483,11 @@ def main() -> None:
     sub.add_parser("list")
     tree = sub.add_parser("tree")
     tree.add_argument("--json", action="store_true", dest="tree_json")
+    fleet = sub.add_parser("fleet", help="Track volume/mute of every discovered system.")
+    fleet.add_argument(
+        "--interval", type=_positive_float, default=5.0, help="Poll period per system (s)."
+    )
+    fleet.add_argument("--per-host-limit", type=_positive_int, default=1)
     sub.add_parser("systems")
     sub.add_parser("getvol")
     sub.add_parser("volup")
@@ -211,6 +496,83 @@ def main() -> None:
     set_parser = sub.add_parser("setvol")
     set_parser.add_argument("value", type=int)
 
+    trace = sub.add_parser("trace", help="Inspect CEC/HTTP captures.")
+    trace_sub = trace.add_subparsers(dest="trace_cmd", required=True)
+    analyze = trace_sub.add_parser(
+        "analyze", help="Latency percentiles and per-opcode stats of capture files."
+    )
+    analyze.add_argument("paths", nargs="+", help="Capture files (daemon --capture-file).")
+    analyze.add_argument("--json", action="store_true", dest="trace_json")
+    replay = trace_sub.add_parser(
+        "replay", help="Feed a capture's CEC frames to the daemon and diff its replies."
+    )
+    replay.add_argument("path", help="Capture file (daemon --capture-file).")
+    replay.add_argument(
+        "--speed",
+        type=_positive_float,
+        default=1.0,
+        help="Playback speed factor (inf: no pacing).",
+    )
+    replay.add_argument(
+        "--cec-vendor-compat", choices=["none", "samsung"], default=None, dest="cec_vendor_compat"
+    )
+    replay.add_argument(
+        "--virtual-time",
+        action="store_true",
+        help="Keep the recorded timing on a simulated clock instead of waiting it out.",
+    )
+    replay.add_argument("--json", action="store_true", dest="trace_json")
+
+    bench = sub.add_parser("bench", help="Benchmark the daemon against a simulated TV/speaker.")
+    bench_sub = bench.add_subparsers(dest="bench_cmd", required=True)
+    bench_daemon = bench_sub.add_parser(
+        "daemon", help="Key press/hold/0x73 scenarios through DaemonRunner to a fake speaker."
+    )
+    bench_daemon.add_argument(
+        "--scenario",
+        action="append",
+        dest="scenarios",
+        metavar="NAME",
+        help="Run only this scenario (repeatable; default: all).",
+    )
+    bench_daemon.add_argument(
+        "--rtt-ms",
+        type=_non_negative_float,
+        default=30.0,
+        help="Median speaker response time (ms).",
+    )
+    bench_daemon.add_argument(
+        "--jitter",
+        type=_non_negative_float,
+        default=0.0,
+        help="Lognormal sigma of the speaker time (0: fixed).",
+    )
+    bench_daemon.add_argument("--output", type=str, default=None, help="Also write JSON here.")
+    bench_daemon.add_argument("--json", action="store_true", dest="bench_json")
+    micro = bench_sub.add_parser(
+        "micro", help="Ops/s and allocations of the per-event hot functions."
+    )
+    micro.add_argument(
+        "--only",
+        action="append",
+        metavar="NAME",
+        help="Run only this microbenchmark (repeatable; default: all).",
+    )
+    micro.add_argument(
+        "--min-time", type=float, default=0.2, help="Seconds of timing per benchmark."
+    )
+    micro.add_argument("--save", type=str, default=None, help="Write results as a baseline.")
+    micro.add_argument(
+        "--baseline", type=str, default=None, help="Compare against a saved baseline file."
+    )
+    micro.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Regression when throughput drops (or allocations grow) by more than this.",
+    )
+    micro.add_argument("--json", action="store_true", dest="bench_json")
+
     daemon = sub.add_parser("daemon")
     daemon.add_argument("--input", choices=["cec", "keyboard"], default="cec")
     daemon.add_argument("--cec-device", type=str, default=None)
@@ -220,6 +582,24 @@ def main() -> None:
         choices=["none", "samsung"],
         default=None,
     )
+    daemon.add_argument(
+        "--metrics-port",
+        type=_port,
+        default=None,
+        help="Serve Prometheus metrics on this localhost port (CEC input).",
+    )
+    daemon.add_argument(
+        "--trace-file",
+        type=str,
+        default=None,
+        help="Append per-event RX -> speaker -> TX latency traces (JSON lines).",
+    )
+    daemon.add_argument(
+        "--capture-file",
+        type=str,
+        default=None,
+        help="Append every CEC frame and speaker request to a binary capture file.",
+    )
 
     args = p.parse_args()
     _validate_target_selection_args(p, args)
@@ -0,0 +1,317 @@
+import contextlib
+import gc
+import itertools
+import platform
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from devialetctl.application.ports import Target
+from devialetctl.domain.events import InputEvent, InputEventType
+from devialetctl.domain.policy import EventPolicy
+from devialetctl.infrastructure.cec_adapter import (
+    CecKernelAdapter,
+    format_cec_frame_human,
+    parse_cec_frame,
+)
+from devialetctl.infrastructure.config import load_config
+from devialetctl.infrastructure.upnp_gateway import _parse_ssdp_headers
+from devialetctl.interfaces.topology import build_topology_tree
+
+MICROBENCH_SCHEMA_VERSION = 1
+
+# A TV session's typical mix: volume keys and releases, audio status polls, system
+# audio mode, vendor sync, broadcasts and a frame the parser ignores.
+CEC_FRAME_MIX = (
+    "05:44:41",
+    "05:45",
+    "05:44:42",
+    "05:45",
+    "05:71",
+    "05:73:1E",
+    "05:7D",
+    "05:70:00:00",
+    "05:89:95:01",
+    "05:8C",
+    "0F:36",
+    "0F:87:00:00:F0",
+    "05:A4:00:00",
+    "05:44:43",
+    "50:7A:1E",
+    "05",
+)
+
+SSDP_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"CACHE-CONTROL: max-age=1800\r\n"
+    b"DATE: Mon, 19 Oct 2026 10:00:00 GMT\r\n"
+    b"EXT:\r\n"
+    b"LOCATION: http://192.168.1.42:80/upnp/description.xml\r\n"
+    b"SERVER: Linux/5.10 UPnP/1.0 Devialet/2.16\r\n"
+    b"ST: urn:schemas-upnp-org:device:MediaRenderer:2\r\n"
+    b"USN: uuid:0f1e2d3c-4b5a-6978-8796-a5b4c3d2e1f0::urn:schemas-upnp-org:device:"
+    b"MediaRenderer:2\r\n"
+    b"BOOTID.UPNP.ORG: 17\r\n"
+    b"CONFIGID.UPNP.ORG: 1\r\n\r\n"
+)
+
+CONFIG_TOML = """\
+log_level = "INFO"
+cec_device = "/dev/cec0"
+cec_vendor_compat = "samsung"
+dedupe_window_s = 0.08
+min_interval_s = 0.12
+flight_recorder_size = 8192
+
+[target]
+ip = "192.168.1.42"
+port = 80
+
+[[bindings]]
+cec_device = "/dev/cec0"
+system = "Living Room"
+
+[[bindings]]
+cec_device = "/dev/cec1"
+ip = "192.168.1.43"
+cec_osd_name = "Bedroom"
+"""
+
+
+@dataclass(frozen=True)
+class MicroBench:
+    """``setup`` builds the inputs (cleanups go on the stack) and returns the timed call.
+
+    One call performs ``batch`` operations; results are reported per operation.
+    """
+
+    name: str
+    setup: Callable[[contextlib.ExitStack], Callable[[], object]]
+    batch: int = 1
+
+
+def _parse_frames(_stack: contextlib.ExitStack) -> Callable[[], object]:
+    return lambda: [parse_cec_frame(frame) for frame in CEC_FRAME_MIX]
+
+
+def _format_frames(_stack: contextlib.ExitStack) -> Callable[[], object]:
+    return lambda: [format_cec_frame_human(frame) for frame in CEC_FRAME_MIX]
+
+
+def _msgs_from_frames(_stack: contextlib.ExitStack) -> Callable[[], object]:
+    return lambda: [CecKernelAdapter._msg_from_frame(frame) for frame in CEC_FRAME_MIX]
+
+
+def _frames_from_msgs(_stack: contextlib.ExitStack) -> Callable[[], object]:
+    msgs = [CecKernelAdapter._msg_from_frame(frame) for frame in CEC_FRAME_MIX]
+    return lambda: [CecKernelAdapter._frame_from_msg(msg) for msg in msgs]
+
+
+def _policy_checks(_stack: contextlib.ExitStack) -> Callable[[], object]:
+    policy = EventPolicy()
+    events = [
+        InputEvent(kind=kind, source="cec", key=kind.name)
+        for kind in (
+            InputEventType.VOLUME_UP,
+            InputEventType.VOLUME_UP,
+            InputEventType.USER_CONTROL_RELEASED,
+            InputEventType.VOLUME_DOWN,
+        )
+    ]
+    # Keys 50 ms apart: a mix of emitted, rate-limited and deduplicated events.
+    clock = itertools.count()
+    return lambda: [policy.should_emit(event, now=next(clock) * 0.05) for event in events]
+
+
+def _ssdp_headers(_stack: contextlib.ExitStack) -> Callable[[], object]:
+    return lambda: _parse_ssdp_headers(SSDP_RESPONSE)
+
+
+def synthetic_topology(devices: int = 100) -> tuple[list[Target], dict[str, dict[str, dict]]]:
+    """Targets and canned IP Control answers: stereo pairs, five systems per group."""
+    targets: list[Target] = []
+    answers: dict[str, dict[str, dict]] = {}
+    for index in range(devices):
+        address = f"10.0.{index // 250}.{index % 250 + 1}"
+        system = index // 2
+        targets.append(Target(address=address, port=80, base_path="/ipcontrol/v1", name=address))
+        answers[address] = {
+            "/devices/current": {
+                "deviceId": f"device-{index}",
+                "deviceName": f"Phantom {index}",
+                "model": "Phantom I",
+                "role": "FrontLeft" if index % 2 == 0 else "FrontRight",
+                "serial": f"SN{index:05d}",
+                "systemId": f"system-{system}",
+                "groupId": f"group-{system // 5}",
+                "isSystemLeader": index % 2 == 0,
+            },
+            "/systems/current": {
+                "systemId": f"system-{system}",
+                "systemName": f"Room {system}",
+                "groupId": f"group-{system // 5}",
+            },
+        }
+    return targets, answers
+
+
+def _topology_tree(_stack: contextlib.ExitStack) -> Callable[[], object]:
+    targets, answers = synthetic_topology(100)
+
+    class CannedGateway:
+        def __init__(self, address: str, port: int, base_path: str) -> None:
+            self.address = address
+
+        async def fetch_json_async(self, path: str) -> dict:
+            return answers[self.address][path]
+
+    return lambda: build_topology_tree(targets, gateway_factory=CannedGateway)
+
+
+def _load_config(stack: contextlib.ExitStack) -> Callable[[], object]:
+    directory = stack.enter_context(tempfile.TemporaryDirectory(prefix="devialetctl-bench-"))
+    path = Path(directory) / "config.toml"
+    path.write_text(CONFIG_TOML, encoding="utf-8")
+    return lambda: load_config(str(path))
+
+
+MICRO_BENCHMARKS = (
+    MicroBench("parse_cec_frame", _parse_frames, batch=len(CEC_FRAME_MIX)),
+    MicroBench("format_cec_frame_human", _format_frames, batch=len(CEC_FRAME_MIX)),
+    MicroBench("msg_from_frame", _msgs_from_frames, batch=len(CEC_FRAME_MIX)),
+    MicroBench("frame_from_msg", _frames_from_msgs, batch=len(CEC_FRAME_MIX)),
+    MicroBench("policy_should_emit", _policy_checks, batch=4),
+    MicroBench("parse_ssdp_headers", _ssdp_headers),
+    MicroBench("topology_tree_100", _topology_tree),
+    MicroBench("load_config", _load_config),
+)
+
+
+def _time_calls(call: Callable[[], object], number: int) -> float:
+    started = time.perf_counter()
+    for _ in range(number):
+        call()
+    return time.perf_counter() - started
+
+
+def _allocations(call: Callable[[], object], calls: int) -> tuple[float, float]:
+    """Average peak bytes allocated during one call, and bytes still held afterwards."""
+    peaks = 0
+    tracemalloc.start()
+    try:
+        call()  # warm caches (interned strings, lazily built tables) before measuring
+        baseline, _ = tracemalloc.get_traced_memory()
+        for _ in range(calls):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            call()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks += peak - before
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peaks / calls, max(0, retained - baseline) / calls
+
+
+def measure(bench: MicroBench, min_time_s: float = 0.2, repeat: int = 5) -> dict[str, Any]:
+    """Best-of-``repeat`` throughput (``timeit`` style) plus tracemalloc allocation figures."""
+    with contextlib.ExitStack() as stack:
+        call = bench.setup(stack)
+        call()
+        number = 1
+        target_s = min_time_s / repeat
+        while (elapsed_s := _time_calls(call, number)) < target_s:
+            number *= 2 if elapsed_s <= 0 else max(2, min(10, int(target_s / elapsed_s) + 1))
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            best_s = min(_time_calls(call, number) for _ in range(repeat))
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        peak_bytes, retained_bytes = _allocations(call, calls=min(number, 20))
+    ops = number * bench.batch
+    return {
+        "name": bench.name,
+        "ops_per_s": round(ops / best_s, 1) if best_s > 0 else None,
+        "ns_per_op": round(best_s / ops * 1e9, 1),
+        "alloc_bytes_per_op": round(peak_bytes / bench.batch, 1),
+        "retained_bytes_per_op": round(retained_bytes / bench.batch, 1),
+        "ops_per_sample": ops,
+    }
+
+
+def run_microbenchmarks(
+    names: list[str] | None = None, min_time_s: float = 0.2, repeat: int = 5
+) -> dict[str, Any]:
+    unknown = sorted(set(names or ()) - {bench.name for bench in MICRO_BENCHMARKS})
+    if unknown:
+        raise ValueError(f"unknown microbenchmark(s): {', '.join(unknown)}")
+    return {
+        "schema": MICROBENCH_SCHEMA_VERSION,
+        "kind": "micro",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [
+            measure(bench, min_time_s=min_time_s, repeat=repeat)
+            for bench in MICRO_BENCHMARKS
+            if not names or bench.name in names
+        ],
+    }
+
+
+def compare_microbenchmarks(
+    report: dict[str, Any], baseline: dict[str, Any], threshold: float = 0.2
+) -> list[dict[str, Any]]:
+    """Per benchmark: throughput ratio against ``baseline`` (>1 is faster).
+
+    A benchmark regressed when it lost more than ``threshold`` of its baseline
+    throughput or allocates more than ``1 + threshold`` times the baseline bytes.
+    """
+    previous = {row["name"]: row for row in baseline.get("results", [])}
+    rows = []
+    for row in report["results"]:
+        old = previous.get(row["name"])
+        if old is None or not old.get("ops_per_s") or not row.get("ops_per_s"):
+            rows.append({"name": row["name"], "speedup": None, "regressed": False})
+            continue
+        speedup = row["ops_per_s"] / old["ops_per_s"]
+        old_alloc = old.get("alloc_bytes_per_op") or 0.0
+        alloc_ratio = row["alloc_bytes_per_op"] / old_alloc if old_alloc > 0 else None
+        rows.append(
+            {
+                "name": row["name"],
+                "speedup": round(speedup, 3),
+                "alloc_ratio": round(alloc_ratio, 3) if alloc_ratio is not None else None,
+                "regressed": speedup < 1.0 - threshold
+                or (alloc_ratio is not None and alloc_ratio > 1.0 + threshold),
+            }
+        )
+    return rows
+
+
+def _figure(value: float | None, width: int) -> str:
+    # A call too fast for the timer has no ops/s figure.
+    return f"{'-':>{width}}" if value is None else f"{value:>{width},.0f}"
+
+
+def render_microbenchmark_lines(
+    report: dict[str, Any], comparison: list[dict[str, Any]] | None = None
+) -> list[str]:
+    compared = {row["name"]: row for row in comparison or []}
+    lines = []
+    for row in report["results"]:
+        line = (
+            f"{row['name']:<24} {_figure(row['ops_per_s'], 14)} ops/s "
+            f"{_figure(row['ns_per_op'], 10)} ns/op {_figure(row['alloc_bytes_per_op'], 9)} B/op"
+        )
+        delta = compared.get(row["name"])
+        if delta is not None and delta["speedup"] is not None:
+            line += f"  x{delta['speedup']:.2f} vs baseline"
+            if delta["regressed"]:
+                line += "  REGRESSED"
+        lines.append(line)
+    return lines
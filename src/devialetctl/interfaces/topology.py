@@ -233,13 +233,31 @@ def pick_target_by_system_name(
         )
 
     group_id, system = matches[0]
+    target = _system_leader_target(system, name=f"{requested}@{group_id}")
+    if target is None:
+        raise RuntimeError(f"System '{requested}' has no reachable devices in group {group_id}.")
+    return target
+
+
+def _system_leader_target(system: dict, name: str) -> Target | None:
     devices = system.get("devices", [])
     if not devices:
-        raise RuntimeError(f"System '{requested}' has no reachable devices in group {group_id}.")
+        return None
     selected = next((d for d in devices if d.get("is_system_leader")), devices[0])
     return Target(
         address=str(selected["address"]),
         port=int(selected["port"]),
         base_path="/ipcontrol/v1",
-        name=f"{requested}@{group_id}",
+        name=name,
     )
+
+
+def system_targets(tree: dict) -> list[Target]:
+    """One target (the system leader) per system in a topology tree."""
+    targets: list[Target] = []
+    for group in tree.get("groups", []):
+        for system in group.get("systems", []):
+            target = _system_leader_target(system, name=str(system.get("system_name", "")))
+            if target is not None:
+                targets.append(target)
+    return targets
@@ -0,0 +1,362 @@
+import array
+import bisect
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from devialetctl.infrastructure.capture_file import read_capture_rows
+from devialetctl.infrastructure.cec_adapter import (
+    CEC_TX_STATUS_OK,
+    CEC_TX_STATUS_RETRY_MASK,
+    cec_logical_address_name,
+    cec_opcode_name,
+    samsung_vendor_subcommand_name,
+)
+from devialetctl.infrastructure.flight_recorder import RecordKind
+from devialetctl.infrastructure.latency_histogram import (
+    DEFAULT_LATENCY_BUCKETS_S,
+    LatencyHistogram,
+)
+
+try:
+    import numpy as np
+except ImportError:  # optional: every aggregate below has a pure-Python path
+    np = None
+
+_USER_CONTROL_PRESSED = 0x44
+_SET_AUDIO_VOLUME_LEVEL = 0x73
+_VENDOR_COMMAND = 0x89
+_VOLUME_KEYS = (0x41, 0x42, 0x43)
+_PERCENTILES = (50.0, 90.0, 99.0)
+
+
+@dataclass
+class CaptureColumns:
+    """A capture as parallel arrays (one slot per record) for vectorized scans.
+
+    CEC columns hold -1 where a record has no such byte (polls, HTTP records);
+    ``endpoint`` indexes ``endpoints`` for HTTP records and is -1 otherwise; ``session``
+    is the daemon run a record belongs to (timestamps restart with each run).
+    """
+
+    ts_s: array.array = field(default_factory=lambda: array.array("d"))
+    kind: array.array = field(default_factory=lambda: array.array("B"))
+    status: array.array = field(default_factory=lambda: array.array("H"))
+    latency_s: array.array = field(default_factory=lambda: array.array("d"))
+    initiator: array.array = field(default_factory=lambda: array.array("b"))
+    opcode: array.array = field(default_factory=lambda: array.array("h"))
+    operand: array.array = field(default_factory=lambda: array.array("h"))
+    endpoint: array.array = field(default_factory=lambda: array.array("h"))
+    session: array.array = field(default_factory=lambda: array.array("H"))
+    endpoints: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ts_s)
+
+
+def load_capture_columns(path: str) -> CaptureColumns:
+    columns = CaptureColumns()
+    endpoint_ids: dict[str, int] = {}
+    for row in read_capture_rows(path):
+        ts_s, _wall_s, kind, _kernel_ts_ns, status, latency_s, payload, endpoint, session = row
+        columns.ts_s.append(ts_s)
+        columns.session.append(session)
+        columns.kind.append(kind)
+        columns.status.append(status)
+        columns.latency_s.append(latency_s)
+        columns.initiator.append(payload[0] >> 4 if payload else -1)
+        columns.opcode.append(payload[1] if len(payload) > 1 else -1)
+        columns.operand.append(payload[2] if len(payload) > 2 else -1)
+        if kind == RecordKind.HTTP:
+            endpoint_id = endpoint_ids.setdefault(endpoint, len(endpoint_ids))
+            if endpoint_id == len(columns.endpoints):
+                columns.endpoints.append(endpoint)
+            columns.endpoint.append(endpoint_id)
+        else:
+            columns.endpoint.append(-1)
+    return columns
+
+
+def capture_duration_s(columns: CaptureColumns) -> float:
+    """Seconds covered by the capture: the span of each session, summed.
+
+    Each daemon run stamps records with its own monotonic clock, so spans are only
+    measured within a session; the gaps between runs are not counted.
+    """
+    if not len(columns):
+        return 0.0
+    if np is not None:
+        ts_s = np.asarray(columns.ts_s)
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(np.asarray(columns.session))) + 1))
+        spans = np.maximum.reduceat(ts_s, starts) - np.minimum.reduceat(ts_s, starts)
+        return sum(spans.tolist())
+    bounds: dict[int, tuple[float, float]] = {}
+    for ts_s, session in zip(columns.ts_s, columns.session):
+        low, high = bounds.get(session, (ts_s, ts_s))
+        bounds[session] = (min(low, ts_s), max(high, ts_s))
+    return sum(high - low for low, high in bounds.values())
+
+
+def _interpolate(ordered: list[float], q: float) -> float:
+    # Same linear interpolation as numpy.percentile's default method.
+    position = (len(ordered) - 1) * q / 100.0
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def latency_summary(values) -> dict[str, Any]:
+    summary: dict[str, Any] = {"count": len(values)}
+    if not len(values):
+        return summary
+    if np is not None:
+        points = np.percentile(np.asarray(values, dtype=float), _PERCENTILES)
+        summary.update({f"p{q:g}_s": round(float(v), 6) for q, v in zip(_PERCENTILES, points)})
+        slots = np.searchsorted(np.asarray(DEFAULT_LATENCY_BUCKETS_S), values, side="left")
+        counts = np.cumsum(np.bincount(slots, minlength=len(DEFAULT_LATENCY_BUCKETS_S) + 1))
+        bounds = (*DEFAULT_LATENCY_BUCKETS_S, float("inf"))
+        summary["histogram"] = [[bound, int(total)] for bound, total in zip(bounds, counts)]
+        return summary
+    ordered = sorted(values)
+    summary.update({f"p{q:g}_s": round(_interpolate(ordered, q), 6) for q in _PERCENTILES})
+    histogram = LatencyHistogram()
+    for value in ordered:
+        histogram.observe(value)
+    summary["histogram"] = [[bound, total] for bound, total in histogram.cumulative()]
+    return summary
+
+
+def key_to_speaker_latencies(columns: CaptureColumns) -> list[float]:
+    """Seconds from a volume key (or SET_AUDIO_VOLUME_LEVEL) to the speaker write it caused.
+
+    Each speaker write (``POST`` request) is paired with the first key received since
+    the previous write: coalesced key bursts count once, from their first key.
+    """
+    writes = {i for i, name in enumerate(columns.endpoints) if name.startswith("POST ")}
+    if np is not None:
+        kind = np.asarray(columns.kind)
+        opcode = np.asarray(columns.opcode)
+        keys = (kind == RecordKind.CEC_RX) & (
+            (opcode == _SET_AUDIO_VOLUME_LEVEL)
+            | (
+                (opcode == _USER_CONTROL_PRESSED)
+                & np.isin(np.asarray(columns.operand), _VOLUME_KEYS)
+            )
+        )
+        key_idx = np.flatnonzero(keys)
+        write_idx = np.flatnonzero(
+            (kind == RecordKind.HTTP) & np.isin(np.asarray(columns.endpoint), list(writes))
+        )
+        if not len(key_idx) or not len(write_idx):
+            return []
+        previous = np.concatenate(([-1], write_idx[:-1]))
+        first = np.minimum(np.searchsorted(key_idx, previous, side="right"), len(key_idx) - 1)
+        paired = key_idx[first] > previous
+        paired &= key_idx[first] < write_idx
+        ts_s = np.asarray(columns.ts_s)
+        latencies = ts_s[write_idx[paired]] - ts_s[key_idx[first[paired]]]
+        return [float(value) for value in latencies[latencies >= 0]]
+
+    key_idx = [
+        i
+        for i, kind in enumerate(columns.kind)
+        if kind == RecordKind.CEC_RX
+        and (
+            columns.opcode[i] == _SET_AUDIO_VOLUME_LEVEL
+            or (columns.opcode[i] == _USER_CONTROL_PRESSED and columns.operand[i] in _VOLUME_KEYS)
+        )
+    ]
+    latencies = []
+    previous = -1
+    for i, kind in enumerate(columns.kind):
+        if kind != RecordKind.HTTP or columns.endpoint[i] not in writes:
+            continue
+        first = bisect.bisect_right(key_idx, previous)
+        if first < len(key_idx) and key_idx[first] < i:
+            latency = columns.ts_s[i] - columns.ts_s[key_idx[first]]
+            if latency >= 0:
+                latencies.append(latency)
+        previous = i
+    return latencies
+
+
+def _grouped(keys, flags: dict[str, Any]) -> dict[int, dict[str, int]]:
+    """Count rows per key, plus how many rows of each key have each flag set."""
+    if np is not None:
+        unique, inverse = np.unique(np.asarray(keys), return_inverse=True)
+        totals = np.bincount(inverse, minlength=len(unique))
+        sums = {
+            name: np.bincount(inverse, weights=np.asarray(mask, dtype=float), minlength=len(unique))
+            for name, mask in flags.items()
+        }
+        return {
+            int(key): {
+                "count": int(totals[slot]),
+                **{name: int(values[slot]) for name, values in sums.items()},
+            }
+            for slot, key in enumerate(unique)
+        }
+    grouped: dict[int, dict[str, int]] = {}
+    for row, key in enumerate(keys):
+        counts = grouped.setdefault(key, {"count": 0, **{name: 0 for name in flags}})
+        counts["count"] += 1
+        for name, mask in flags.items():
+            counts[name] += int(bool(mask[row]))
+    return grouped
+
+
+def _bits(values, mask: int, set_: bool):
+    if np is not None:
+        return (values & mask) != 0 if set_ else (values & mask) == 0
+    return [(value & mask != 0) == set_ for value in values]
+
+
+def _select(columns: CaptureColumns, kind: RecordKind, *names: str) -> list:
+    """The given columns restricted to records of ``kind``."""
+    if np is not None:
+        rows = np.asarray(columns.kind) == kind
+        return [np.asarray(getattr(columns, name))[rows] for name in names]
+    rows = [i for i, value in enumerate(columns.kind) if value == kind]
+    return [[getattr(columns, name)[i] for i in rows] for name in names]
+
+
+def _cec_tx_by_opcode(columns: CaptureColumns) -> dict[str, dict[str, Any]]:
+    (opcode, status) = _select(columns, RecordKind.CEC_TX, "opcode", "status")
+    submitted = _grouped(opcode, {"refused": _bits(status, CEC_TX_STATUS_OK, False)})
+    (opcode, status) = _select(columns, RecordKind.CEC_TX_STATUS, "opcode", "status")
+    reported = _grouped(
+        opcode,
+        {
+            "retransmitted": _bits(status, CEC_TX_STATUS_RETRY_MASK, True),
+            "failed": _bits(status, CEC_TX_STATUS_OK, False),
+        },
+    )
+    result = {}
+    for key in sorted(set(submitted) | set(reported)):
+        row = {"submitted": 0, "refused": 0, "reports": 0, "retransmitted": 0, "failed": 0}
+        if key in submitted:
+            row["submitted"] = submitted[key]["count"]
+            row["refused"] = submitted[key]["refused"]
+        if key in reported:
+            row["reports"] = reported[key]["count"]
+            row["retransmitted"] = reported[key]["retransmitted"]
+            row["failed"] = reported[key]["failed"]
+            row["retransmit_rate"] = round(row["retransmitted"] / row["reports"], 4)
+        result[_opcode_label(key)] = row
+    return result
+
+
+def _opcode_label(opcode: int) -> str:
+    return "POLL" if opcode < 0 else cec_opcode_name(opcode)
+
+
+def _cec_rx_by_opcode(columns: CaptureColumns) -> dict[str, int]:
+    (opcode,) = _select(columns, RecordKind.CEC_RX, "opcode")
+    return {_opcode_label(key): row["count"] for key, row in sorted(_grouped(opcode, {}).items())}
+
+
+def _vendor_commands(columns: CaptureColumns) -> dict[str, dict[str, int]]:
+    """Samsung vendor-command subcommands received, per initiating device (usually the TV)."""
+    initiator, opcode, operand = _select(
+        columns, RecordKind.CEC_RX, "initiator", "opcode", "operand"
+    )
+    if np is not None:
+        vendor = opcode == _VENDOR_COMMAND
+        keys = initiator[vendor].astype(int) * 257 + operand[vendor].astype(int) + 1
+    else:
+        keys = [
+            source * 257 + sub + 1
+            for source, code, sub in zip(initiator, opcode, operand)
+            if code == _VENDOR_COMMAND
+        ]
+    result: dict[str, dict[str, int]] = {}
+    for key, row in sorted(_grouped(keys, {}).items()):
+        source, subcommand = divmod(key, 257)
+        label = "NONE" if subcommand == 0 else samsung_vendor_subcommand_name(subcommand - 1)
+        result.setdefault(cec_logical_address_name(source), {})[label] = row["count"]
+    return result
+
+
+def _http_summary(columns: CaptureColumns) -> dict[str, Any]:
+    endpoint, status, latency_s = _select(
+        columns, RecordKind.HTTP, "endpoint", "status", "latency_s"
+    )
+    get_ids = [i for i, name in enumerate(columns.endpoints) if name.startswith("GET ")]
+    if np is not None:
+        errors = (status == 0) | (status >= 400)
+        get_rows = np.isin(endpoint, get_ids)
+        polls = int(get_rows.sum())
+        get_time_s = float(latency_s[get_rows].sum())
+    else:
+        errors = [value == 0 or value >= 400 for value in status]
+        get_rows = [value in get_ids for value in endpoint]
+        polls = sum(get_rows)
+        get_time_s = sum(value for value, is_get in zip(latency_s, get_rows) if is_get)
+    endpoints = {}
+    for key, row in sorted(_grouped(endpoint, {"errors": errors}).items()):
+        if np is not None:
+            latencies = latency_s[endpoint == key]
+        else:
+            latencies = [value for value, e in zip(latency_s, endpoint) if e == key]
+        summary = latency_summary(latencies)
+        summary.pop("histogram", None)
+        summary["errors"] = row["errors"]
+        endpoints[columns.endpoints[key]] = summary
+    total_time_s = float(sum(latency_s))
+    duration_s = capture_duration_s(columns)
+    return {
+        "endpoints": endpoints,
+        "polling": {
+            "get_requests": polls,
+            "get_per_minute": round(polls * 60.0 / duration_s, 3) if duration_s > 0 else None,
+            "get_share_of_http_time": (
+                round(get_time_s / total_time_s, 4) if total_time_s > 0 else None
+            ),
+        },
+    }
+
+
+def analyze_capture(path: str) -> dict[str, Any]:
+    columns = load_capture_columns(path)
+    return {
+        "capture": str(Path(path)),
+        "backend": "numpy" if np is not None else "python",
+        "records": len(columns),
+        "duration_s": round(capture_duration_s(columns), 6),
+        "key_to_speaker": latency_summary(key_to_speaker_latencies(columns)),
+        "cec_rx": _cec_rx_by_opcode(columns),
+        "cec_tx": _cec_tx_by_opcode(columns),
+        "vendor_commands": _vendor_commands(columns),
+        "http": _http_summary(columns),
+    }
+
+
+def render_capture_report_lines(report: dict[str, Any]) -> list[str]:
+    lines = [f"{report['capture']}: {report['records']} records over {report['duration_s']}s"]
+    key = report["key_to_speaker"]
+    if key["count"]:
+        lines.append(
+            f"  key -> speaker: n={key['count']} p50={key['p50_s'] * 1000:.1f}ms "
+            f"p99={key['p99_s'] * 1000:.1f}ms"
+        )
+    for label, row in report["cec_tx"].items():
+        rate = row.get("retransmit_rate")
+        retries = f" retransmit={rate:.1%}" if rate is not None else ""
+        lines.append(f"  tx {label}: submitted={row['submitted']} failed={row['failed']}{retries}")
+    for label, count in report["cec_rx"].items():
+        lines.append(f"  rx {label}: {count}")
+    for source, subcommands in report["vendor_commands"].items():
+        counts = ", ".join(f"{name}={count}" for name, count in subcommands.items())
+        lines.append(f"  vendor commands from {source}: {counts}")
+    for endpoint, row in report["http"]["endpoints"].items():
+        lines.append(
+            f"  {endpoint}: n={row['count']} errors={row['errors']} "
+            f"p50={row['p50_s'] * 1000:.1f}ms p99={row['p99_s'] * 1000:.1f}ms"
+        )
+    polling = report["http"]["polling"]
+    if polling["get_requests"]:
+        lines.append(
+            f"  polling: {polling['get_requests']} GETs ({polling['get_per_minute']}/min, "
+            f"{polling['get_share_of_http_time']:.1%} of HTTP time)"
+        )
+    return lines
@@ -0,0 +1,105 @@
+import asyncio
+
+import httpx
+import pytest
+
+from devialetctl.infrastructure import devialet_gateway
+from devialetctl.infrastructure.adaptive_timeout import (
+    BACKGROUND_BUDGET,
+    USER_BUDGET,
+    RttEstimator,
+    background_requests,
+    current_budget,
+)
+from devialetctl.infrastructure.devialet_gateway import DevialetHttpGateway
+
+VOLUME_PATH = "/systems/current/sources/current/soundControl/volume"
+
+
+def test_rtt_estimator_follows_rfc6298_smoothing() -> None:
+    rtt = RttEstimator()
+    assert rtt.timeout_s(k=4.0, floor_s=0.1, ceiling_s=2.5) == 2.5
+
+    rtt.observe(0.2)
+    assert rtt.srtt_s == pytest.approx(0.2)
+    assert rtt.rttvar_s == pytest.approx(0.1)
+    rtt.observe(0.4)
+    assert rtt.rttvar_s == pytest.approx(0.75 * 0.1 + 0.25 * 0.2)
+    assert rtt.srtt_s == pytest.approx(0.875 * 0.2 + 0.125 * 0.4)
+    assert rtt.timeout_s(k=4.0, floor_s=0.1, ceiling_s=2.5) == pytest.approx(
+        rtt.srtt_s + 4.0 * rtt.rttvar_s
+    )
+
+
+def test_rtt_estimator_timeout_is_clamped_to_budget() -> None:
+    fast = RttEstimator()
+    for _ in range(20):
+        fast.observe(0.005)
+    assert fast.timeout_s(k=4.0, floor_s=0.5, ceiling_s=2.5) == 0.5
+
+    slow = RttEstimator()
+    for sample in (0.5, 3.0, 0.4, 4.0):
+        slow.observe(sample)
+    assert slow.timeout_s(k=4.0, floor_s=0.5, ceiling_s=2.5) == 2.5
+
+
+def test_background_budget_is_scoped_to_the_block() -> None:
+    assert current_budget() is USER_BUDGET
+    with background_requests():
+        assert current_budget() is BACKGROUND_BUDGET
+    assert current_budget() is USER_BUDGET
+
+
+def test_gateway_timeouts_shrink_on_a_healthy_link_and_background_is_tighter() -> None:
+    gw = DevialetHttpGateway(address="10.0.0.2")
+    cold = gw.request_timeout("GET", VOLUME_PATH)
+    assert cold.read == 2.5
+    assert cold.connect == 2.5
+
+    for _ in range(10):
+        gw.endpoint_rtt("GET", VOLUME_PATH).observe(0.01)
+    warm = gw.request_timeout("GET", VOLUME_PATH)
+    assert warm.read == USER_BUDGET.read_floor_s
+    # Estimates are per endpoint: an unmeasured one keeps the upper bound.
+    assert gw.request_timeout("POST", VOLUME_PATH).read == 2.5
+
+    with background_requests():
+        background = gw.request_timeout("GET", VOLUME_PATH)
+        cold_background = gw.request_timeout("POST", VOLUME_PATH)
+    assert background.read < warm.read
+    assert cold_background.read == 2.5 * BACKGROUND_BUDGET.ceiling_scale
+
+
+def test_gateway_measures_requests_and_backs_off_after_a_timeout(monkeypatch) -> None:
+    real_client = httpx.AsyncClient
+    seen_timeouts: list[dict] = []
+    stall = {"value": False}
+
+    def handler(request):
+        seen_timeouts.append(request.extensions["timeout"])
+        if stall["value"]:
+            raise httpx.ReadTimeout("stalled", request=request)
+        return httpx.Response(200, json={"volume": 17})
+
+    monkeypatch.setattr(
+        devialet_gateway.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    gw = DevialetHttpGateway(address="10.0.0.2")
+
+    async def _run() -> None:
+        async with gw.session():
+            for _ in range(10):
+                assert await gw.get_volume_async() == 17
+            stall["value"] = True
+            with pytest.raises(httpx.ReadTimeout):
+                await gw.get_volume_async()
+
+    asyncio.run(_run())
+    estimator = gw.endpoint_rtt("GET", VOLUME_PATH)
+    assert estimator.samples == 11
+    assert seen_timeouts[0]["read"] == 2.5
+    assert seen_timeouts[-1]["read"] == USER_BUDGET.read_floor_s
+    # The timed-out request counts as a doubled sample, widening the next budget.
+    assert gw.request_timeout("GET", VOLUME_PATH).read > USER_BUDGET.read_floor_s
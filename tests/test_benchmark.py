@@ -0,0 +1,118 @@
+import json
+import sys
+
+import pytest
+
+from devialetctl.application.daemon import DaemonRunner
+from devialetctl.infrastructure.cec_replay import ReplayFrame
+from devialetctl.infrastructure.config import DaemonConfig, RuntimeTarget
+from devialetctl.interfaces import benchmark, cli
+from devialetctl.interfaces.benchmark import (
+    expected_volume,
+    key_flood,
+    key_holds,
+    key_presses,
+    run_daemon_benchmark,
+    volume_levels,
+)
+
+_CFG = DaemonConfig(target=RuntimeTarget(ip="127.0.0.1"))
+
+
+def test_scenarios_and_expected_volume() -> None:
+    presses = key_presses(3, interval_s=0.3, up=False)
+    assert [frame.frame for frame in presses.frames] == ["05:44:42", "05:45"] * 3
+    hold = key_holds(1, hold_s=1.0, repeat_s=0.25)
+    assert [frame.frame for frame in hold.frames] == ["05:44:41"] * 4 + ["05:45"]
+    assert hold.frames[-1].offset_s == 1.0
+    assert expected_volume(presses.frames, 1) == 0
+    assert expected_volume(volume_levels(3, start=40, step=5).frames, 10) == 50
+    assert expected_volume([ReplayFrame(0.0, "05:73:9E")], 10) == 30  # mute bit ignored
+
+
+def test_spaced_presses_reach_the_speaker_without_dropped_steps() -> None:
+    result = run_daemon_benchmark(_CFG, key_presses(4, interval_s=0.25), rtt_ms=5, settle_s=0.4)
+
+    assert result["key_presses"] == 4
+    assert result["events"] == 8
+    assert result["volume"] == {"initial": 30, "expected": 34, "final": 34}
+    assert result["dropped_steps"] == 0
+    assert result["speaker_writes"] == 4
+    assert result["writes_per_key"] == 1.0
+    assert result["key_to_write"]["count"] == 4
+    # The fake speaker's service time is a floor; no upper bound on a shared CI host.
+    assert result["key_to_write"]["p50_s"] >= 0.005
+    throughput = result["throughput"]
+    assert throughput["events"] == 8
+    # Unpaced, the frames arrive back to back instead of over the scenario's ~0.8 s.
+    assert throughput["busy_s"] < result["busy_s"]
+    assert throughput["events_per_s"] > result["events"] / result["busy_s"]
+
+
+def test_flood_reports_policy_drops_as_dropped_steps() -> None:
+    result = run_daemon_benchmark(_CFG, key_flood(10, interval_s=0.01), rtt_ms=5, settle_s=0.4)
+
+    assert result["volume"]["expected"] == 40
+    assert result["dropped_steps"] == 40 - result["volume"]["final"]
+    assert result["dropped_steps"] > 0
+    assert result["failed_writes"] == 0
+    assert result["policy_drops"] >= result["dropped_steps"]
+
+
+def test_dropped_steps_count_policy_and_queue_drops_of_volume_keys_only() -> None:
+    runner = DaemonRunner(cfg=_CFG, gateway=None)
+    runner.activity_stats.drop_by_policy("volume_up")
+    runner.activity_stats.drop_by_policy("volume_down")
+    runner.activity_stats.drop_by_policy("user_control_released")
+    runner.queue_stats.dropped = 2
+
+    assert runner.activity_stats.policy_drops == 3
+    assert benchmark.dropped_steps(runner, failed_writes=1) == 5
+
+
+def test_cli_bench_daemon_writes_json(monkeypatch, tmp_path, capsys) -> None:
+    monkeypatch.setattr(
+        benchmark,
+        "default_scenarios",
+        lambda: [key_presses(2, interval_s=0.2), volume_levels(2)],
+    )
+    original = benchmark.run_daemon_benchmark
+    monkeypatch.setattr(
+        benchmark,
+        "run_daemon_benchmark",
+        lambda cfg, scenario, **options: original(cfg, scenario, settle_s=0.3, **options),
+    )
+    output = tmp_path / "bench.json"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "devialetctl",
+            "--config",
+            str(tmp_path / "missing.toml"),
+            "bench",
+            "daemon",
+            "--scenario",
+            "set-volume-level",
+            "--rtt-ms",
+            "2",
+            "--output",
+            str(output),
+        ],
+    )
+    cli.main()
+
+    report = json.loads(output.read_text())
+    assert report["kind"] == "daemon"
+    assert [row["scenario"] for row in report["results"]] == ["set-volume-level"]
+    assert report["results"][0]["speaker_rtt_ms"] == 2.0
+    assert capsys.readouterr().out.startswith("set-volume-level: 2 events")
+
+
+def test_cli_bench_daemon_rejects_unknown_scenario(monkeypatch, tmp_path, capsys) -> None:
+    argv = ["devialetctl", "--config", str(tmp_path / "missing.toml"), "bench", "daemon"]
+    monkeypatch.setattr(sys, "argv", [*argv, "--scenario", "key-mash"])
+    with pytest.raises(SystemExit) as exc:
+        cli.main()
+    assert exc.value.code == 2
+    assert "unknown scenario(s): key-mash (choose from key-press" in capsys.readouterr().err
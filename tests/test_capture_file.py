@@ -0,0 +1,101 @@
+import struct
+
+import pytest
+
+from devialetctl.infrastructure.capture_file import HEADER, CaptureWriter, read_capture
+from devialetctl.infrastructure.flight_recorder import (
+    RECORD,
+    FlightRecorder,
+    RecordKind,
+    combine_recorders,
+)
+
+_LONG_PATH = "/systems/current/sources/current/soundControl/volume"
+
+
+def test_capture_round_trips_frames_and_long_endpoints(tmp_path) -> None:
+    path = tmp_path / "capture.bin"
+    writer = CaptureWriter(str(path))
+    writer.record_cec_rx(b"\x05\x44\x41", rx_ts_ns=1_000)
+    writer.record_http("GET", _LONG_PATH, 200, 0.031)
+    writer.record_cec_tx(b"\x50\x7a\x14", ok=True)
+    writer.record_cec_tx_status(b"\x50\x7a\x14", tx_status=1, tx_ts_ns=2_000)
+    writer.close()
+
+    rx, http, tx, tx_status = list(read_capture(str(path)))
+    assert (rx.kind, rx.payload, rx.kernel_ts_ns) == (RecordKind.CEC_RX, b"\x05\x44\x41", 1_000)
+    assert (http.endpoint, http.status) == (f"GET {_LONG_PATH}", 200)
+    assert http.latency_s == pytest.approx(0.031)
+    assert (tx.kind, tx.status) == (RecordKind.CEC_TX, 1)
+    assert tx_status.kernel_ts_ns == 2_000
+    assert rx.wall_s is not None and abs(rx.wall_s - tx.wall_s) < 1.0
+
+
+def test_capture_appends_sessions_and_ignores_torn_tail(tmp_path) -> None:
+    path = tmp_path / "capture.bin"
+    first = CaptureWriter(str(path))
+    first.record_http("POST", "/mute", 200, 0.01)
+    first.close()
+    second = CaptureWriter(str(path))
+    second.record_http("GET", "/volume", 0, 2.5)  # same endpoint id, new session
+    second.close()
+    with open(path, "ab") as file:
+        file.write(b"\x00" * (RECORD.size // 2))
+
+    records = list(read_capture(str(path)))
+    assert [record.endpoint for record in records] == ["POST /mute", "GET /volume"]
+    assert records[1].status == 0
+
+
+def test_capture_writer_drops_torn_tail_before_appending(tmp_path) -> None:
+    path = tmp_path / "capture.bin"
+    first = CaptureWriter(str(path))
+    first.record_cec_rx(b"\x05\x44\x41")
+    first.close()
+    with open(path, "ab") as file:
+        file.write(b"\x89" * (RECORD.size // 2))
+
+    second = CaptureWriter(str(path))
+    second.record_cec_rx(b"\x05\x45")
+    second.record_cec_tx(b"\x50\x7a\x14", ok=True)
+    second.close()
+
+    assert (path.stat().st_size - HEADER.size) % RECORD.size == 0
+    records = list(read_capture(str(path)))
+    assert [record.payload for record in records] == [b"\x05\x44\x41", b"\x05\x45", b"\x50\x7a\x14"]
+
+
+def test_capture_reader_rejects_foreign_files(tmp_path) -> None:
+    path = tmp_path / "not-a-capture.bin"
+    path.write_bytes(HEADER.pack(b"SOMETHIN", 1, RECORD.size))
+    with pytest.raises(ValueError):
+        list(read_capture(str(path)))
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    assert list(read_capture(str(empty))) == []
+
+
+def test_capture_writer_refuses_to_append_to_foreign_file(tmp_path, caplog) -> None:
+    path = tmp_path / "other.bin"
+    path.write_bytes(struct.pack("<16s", b"foreign"))
+    writer = CaptureWriter(str(path))
+    writer.record_cec_rx(b"\x05\x71")
+    writer.record_cec_rx(b"\x05\x71")
+    assert writer.written == 0
+    assert path.read_bytes() == struct.pack("<16s", b"foreign")
+    assert "cannot write capture" in caplog.text
+
+
+def test_tee_feeds_ring_and_capture_the_same_records(tmp_path) -> None:
+    ring = FlightRecorder(capacity=8)
+    capture = CaptureWriter(str(tmp_path / "capture.bin"))
+    tee = combine_recorders(ring, None, capture)
+    tee.record_http("GET", "/volume", 200, 0.02)
+    tee.record_cec_rx(b"\x05\x71")
+    capture.close()
+
+    from_ring = [(r.kind, r.endpoint, r.ts_s) for r in ring.records()]
+    from_file = [(r.kind, r.endpoint, r.ts_s) for r in read_capture(capture.path)]
+    assert from_ring == from_file
+    assert combine_recorders(None, ring) is ring
+    assert combine_recorders(None) is None
@@ -33,6 +33,50 @@ def test_kernel_send_tx_calls_transmit_ioctl(monkeypatch) -> None:
     monkeypatch.setattr(cec_adapter.fcntl, "ioctl", fake_ioctl)
     assert adapter.send_tx("50:7A:1E") is True
     assert calls == [cec_adapter.CEC_TRANSMIT]
+    assert adapter.stats.tx_by_opcode == {"REPORT_AUDIO_STATUS": 1}
+
+
+def test_kernel_send_tx_counts_failures_by_opcode(monkeypatch) -> None:
+    def failing_ioctl(fd, request, arg=0, mutate_flag=True):
+        raise OSError(5, "EIO")
+
+    adapter = cec_adapter.CecKernelAdapter(device="/dev/cec0")
+    adapter._fd = 7
+    monkeypatch.setattr(cec_adapter.fcntl, "ioctl", failing_ioctl)
+    assert adapter.send_tx("50:89:95:01:14") is False
+    assert adapter.stats.tx_failures_by_opcode == {"SAMSUNG_VENDOR_COMMAND": 1}
+    assert adapter.stats.tx_by_opcode == {}
+
+
+def test_kernel_tx_status_failures_are_counted_without_a_listener(monkeypatch) -> None:
+    received = []
+    statuses = [
+        cec_adapter.CEC_TX_STATUS_OK,
+        cec_adapter.CEC_TX_STATUS_NACK | cec_adapter.CEC_TX_STATUS_MAX_RETRIES,
+    ]
+
+    def fake_ioctl(fd, request, arg=0, mutate_flag=True):
+        if request == cec_adapter.CEC_TRANSMIT:
+            arg.sequence = 10 + len(received)
+        elif request == cec_adapter.CEC_RECEIVE:
+            arg.sequence = 10 + len(received)
+            arg.tx_status = statuses[len(received)]
+            received.append(arg)
+        return 0
+
+    adapter = cec_adapter.CecKernelAdapter(device="/dev/cec0")
+    adapter._fd = 7
+    monkeypatch.setattr(cec_adapter.fcntl, "ioctl", fake_ioctl)
+    assert adapter.send_tx("50:7A:1E") is True
+    # Queued by the kernel, not on the bus yet: nothing is counted so far.
+    assert adapter.stats.tx_by_opcode == {}
+    assert adapter._receive_one_frame(7) == ""
+    assert adapter.send_tx("50:7A:1E") is True
+    assert adapter._receive_one_frame(7) == ""
+
+    assert adapter.stats.tx_by_opcode == {"REPORT_AUDIO_STATUS": 1}
+    assert adapter.stats.tx_failures_by_opcode == {"REPORT_AUDIO_STATUS": 1}
+    assert adapter._tx_in_flight == {}
 
 
 def test_kernel_config_skips_claim_when_audio_system_already_present(monkeypatch) -> None:
@@ -46,12 +90,13 @@ def test_kernel_config_skips_claim_when_audio_system_already_present(monkeypatch
 
     monkeypatch.setattr(cec_adapter.fcntl, "ioctl", fake_ioctl)
     adapter = cec_adapter.CecKernelAdapter()
-    adapter._configure(7)
+    asyncio.run(adapter._configure_async(7))
     assert cec_adapter.CEC_ADAP_S_LOG_ADDRS not in calls
 
 
-def test_kernel_config_retries_on_busy_then_succeeds(monkeypatch) -> None:
+def test_kernel_config_retries_on_busy_without_blocking_the_loop(monkeypatch) -> None:
     attempts = {"set": 0}
+    ticks: list[int] = []
 
     def fake_ioctl(fd, request, arg=0, mutate_flag=True):
         if request == cec_adapter.CEC_ADAP_G_LOG_ADDRS:
@@ -64,8 +109,238 @@ def test_kernel_config_retries_on_busy_then_succeeds(monkeypatch) -> None:
             return 0
         return 0
 
+    def blocking_sleep(_s):
+        raise AssertionError("claim retry must not block the event loop")
+
+    async def ticker() -> None:
+        while True:
+            ticks.append(attempts["set"])
+            await asyncio.sleep(0.002)
+
+    async def _run() -> None:
+        task = asyncio.create_task(ticker())
+        await adapter._configure_async(7)
+        task.cancel()
+
     monkeypatch.setattr(cec_adapter.fcntl, "ioctl", fake_ioctl)
-    monkeypatch.setattr(cec_adapter.time, "sleep", lambda _s: None)
-    adapter = cec_adapter.CecKernelAdapter(_log_addrs_busy_retries=(0.01,))
-    adapter._configure(7)
+    monkeypatch.setattr(cec_adapter.time, "sleep", blocking_sleep)
+    adapter = cec_adapter.CecKernelAdapter(_log_addrs_busy_retries=(0.02,), confirm_claim=False)
+    asyncio.run(_run())
     assert attempts["set"] == 2
+    # Other tasks kept running between the busy attempt and the retry.
+    assert ticks.count(1) >= 2
+
+
+def test_kernel_config_waits_for_claim_confirmation_event(monkeypatch) -> None:
+    from devialetctl.domain.events import InputEventType
+
+    def lost(payload):
+        payload.lost_msgs.lost_msgs = 2
+
+    def claimed(payload):
+        payload.state_change.phys_addr = 0x1000
+        payload.state_change.log_addr_mask = cec_adapter.CEC_LOG_ADDR_MASK_AUDIOSYSTEM
+
+    # The kernel reports the claim a few polls after S_LOG_ADDRS has returned.
+    polls = {"empty": 3}
+    queued: list = []
+    calls: list[int] = []
+    dqevent = _fake_dqevent_ioctl(queued, calls)
+
+    def fake_ioctl(fd, request, arg=0, mutate_flag=True):
+        if request == cec_adapter.CEC_ADAP_S_LOG_ADDRS:
+            queued.extend(
+                [
+                    (cec_adapter.CEC_EVENT_STATE_CHANGE, 0, lambda p: None),
+                    (cec_adapter.CEC_EVENT_LOST_MSGS, 0, lost),
+                    (cec_adapter.CEC_EVENT_STATE_CHANGE, 0, claimed),
+                ]
+            )
+        if request == cec_adapter.CEC_DQEVENT and polls["empty"] > 0:
+            polls["empty"] -= 1
+            raise OSError(errno.EAGAIN, "no event")
+        return dqevent(fd, request, arg, mutate_flag)
+
+    monkeypatch.setattr(cec_adapter.fcntl, "ioctl", fake_ioctl)
+    monkeypatch.setattr(
+        cec_adapter.CecKernelAdapter, "_open_readiness_poller", staticmethod(lambda *a, **k: None)
+    )
+    adapter = cec_adapter.CecKernelAdapter(_async_poll_interval_s=0.001)
+
+    asyncio.run(adapter._configure_async(7))
+
+    # Events seen while waiting are handed to the receive loop, not lost.
+    assert [(e.kind, e.value) for e in adapter._dequeue_kernel_events(7)] == [
+        (InputEventType.CEC_MESSAGES_LOST, 2),
+        (InputEventType.CEC_STATE_CHANGE, 0x1000),
+    ]
+
+
+def test_kernel_config_continues_when_claim_is_not_confirmed(monkeypatch) -> None:
+    def fake_ioctl(fd, request, arg=0, mutate_flag=True):
+        if request == cec_adapter.CEC_ADAP_G_LOG_ADDRS:
+            arg.log_addr_mask = 0
+        elif request == cec_adapter.CEC_DQEVENT:
+            raise OSError(errno.EAGAIN, "no event")
+        return 0
+
+    monkeypatch.setattr(cec_adapter.fcntl, "ioctl", fake_ioctl)
+    monkeypatch.setattr(
+        cec_adapter.CecKernelAdapter, "_open_readiness_poller", staticmethod(lambda *a, **k: None)
+    )
+    adapter = cec_adapter.CecKernelAdapter(
+        _async_poll_interval_s=0.001, _claim_confirm_timeout_s=0.02
+    )
+    asyncio.run(adapter._configure_async(7))
+    assert adapter._deferred_events == []
+
+
+def _fake_dqevent_ioctl(queued, calls):
+    def fake_ioctl(fd, request, arg=0, mutate_flag=True):
+        calls.append(request)
+        if request == cec_adapter.CEC_DQEVENT:
+            if not queued:
+                raise OSError(errno.EAGAIN, "no event")
+            kind, flags, fill = queued.pop(0)
+            arg.event = kind
+            arg.flags = flags
+            fill(arg.payload)
+        if request == cec_adapter.CEC_ADAP_G_LOG_ADDRS:
+            arg.log_addr_mask = 0
+        return 0
+
+    return fake_ioctl
+
+
+def test_kernel_events_are_dequeued_as_typed_events(monkeypatch) -> None:
+    from devialetctl.domain.events import InputEventType
+
+    def state_change(payload):
+        payload.state_change.phys_addr = 0x1000
+        payload.state_change.log_addr_mask = cec_adapter.CEC_LOG_ADDR_MASK_AUDIOSYSTEM
+
+    def lost(payload):
+        payload.lost_msgs.lost_msgs = 3
+
+    queued = [
+        (cec_adapter.CEC_EVENT_STATE_CHANGE, cec_adapter.CEC_EVENT_FL_INITIAL_STATE, state_change),
+        (cec_adapter.CEC_EVENT_LOST_MSGS, 0, lost),
+        (cec_adapter.CEC_EVENT_PIN_HPD_HIGH, 0, lambda _p: None),
+        (3, 0, lambda _p: None),  # CEC pin low: not surfaced
+    ]
+    calls: list[int] = []
+    monkeypatch.setattr(cec_adapter.fcntl, "ioctl", _fake_dqevent_ioctl(queued, calls))
+    adapter = cec_adapter.CecKernelAdapter()
+
+    events = adapter._dequeue_kernel_events(7)
+
+    assert [(e.kind, e.value) for e in events] == [
+        (InputEventType.CEC_STATE_CHANGE, 0x1000),
+        (InputEventType.CEC_MESSAGES_LOST, 3),
+        (InputEventType.CEC_HOTPLUG, 1),
+    ]
+    assert cec_adapter.CEC_ADAP_S_LOG_ADDRS not in calls
+
+
+def _state(phys_addr: int, mask: int):
+    def fill(payload):
+        payload.state_change.phys_addr = phys_addr
+        payload.state_change.log_addr_mask = mask
+
+    return fill
+
+
+def test_kernel_state_change_reclaims_lost_audio_system_address(monkeypatch) -> None:
+    queued = [
+        (
+            cec_adapter.CEC_EVENT_STATE_CHANGE,
+            cec_adapter.CEC_EVENT_FL_INITIAL_STATE,
+            _state(0x1000, cec_adapter.CEC_LOG_ADDR_MASK_AUDIOSYSTEM),
+        ),
+        (cec_adapter.CEC_EVENT_STATE_CHANGE, 0, _state(0x1000, 0)),
+    ]
+    calls: list[int] = []
+    monkeypatch.setattr(cec_adapter.fcntl, "ioctl", _fake_dqevent_ioctl(queued, calls))
+    adapter = cec_adapter.CecKernelAdapter(announce_vendor_id=True, spoof_vendor_id=True)
+    adapter._fd = 7
+
+    adapter.confirm_claim = False
+
+    events = adapter._dequeue_kernel_events(7)
+
+    assert len(events) == 2
+    # The claim is deferred to the receive loop instead of running inside dequeue.
+    assert adapter._reclaim_pending is True
+    assert cec_adapter.CEC_ADAP_S_LOG_ADDRS not in calls
+
+    asyncio.run(adapter._reclaim_async(7))
+
+    assert adapter._reclaim_pending is False
+    assert cec_adapter.CEC_ADAP_S_LOG_ADDRS in calls
+    assert cec_adapter.CEC_TRANSMIT in calls
+
+
+def test_kernel_does_not_reclaim_after_physical_address_change(monkeypatch) -> None:
+    queued = [
+        (
+            cec_adapter.CEC_EVENT_STATE_CHANGE,
+            cec_adapter.CEC_EVENT_FL_INITIAL_STATE,
+            _state(0x1000, cec_adapter.CEC_LOG_ADDR_MASK_AUDIOSYSTEM),
+        ),
+        # Moved to another HDMI input: the kernel re-claims at the new address itself.
+        (cec_adapter.CEC_EVENT_STATE_CHANGE, 0, _state(0x2000, 0)),
+    ]
+    monkeypatch.setattr(cec_adapter.fcntl, "ioctl", _fake_dqevent_ioctl(queued, []))
+    adapter = cec_adapter.CecKernelAdapter()
+
+    adapter._dequeue_kernel_events(7)
+
+    assert adapter._reclaim_pending is False
+
+
+def test_kernel_reclaim_skips_claim_in_progress_and_backs_off(monkeypatch) -> None:
+    calls: list[int] = []
+
+    def fake_ioctl(fd, request, arg=0, mutate_flag=True):
+        calls.append(request)
+        if request == cec_adapter.CEC_ADAP_G_LOG_ADDRS:
+            # Our configuration is still set: the kernel is claiming it.
+            arg.num_log_addrs = 1
+            arg.log_addr_mask = 0
+        return 0
+
+    now = [100.0]
+    monkeypatch.setattr(cec_adapter.fcntl, "ioctl", fake_ioctl)
+    adapter = cec_adapter.CecKernelAdapter(clock=lambda: now[0])
+    adapter._reclaim_pending = True
+
+    asyncio.run(adapter._reclaim_async(7))
+    asyncio.run(adapter._reclaim_async(7))
+
+    assert cec_adapter.CEC_ADAP_S_LOG_ADDRS not in calls
+    assert adapter._reclaim_not_before == 102.0
+    assert adapter._reclaim_interval_s == 4.0
+
+
+def test_kernel_wait_readable_wakes_on_fd_activity() -> None:
+    import os
+    import time
+
+    read_fd, write_fd = os.pipe()
+    adapter = cec_adapter.CecKernelAdapter(_async_idle_timeout_s=5.0)
+    poller = adapter._open_readiness_poller(read_fd)
+    if poller is None:
+        pytest.skip("epoll is not available on this platform")
+
+    async def _run() -> float:
+        asyncio.get_running_loop().call_later(0.02, os.write, write_fd, b"x")
+        started = time.monotonic()
+        await adapter._wait_readable(poller)
+        return time.monotonic() - started
+
+    try:
+        assert asyncio.run(_run()) < 1.0
+    finally:
+        poller.close()
+        os.close(read_fd)
+        os.close(write_fd)
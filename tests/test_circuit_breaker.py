@@ -0,0 +1,61 @@
+import pytest
+
+from devialetctl.infrastructure.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+
+
+def test_breaker_opens_after_threshold_and_probes_after_reset_timeout() -> None:
+    now = {"t": 0.0}
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_s=1.0, clock=lambda: now["t"])
+
+    assert breaker.acquire() is False
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allows_request()
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire()
+
+    now["t"] = 1.0
+    assert breaker.allows_request()
+    assert breaker.acquire() is True  # this caller probes
+    assert breaker.state == CircuitState.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire()  # only one probe at a time
+
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.acquire() is False
+    assert (breaker.trips, breaker.rejected) == (1, 2)
+
+
+def test_breaker_failed_probe_reopens_with_doubled_backoff() -> None:
+    now = {"t": 0.0}
+    breaker = CircuitBreaker(
+        failure_threshold=1, reset_timeout_s=1.0, max_reset_timeout_s=3.0, clock=lambda: now["t"]
+    )
+    breaker.record_failure()
+    for expected_open_s in (2.0, 3.0, 3.0):
+        now["t"] += 10.0
+        assert breaker.acquire() is True
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        now["t"] += expected_open_s - 0.01
+        assert not breaker.allows_request()
+        now["t"] += 0.01
+        assert breaker.allows_request()
+        now["t"] -= expected_open_s
+
+
+def test_breaker_cancelled_probe_lets_the_next_one_through() -> None:
+    now = {"t": 0.0}
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout_s=1.0, clock=lambda: now["t"])
+    breaker.record_failure()
+    now["t"] = 1.0
+    assert breaker.acquire() is True
+    breaker.abort_probe()
+    assert breaker.acquire() is True
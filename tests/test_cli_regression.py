@@ -1,4 +1,6 @@
+import asyncio
 import json
+import subprocess
 import sys
 
 import pytest
@@ -107,6 +109,44 @@ def test_cli_daemon_keyboard_selects_runner_mode(monkeypatch) -> None:
     assert FakeRunner.called_with == "keyboard"
 
 
+def test_cli_daemon_cec_defers_discovery_to_the_runner(monkeypatch) -> None:
+    from devialetctl.application.deferred_gateway import DeferredVolumeGateway
+
+    discovered: list[float] = []
+
+    class FakeDiscovery:
+        def discover(self, timeout_s):
+            discovered.append(timeout_s)
+
+            class Row:
+                name = "phantom"
+                address = "10.0.0.2"
+                port = 80
+                base_path = "/ipcontrol/v1"
+
+            return [Row()]
+
+    class FakeRunner:
+        gateway = None
+        discovered_before_run = None
+
+        def __init__(self, cfg, gateway):
+            FakeRunner.gateway = gateway
+
+        def run_forever(self, input_name):
+            FakeRunner.discovered_before_run = list(discovered)
+
+    monkeypatch.setattr(cli, "MdnsDiscoveryGateway", lambda: FakeDiscovery())
+    monkeypatch.setattr(cli, "DaemonRunner", FakeRunner)
+    monkeypatch.setattr(sys, "argv", ["devialetctl", "daemon"])
+    cli.main()
+
+    assert isinstance(FakeRunner.gateway, DeferredVolumeGateway)
+    assert FakeRunner.discovered_before_run == []
+    resolved = asyncio.run(FakeRunner.gateway.wait_ready())
+    assert resolved.base_url == "http://10.0.0.2:80/ipcontrol/v1"
+
+
 def test_cli_daemon_accepts_subcommand_system(monkeypatch) -> None:
     class FakeDiscovery:
         def discover(self, timeout_s):
@@ -602,3 +642,166 @@ def test_cli_daemon_handles_keyboard_interrupt(monkeypatch) -> None:
     monkeypatch.setattr(sys, "argv", ["devialetctl", "daemon", "--input", "keyboard"])
 
     cli.main()
+
+
+def test_cli_daemon_runs_configured_bindings_with_shared_discovery(monkeypatch, tmp_path) -> None:
+    from devialetctl.application.multi_daemon import MultiDaemonRunner
+    from devialetctl.application.ports import Target
+
+    cfg_file = tmp_path / "config.toml"
+    cfg_file.write_text(
+        'state_file = ""\n'
+        '[[bindings]]\ncec_device = "/dev/cec0"\nsystem = "Living"\n'
+        '[[bindings]]\ncec_device = "/dev/cec1"\nsystem = "Bedroom"\n'
+        '[[bindings]]\ncec_device = "/dev/cec2"\nip = "10.0.0.9"\n',
+        encoding="utf-8",
+    )
+    discoveries: list[float] = []
+    services = [
+        Target("10.0.0.2", 80, "/ipcontrol/v1", "Living"),
+        Target("10.0.0.3", 80, "/x", "Bedroom"),
+    ]
+
+    def fake_discover(timeout_s):
+        discoveries.append(timeout_s)
+        return services
+
+    def fake_pick(found, system_name, gateway_factory):
+        return next(svc for svc in found if svc.name == system_name)
+
+    started: list[MultiDaemonRunner] = []
+    monkeypatch.setattr(cli, "_discover_targets", fake_discover)
+    monkeypatch.setattr(cli, "pick_target_by_system_name", fake_pick)
+    monkeypatch.setattr(MultiDaemonRunner, "run_forever", lambda self: started.append(self))
+    monkeypatch.setattr(sys, "argv", ["devialetctl", "--config", str(cfg_file), "daemon"])
+    cli.main()
+
+    (multi,) = started
+    assert [runner.cfg.cec_device for runner in multi.runners] == [
+        "/dev/cec0",
+        "/dev/cec1",
+        "/dev/cec2",
+    ]
+
+    async def _resolve_all():
+        return await asyncio.gather(*(runner.gateway.wait_ready() for runner in multi.runners))
+
+    gateways = asyncio.run(_resolve_all())
+    assert [gw.base_url for gw in gateways] == [
+        "http://10.0.0.2:80/ipcontrol/v1",
+        "http://10.0.0.3:80/x",
+        "http://10.0.0.9:80/ipcontrol/v1",
+    ]
+    assert discoveries == [3.0]
+    assert len({id(gw.pool) for gw in gateways}) == 1
+
+
+def test_cli_daemon_rejects_cec_device_with_bindings(monkeypatch, tmp_path, capsys) -> None:
+    cfg_file = tmp_path / "config.toml"
+    cfg_file.write_text('[[bindings]]\ncec_device = "/dev/cec0"\n', encoding="utf-8")
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["devialetctl", "--config", str(cfg_file), "daemon", "--cec-device", "/dev/cec1"],
+    )
+    with pytest.raises(SystemExit) as exc:
+        cli.main()
+    assert exc.value.code == 2
+    assert "--cec-device cannot be combined" in capsys.readouterr().err
+
+
+def test_cli_fleet_polls_one_target_per_discovered_system(monkeypatch, capsys) -> None:
+    from devialetctl.application.ports import Target
+
+    services = [
+        Target("10.0.0.2", 80, "/ipcontrol/v1", "a"),
+        Target("10.0.0.3", 80, "/ipcontrol/v1", "b"),
+    ]
+    tree = {
+        "groups": [
+            {
+                "group_id": "g",
+                "systems": [
+                    {"system_name": "Living", "devices": [{"address": "10.0.0.2", "port": 80}]},
+                    {"system_name": "Office", "devices": [{"address": "10.0.0.3", "port": 80}]},
+                ],
+            }
+        ],
+        "ungrouped_devices": [],
+        "errors": [],
+    }
+    runs = []
+
+    async def fake_run_fleet(targets, interval_s, per_host_limit):
+        runs.append(([t.name for t in targets], interval_s, per_host_limit))
+
+    monkeypatch.setattr(cli, "_discover_targets", lambda timeout_s: services)
+    monkeypatch.setattr(cli, "build_topology_tree", lambda found, gateway_factory: tree)
+    monkeypatch.setattr(cli, "_run_fleet", fake_run_fleet)
+    monkeypatch.setattr(sys, "argv", ["devialetctl", "fleet", "--interval", "2.5"])
+    cli.main()
+    assert runs == [(["Living", "Office"], 2.5, 1)]
+
+
+def test_cli_fleet_prints_state_changes_as_json_lines(capsys) -> None:
+    from devialetctl.application.fleet import FleetStateChange
+
+    cli._print_fleet_change(FleetStateChange(name="Living", volume=31, muted=False))
+    assert json.loads(capsys.readouterr().out) == {
+        "name": "Living",
+        "volume": 31,
+        "muted": False,
+        "available": True,
+    }
+
+
+def test_cli_fleet_rejects_target_selection(monkeypatch) -> None:
+    monkeypatch.setattr(sys, "argv", ["devialetctl", "--ip", "10.0.0.2", "fleet"])
+    with pytest.raises(SystemExit):
+        cli.main()
+
+
+@pytest.mark.parametrize(
+    "option", [["--interval", "0"], ["--interval", "-1"], ["--per-host-limit", "0"]]
+)
+def test_cli_fleet_rejects_non_positive_interval_and_limit(monkeypatch, capsys, option) -> None:
+    monkeypatch.setattr(sys, "argv", ["devialetctl", "fleet", *option])
+    with pytest.raises(SystemExit) as exc:
+        cli.main()
+    assert exc.value.code == 2
+    assert "must be greater than 0" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    ("argv", "message"),
+    [
+        (["daemon", "--metrics-port", "70000"], "must be a port between 0 and 65535"),
+        (["daemon", "--metrics-port", "-1"], "must be a port between 0 and 65535"),
+        (["bench", "daemon", "--rtt-ms", "-5"], "must not be negative"),
+        (["bench", "daemon", "--jitter", "-0.1"], "must not be negative"),
+    ],
+)
+def test_cli_rejects_out_of_range_numbers_at_parse_time(monkeypatch, capsys, argv, message) -> None:
+    monkeypatch.setattr(sys, "argv", ["devialetctl", *argv])
+    with pytest.raises(SystemExit) as exc:
+        cli.main()
+    assert exc.value.code == 2
+    assert message in capsys.readouterr().err
+
+
+def test_cli_import_leaves_offline_tooling_unloaded() -> None:
+    offline = [
+        "devialetctl.interfaces.benchmark",
+        "devialetctl.interfaces.microbench",
+        "devialetctl.interfaces.trace_analysis",
+        "devialetctl.application.replay",
+        "devialetctl.infrastructure.fake_phantom",
+    ]
+    code = (
+        "import sys, devialetctl.interfaces.cli; "
+        f"print([name for name in {offline!r} if name in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
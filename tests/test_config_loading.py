@@ -75,3 +75,100 @@ def test_load_config_env_overrides_vendor_compat(monkeypatch, tmp_path) -> None:
     monkeypatch.setenv("DEVIALETCTL_CEC_VENDOR_COMPAT", "samsung")
     cfg = load_config(str(cfg_file))
     assert cfg.cec_vendor_compat == "samsung"
+
+
+def test_load_config_defaults_state_file_to_xdg_state_home(monkeypatch, tmp_path) -> None:
+    cfg_file = tmp_path / "config.toml"
+    cfg_file.write_text("", encoding="utf-8")
+    monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path / "state"))
+    cfg = load_config(str(cfg_file))
+    assert cfg.state_file == str(tmp_path / "state" / "devialetctl" / "state.json")
+
+
+def test_load_config_env_overrides_or_disables_state_file(monkeypatch, tmp_path) -> None:
+    cfg_file = tmp_path / "config.toml"
+    cfg_file.write_text("", encoding="utf-8")
+    monkeypatch.setenv("DEVIALETCTL_STATE_FILE", "/var/lib/devialetctl/state.json")
+    assert load_config(str(cfg_file)).state_file == "/var/lib/devialetctl/state.json"
+    monkeypatch.setenv("DEVIALETCTL_STATE_FILE", "")
+    assert load_config(str(cfg_file)).state_file == ""
+
+
+def test_load_config_parses_cec_bindings(tmp_path) -> None:
+    cfg_file = tmp_path / "config.toml"
+    cfg_file.write_text(
+        'state_file = "/var/lib/devialetctl/state.json"\n'
+        'trace_file = "/var/log/devialetctl/trace.jsonl"\n'
+        'capture_file = "/var/log/devialetctl/capture.bin"\n'
+        'cec_vendor_compat = "samsung"\n'
+        "[[bindings]]\n"
+        'cec_device = "/dev/cec0"\n'
+        'system = "Living Room"\n'
+        "[[bindings]]\n"
+        'cec_device = "/dev/cec1"\n'
+        'ip = "10.0.0.3"\n'
+        'cec_osd_name = "Bedroom"\n'
+        'cec_vendor_compat = "NONE"\n',
+        encoding="utf-8",
+    )
+    cfg = load_config(str(cfg_file))
+    assert [(b.cec_device, b.system, b.ip) for b in cfg.bindings] == [
+        ("/dev/cec0", "Living Room", None),
+        ("/dev/cec1", None, "10.0.0.3"),
+    ]
+
+    living, bedroom = (cfg.for_binding(b) for b in cfg.bindings)
+    assert (living.cec_device, living.cec_osd_name, living.cec_vendor_compat) == (
+        "/dev/cec0",
+        "Devialet",
+        "samsung",
+    )
+    assert living.state_file == "/var/lib/devialetctl/state-cec0.json"
+    assert (bedroom.cec_osd_name, bedroom.cec_vendor_compat) == ("Bedroom", "none")
+    assert bedroom.state_file == "/var/lib/devialetctl/state-cec1.json"
+    assert bedroom.trace_file == "/var/log/devialetctl/trace-cec1.jsonl"
+    assert bedroom.capture_file == "/var/log/devialetctl/capture-cec1.bin"
+    assert bedroom.bindings == ()
+    assert (living.state_target, bedroom.state_target) == ("system:Living Room", "ip:10.0.0.3:80")
+
+
+def test_load_config_rejects_invalid_bindings(tmp_path) -> None:
+    cfg_file = tmp_path / "config.toml"
+    cfg_file.write_text(
+        '[[bindings]]\ncec_device = "/dev/cec0"\n[[bindings]]\ncec_device = "/dev/cec0"\n',
+        encoding="utf-8",
+    )
+    with pytest.raises(ValueError, match="own cec_device"):
+        load_config(str(cfg_file))
+    cfg_file.write_text(
+        '[[bindings]]\ncec_device = "/dev/cec0"\nip = "10.0.0.2"\nsystem = "TV"\n',
+        encoding="utf-8",
+    )
+    with pytest.raises(ValueError, match="either ip or system"):
+        load_config(str(cfg_file))
+
+
+def test_load_config_reads_metrics_port_from_file_and_env(monkeypatch, tmp_path) -> None:
+    cfg_file = tmp_path / "config.toml"
+    cfg_file.write_text("metrics_port = 9464\n", encoding="utf-8")
+    cfg = load_config(str(cfg_file))
+    assert cfg.metrics_port == 9464
+    assert cfg.metrics_host == "127.0.0.1"
+    monkeypatch.setenv("DEVIALETCTL_METRICS_PORT", "")
+    assert load_config(str(cfg_file)).metrics_port is None
+    cfg_file.write_text("metrics_port = 70000\n", encoding="utf-8")
+    monkeypatch.delenv("DEVIALETCTL_METRICS_PORT")
+    with pytest.raises(ValueError):
+        load_config(str(cfg_file))
+
+
+def test_load_config_defaults_flight_recorder_dir_to_state_dir(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path / "state"))
+    cfg_file = tmp_path / "config.toml"
+    cfg_file.write_text("flight_recorder_size = 0\n", encoding="utf-8")
+    cfg = load_config(str(cfg_file))
+    assert cfg.flight_recorder_size == 0
+    assert cfg.flight_recorder_dir == str(tmp_path / "state" / "devialetctl")
+    cfg_file.write_text("flight_recorder_size = -1\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_config(str(cfg_file))
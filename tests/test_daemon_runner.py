@@ -1,4 +1,8 @@
 import asyncio
+import contextlib
+import random
+
+import pytest
 
 from devialetctl.application.daemon import DaemonRunner
 from devialetctl.infrastructure.config import DaemonConfig, RuntimeTarget
@@ -45,7 +49,8 @@ def test_daemon_runner_routes_events(monkeypatch) -> None:
         runner.run_cec_forever()
     except KeyboardInterrupt:
         pass
-    assert gw.calls == [("set", 1)]
+    # Cold cache: a single native volumeUp call instead of GET + POST.
+    assert gw.calls == ["up"]
 
 
 def test_daemon_runner_keyboard_mode(monkeypatch) -> None:
@@ -215,6 +220,8 @@ def test_daemon_runner_replies_system_audio_and_arc_requests(monkeypatch) -> Non
                 source="cec",
                 key="GIVE_OSD_NAME",
             )
+            # Eight replies exceed the TX burst: let the scheduler drain before closing.
+            await asyncio.sleep(0.3)
             raise KeyboardInterrupt()
 
         def send_tx(self, frame: str) -> bool:
@@ -413,15 +420,21 @@ def test_daemon_runner_reuses_cached_audio_state_for_release_report(monkeypatch)
     cfg = DaemonConfig(target=RuntimeTarget(ip="10.0.0.2"), min_interval_s=0.0, dedupe_window_s=0.0)
     gw = FakeGateway()
     runner = DaemonRunner(cfg=cfg, gateway=gw)
+    runner._cached_volume = 10
+    runner._cached_muted = False
+    # Keep external watcher polls out of the GET counts below.
+    runner._external_watch_suspend_s = 60.0
+    runner._suspend_external_watch_for_push()
     try:
         runner.run_cec_forever()
     except KeyboardInterrupt:
         pass
 
+    assert gw.current_volume == 11
     assert sent_frames == ["50:7A:0B"]
-    # 1 GET from relative step (volume_up) + 1 GET for report after handled event.
-    assert gw.get_volume_calls == 2
-    assert gw.get_mute_calls == 1
+    # Warm cache: the step and the report need no GET at all.
+    assert gw.get_volume_calls == 0
+    assert gw.get_mute_calls == 0
 
 
 def test_daemon_runner_replies_samsung_vendor_95(monkeypatch) -> None:
@@ -910,3 +923,977 @@ def test_external_watcher_is_suspended_during_cec_push_window() -> None:
     assert muted is False
     assert gw.get_volume_calls == 0
     assert gw.get_mute_calls == 0
+
+
+def test_protocol_replies_do_not_wait_for_io_lock() -> None:
+    class FakeGateway:
+        def __init__(self):
+            self.get_volume_calls = 0
+
+        async def systems_async(self):
+            return {}
+
+        async def get_volume_async(self):
+            self.get_volume_calls += 1
+            return 20
+
+        async def get_mute_state_async(self):
+            return False
+
+        async def set_volume_async(self, volume):
+            return None
+
+        async def volume_up_async(self):
+            return None
+
+        async def volume_down_async(self):
+            return None
+
+        async def mute_toggle_async(self):
+            return None
+
+    class FakeAdapter:
+        def __init__(self):
+            self.sent_frames: list[str] = []
+
+        def send_tx(self, frame: str) -> bool:
+            self.sent_frames.append(frame)
+            return True
+
+    from devialetctl.domain.events import InputEvent, InputEventType
+
+    cfg = DaemonConfig(
+        target=RuntimeTarget(ip="10.0.0.2"),
+        min_interval_s=0.0,
+        dedupe_window_s=0.0,
+        cec_vendor_compat="samsung",
+    )
+    gw = FakeGateway()
+    runner = DaemonRunner(cfg=cfg, gateway=gw)
+    runner._cached_volume = 20
+    runner._cached_muted = False
+    adapter = FakeAdapter()
+
+    async def _run() -> None:
+        runner._io_lock = asyncio.Lock()
+        async with runner._io_lock:
+            for kind in (
+                InputEventType.GIVE_OSD_NAME,
+                InputEventType.SYSTEM_AUDIO_MODE_REQUEST,
+                InputEventType.GIVE_AUDIO_STATUS,
+            ):
+                event = InputEvent(kind=kind, source="cec", key=kind.name)
+                await asyncio.wait_for(runner._handle_cec_event_async(adapter, event), 0.5)
+            vendor_sync = InputEvent(
+                kind=InputEventType.SAMSUNG_VENDOR_COMMAND,
+                source="cec",
+                key="SAMSUNG_VENDOR_COMMAND",
+                vendor_subcommand=0x95,
+                vendor_payload=(0x95,),
+            )
+            await asyncio.wait_for(runner._handle_cec_event_async(adapter, vendor_sync), 0.5)
+
+    asyncio.run(_run())
+
+    assert adapter.sent_frames == [
+        "50:47:44:65:76:69:61:6C:65:74",
+        "50:72:01",
+        "50:7A:14",
+        "50:89:95:01:14",
+    ]
+    assert gw.get_volume_calls == 0
+    assert runner._is_external_watch_suspended() is False
+
+
+def _slow_state_gateway(volume: int, muted: bool, delay_s: float):
+    class FakeGateway:
+        async def systems_async(self):
+            return {}
+
+        async def get_volume_async(self):
+            await asyncio.sleep(delay_s)
+            return volume
+
+        async def get_mute_state_async(self):
+            await asyncio.sleep(delay_s)
+            return muted
+
+        async def set_volume_async(self, value):
+            return None
+
+        async def volume_up_async(self):
+            return None
+
+        async def volume_down_async(self):
+            return None
+
+        async def mute_toggle_async(self):
+            return None
+
+    return FakeGateway()
+
+
+def test_give_audio_status_feature_aborts_then_corrects_when_cold_fetch_is_late() -> None:
+    from devialetctl.domain.events import InputEvent, InputEventType
+
+    class FakeAdapter:
+        def __init__(self):
+            self.sent_frames: list[str] = []
+
+        def send_tx(self, frame: str) -> bool:
+            self.sent_frames.append(frame)
+            return True
+
+    cfg = DaemonConfig(target=RuntimeTarget(ip="10.0.0.2"), min_interval_s=0.0, dedupe_window_s=0.0)
+    runner = DaemonRunner(cfg=cfg, gateway=_slow_state_gateway(30, True, delay_s=0.05))
+    runner._cec_reply_deadline_s = 0.02
+    adapter = FakeAdapter()
+
+    async def _run() -> None:
+        runner._io_lock = asyncio.Lock()
+        event = InputEvent(
+            kind=InputEventType.GIVE_AUDIO_STATUS,
+            source="cec",
+            key="GIVE_AUDIO_STATUS",
+        )
+        await runner._handle_cec_event_async(adapter, event)
+        assert adapter.sent_frames == ["50:00:71:01"]
+        await asyncio.sleep(0.2)
+
+    asyncio.run(_run())
+
+    # 30 with muted bit => 0x9E
+    assert adapter.sent_frames == ["50:00:71:01", "50:7A:9E"]
+    assert runner.deadline_stats.misses == 1
+    assert runner.deadline_stats.feature_aborts == 1
+    assert runner.deadline_stats.corrective_reports == 1
+    assert runner._cached_volume == 30
+    assert runner._cached_muted is True
+
+
+def test_give_audio_status_aborts_when_only_volume_is_known() -> None:
+    from devialetctl.domain.events import InputEvent, InputEventType
+
+    class FakeAdapter:
+        def __init__(self):
+            self.sent_frames: list[str] = []
+
+        def send_tx(self, frame: str) -> bool:
+            self.sent_frames.append(frame)
+            return True
+
+    cfg = DaemonConfig(target=RuntimeTarget(ip="10.0.0.2"), min_interval_s=0.0, dedupe_window_s=0.0)
+    runner = DaemonRunner(cfg=cfg, gateway=_slow_state_gateway(12, False, delay_s=0.05))
+    runner._cec_reply_deadline_s = 0.02
+    runner._cached_volume = 12
+    adapter = FakeAdapter()
+
+    async def _run() -> None:
+        runner._io_lock = asyncio.Lock()
+        event = InputEvent(
+            kind=InputEventType.GIVE_AUDIO_STATUS,
+            source="cec",
+            key="GIVE_AUDIO_STATUS",
+        )
+        await runner._handle_cec_event_async(adapter, event)
+        await asyncio.sleep(0.2)
+
+    asyncio.run(_run())
+
+    # Unknown mute is not reported as "unmuted"; the late fetch then corrects the TV.
+    assert adapter.sent_frames == ["50:00:71:01", "50:7A:0C"]
+    assert runner.deadline_stats.misses == 1
+    assert runner.deadline_stats.feature_aborts == 1
+    assert runner.deadline_stats.fallback_replies == 0
+    assert runner.deadline_stats.corrective_reports == 1
+
+
+def test_late_audio_status_fetch_is_cancelled_when_cec_session_ends() -> None:
+    from devialetctl.domain.events import InputEvent, InputEventType
+
+    class FakeAdapter:
+        def __init__(self):
+            self.sent_frames: list[str] = []
+
+        def send_tx(self, frame: str) -> bool:
+            self.sent_frames.append(frame)
+            return True
+
+        async def async_events(self):
+            yield InputEvent(kind=InputEventType.GIVE_AUDIO_STATUS, source="cec", key="GIVE")
+            await asyncio.sleep(0.05)
+
+    cfg = DaemonConfig(target=RuntimeTarget(ip="10.0.0.2"), min_interval_s=0.0, dedupe_window_s=0.0)
+    runner = DaemonRunner(cfg=cfg, gateway=_slow_state_gateway(30, True, delay_s=0.1))
+    runner._cec_reply_deadline_s = 0.02
+    adapter = FakeAdapter()
+
+    async def _run() -> None:
+        runner._io_lock = asyncio.Lock()
+        await runner._run_cec_async(adapter)
+        assert not runner._background_tasks
+        # The cancelled fetch never reports through the closed adapter.
+        await asyncio.sleep(0.3)
+
+    asyncio.run(_run())
+
+    assert adapter.sent_frames == ["50:00:71:01"]
+    assert runner.deadline_stats.corrective_reports == 0
+
+
+def test_cec_reception_continues_while_speaker_write_is_slow(monkeypatch) -> None:
+    from devialetctl.domain.events import InputEvent, InputEventType
+
+    class FakeGateway:
+        def __init__(self):
+            self.calls = []
+
+        async def systems_async(self):
+            return {}
+
+        async def get_volume_async(self):
+            return 10
+
+        async def get_mute_state_async(self):
+            return False
+
+        async def set_volume_async(self, volume):
+            self.calls.append(("set", volume))
+            await asyncio.sleep(0.05)
+
+        async def volume_up_async(self):
+            return None
+
+        async def volume_down_async(self):
+            return None
+
+        async def mute_toggle_async(self):
+            return None
+
+    sent_frames: list[str] = []
+
+    class BurstAdapter:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+        async def async_events(self):
+            for value in (10, 11, 12, 13, 14):
+                yield InputEvent(
+                    kind=InputEventType.SET_AUDIO_VOLUME_LEVEL,
+                    source="cec",
+                    key="SET_AUDIO_VOLUME_LEVEL",
+                    value=value,
+                )
+                await asyncio.sleep(0.001)
+            yield InputEvent(kind=InputEventType.GIVE_OSD_NAME, source="cec", key="GIVE_OSD_NAME")
+            raise KeyboardInterrupt()
+
+        def send_tx(self, frame: str) -> bool:
+            sent_frames.append(frame)
+            return True
+
+    monkeypatch.setattr("devialetctl.application.daemon.CecKernelAdapter", BurstAdapter)
+    cfg = DaemonConfig(target=RuntimeTarget(ip="10.0.0.2"), min_interval_s=0.0, dedupe_window_s=0.0)
+    gw = FakeGateway()
+    runner = DaemonRunner(cfg=cfg, gateway=gw)
+    try:
+        runner.run_cec_forever()
+    except KeyboardInterrupt:
+        pass
+
+    # The first level is in flight; the following ones collapse into the latest value.
+    assert gw.calls == [("set", 10), ("set", 14)]
+    # The OSD name reply is not held back behind the slow volume writes.
+    assert sent_frames[0] == "50:47:44:65:76:69:61:6C:65:74"
+    assert sent_frames[1:] == ["50:7A:0A", "50:7A:0E"]
+    assert runner.queue_stats.coalesced == 3
+
+
+def test_relative_step_reconciles_cache_after_native_step() -> None:
+    from devialetctl.domain.events import InputEvent, InputEventType
+
+    class FakeGateway:
+        def __init__(self):
+            self.calls = []
+            self.current_volume = 40
+
+        async def systems_async(self):
+            return {}
+
+        async def get_volume_async(self):
+            self.calls.append("get")
+            return self.current_volume
+
+        async def get_mute_state_async(self):
+            return False
+
+        async def set_volume_async(self, volume):
+            self.calls.append(("set", volume))
+            self.current_volume = volume
+
+        async def volume_up_async(self):
+            self.calls.append("up")
+            self.current_volume += 2
+
+        async def volume_down_async(self):
+            self.calls.append("down")
+            self.current_volume -= 2
+
+        async def mute_toggle_async(self):
+            return None
+
+    class FakeAdapter:
+        def __init__(self):
+            self.sent_frames: list[str] = []
+
+        def send_tx(self, frame: str) -> bool:
+            self.sent_frames.append(frame)
+            return True
+
+    cfg = DaemonConfig(target=RuntimeTarget(ip="10.0.0.2"), min_interval_s=0.0, dedupe_window_s=0.0)
+    gw = FakeGateway()
+    runner = DaemonRunner(cfg=cfg, gateway=gw)
+    runner._reconcile_delay_s = 0.02
+    adapter = FakeAdapter()
+
+    async def _run() -> None:
+        runner._io_lock = asyncio.Lock()
+        up = InputEvent(kind=InputEventType.VOLUME_UP, source="cec", key="VOLUME_UP")
+        await runner._handle_cec_event_async(adapter, up)
+        assert gw.calls == ["up"]
+        assert adapter.sent_frames == []
+        await asyncio.sleep(0.1)
+        # Cache is now warm: the next key press is a single absolute POST.
+        await runner._handle_cec_event_async(adapter, up)
+        await asyncio.sleep(0.1)
+
+    asyncio.run(_run())
+
+    assert gw.calls == ["up", "get", ("set", 43), "get"]
+    # 42 from the reconcile, then 43 reported straight from the cache.
+    assert adapter.sent_frames == ["50:7A:2A", "50:7A:2B"]
+
+
+def test_merged_volume_key_repeats_apply_every_step() -> None:
+    from devialetctl.domain.events import InputEvent, InputEventType
+
+    class FakeGateway:
+        def __init__(self):
+            self.calls = []
+
+        async def set_volume_async(self, volume):
+            self.calls.append(("set", volume))
+
+        async def volume_up_async(self):
+            self.calls.append("up")
+
+        async def volume_down_async(self):
+            self.calls.append("down")
+
+    class FakeAdapter:
+        def send_tx(self, frame: str) -> bool:
+            return True
+
+    cfg = DaemonConfig(target=RuntimeTarget(ip="10.0.0.2"), min_interval_s=0.0, dedupe_window_s=0.0)
+    gw = FakeGateway()
+    runner = DaemonRunner(cfg=cfg, gateway=gw)
+    runner._reconcile_delay_s = 60.0
+    up = InputEvent(kind=InputEventType.VOLUME_UP, source="cec", key="VOLUME_UP")
+    down = InputEvent(kind=InputEventType.VOLUME_DOWN, source="cec", key="VOLUME_DOWN")
+
+    async def _run() -> None:
+        runner._io_lock = asyncio.Lock()
+        # Cold cache: one native step per merged press.
+        await runner._handle_cec_event_async(FakeAdapter(), down, repeats=2)
+        runner._cached_volume, runner._cached_muted = 20, False
+        # Warm cache: the merged presses become one absolute write.
+        await runner._handle_cec_event_async(FakeAdapter(), up, repeats=3)
+        runner._reconcile_task.cancel()
+
+    asyncio.run(_run())
+
+    assert gw.calls == ["down", "down", ("set", 23)]
+    assert runner._cached_volume == 23
+
+
+def test_cec_reader_restarts_on_same_loop_with_warm_state(monkeypatch) -> None:
+    from devialetctl.domain.events import InputEvent, InputEventType
+
+    class FakeGateway:
+        def __init__(self):
+            self.calls = []
+            self.sessions = 0
+
+        @contextlib.asynccontextmanager
+        async def session(self):
+            self.sessions += 1
+            yield self
+
+        async def systems_async(self):
+            return {}
+
+        async def get_volume_async(self):
+            return 30
+
+        async def get_mute_state_async(self):
+            return False
+
+        async def set_volume_async(self, volume):
+            self.calls.append(("set", volume))
+
+        async def volume_up_async(self):
+            self.calls.append("up")
+
+        async def volume_down_async(self):
+            self.calls.append("down")
+
+        async def mute_toggle_async(self):
+            return None
+
+    loops: list[asyncio.AbstractEventLoop] = []
+    sent_frames: list[str] = []
+
+    class FlakyAdapter:
+        instances = 0
+
+        def __init__(self, **kwargs):
+            FlakyAdapter.instances += 1
+            self.instance = FlakyAdapter.instances
+
+        async def async_events(self):
+            loops.append(asyncio.get_running_loop())
+            if self.instance == 1:
+                raise OSError("cec device vanished")
+            yield InputEvent(kind=InputEventType.VOLUME_UP, source="cec", key="VOLUME_UP")
+            raise KeyboardInterrupt()
+
+        def send_tx(self, frame: str) -> bool:
+            sent_frames.append(frame)
+            return True
+
+    monkeypatch.setattr("devialetctl.application.daemon.CecKernelAdapter", FlakyAdapter)
+    cfg = DaemonConfig(
+        target=RuntimeTarget(ip="10.0.0.2"),
+        min_interval_s=0.0,
+        dedupe_window_s=0.0,
+        reconnect_delay_s=0.01,
+    )
+    gw = FakeGateway()
+    runner = DaemonRunner(cfg=cfg, gateway=gw)
+    runner._cached_volume = 30
+    runner._cached_muted = False
+    try:
+        runner.run_cec_forever()
+    except KeyboardInterrupt:
+        pass
+
+    assert FlakyAdapter.instances == 2
+    assert loops[0] is loops[1]
+    assert gw.sessions == 1
+    assert runner.restart_counts == {"cec reader": 1}
+    # The warm cache survived the reconnect: one absolute POST, reported from cache.
+    assert gw.calls == [("set", 31)]
+    assert sent_frames == ["50:7A:1F"]
+
+
+def test_cec_reader_reconnects_as_soon_as_device_node_reappears(monkeypatch, tmp_path) -> None:
+    import threading
+    import time
+
+    from devialetctl.domain.events import InputEvent, InputEventType
+
+    class FakeGateway:
+        async def systems_async(self):
+            return {}
+
+        async def get_volume_async(self):
+            return 30
+
+        async def get_mute_state_async(self):
+            return False
+
+        async def set_volume_async(self, volume):
+            return None
+
+        async def volume_up_async(self):
+            return None
+
+        async def volume_down_async(self):
+            return None
+
+        async def mute_toggle_async(self):
+            return None
+
+    node = tmp_path / "cec0"
+    sent_frames: list[str] = []
+
+    class NodeAdapter:
+        def __init__(self, device, **kwargs):
+            self.device = device
+
+        async def async_events(self):
+            if not node.exists():
+                raise FileNotFoundError(self.device)
+            yield InputEvent(kind=InputEventType.GIVE_OSD_NAME, source="cec", key="GIVE_OSD_NAME")
+            raise KeyboardInterrupt()
+
+        def send_tx(self, frame: str) -> bool:
+            sent_frames.append(frame)
+            return True
+
+    monkeypatch.setattr("devialetctl.application.daemon.CecKernelAdapter", NodeAdapter)
+    cfg = DaemonConfig(
+        target=RuntimeTarget(ip="10.0.0.2"),
+        cec_device=str(node),
+        reconnect_delay_s=30.0,
+    )
+    runner = DaemonRunner(cfg=cfg, gateway=FakeGateway())
+    threading.Timer(0.1, node.write_bytes, args=(b"",)).start()
+    started = time.monotonic()
+    try:
+        runner.run_cec_forever()
+    except KeyboardInterrupt:
+        pass
+
+    # Far below the 15-30s jittered backoff: the node re-appearance woke the supervisor.
+    assert time.monotonic() - started < 5.0
+    assert runner.restart_counts == {"cec reader": 1}
+    assert sent_frames == ["50:47:44:65:76:69:61:6C:65:74"]
+
+
+def test_restart_backoff_jitter_draws_from_the_injected_rng(monkeypatch) -> None:
+    cfg = DaemonConfig(target=RuntimeTarget(ip="10.0.0.2"), reconnect_delay_s=2.0)
+    runner = DaemonRunner(cfg=cfg, gateway=None, rng=random.Random(5))
+    delays: list[float] = []
+
+    async def no_wait(delay_s, stop_event, wake):
+        delays.append(delay_s)
+
+    monkeypatch.setattr(DaemonRunner, "_backoff_wait_async", staticmethod(no_wait))
+
+    async def scenario() -> None:
+        stop_event = asyncio.Event()
+        failures = iter([RuntimeError("first"), RuntimeError("second")])
+
+        async def run() -> None:
+            failure = next(failures, None)
+            if failure is None:
+                stop_event.set()
+                return
+            raise failure
+
+        await runner._supervise_component_async("watcher", run, stop_event)
+
+    asyncio.run(scenario())
+
+    expected = random.Random(5)
+    assert delays == [2.0 * expected.uniform(0.5, 1.0), 4.0 * expected.uniform(0.5, 1.0)]
+    assert runner.restart_counts == {"watcher": 2}
+
+
+def test_recorders_are_stamped_with_the_runner_clock(tmp_path) -> None:
+    from devialetctl.infrastructure.capture_file import read_capture
+
+    cfg = DaemonConfig(
+        target=RuntimeTarget(ip="10.0.0.2"),
+        flight_recorder_size=8,
+        capture_file=str(tmp_path / "capture.bin"),
+    )
+    runner = DaemonRunner(cfg=cfg, gateway=None, clock=lambda: 42.5)
+
+    runner._recorder.record_cec_rx(b"\x05\x71")
+    runner.capture.close()
+
+    (record,) = runner.flight_recorder.records()
+    assert record.ts_s == 42.5
+    assert [record.ts_s for record in read_capture(cfg.capture_file)] == [42.5]
+
+
+def test_kernel_hotplug_event_resyncs_audio_status() -> None:
+    from devialetctl.domain.events import InputEvent, InputEventType
+
+    class FakeGateway:
+        async def systems_async(self):
+            return {}
+
+        async def get_volume_async(self):
+            return 25
+
+        async def get_mute_state_async(self):
+            return False
+
+        async def set_volume_async(self, volume):
+            return None
+
+        async def volume_up_async(self):
+            return None
+
+        async def volume_down_async(self):
+            return None
+
+        async def mute_toggle_async(self):
+            return None
+
+    class FakeAdapter:
+        def __init__(self):
+            self.sent_frames: list[str] = []
+
+        def send_tx(self, frame: str) -> bool:
+            self.sent_frames.append(frame)
+            return True
+
+    cfg = DaemonConfig(target=RuntimeTarget(ip="10.0.0.2"))
+    runner = DaemonRunner(cfg=cfg, gateway=FakeGateway())
+    runner._reconcile_delay_s = 0.0
+    runner._cached_volume = 20
+    runner._cached_muted = False
+    adapter = FakeAdapter()
+
+    async def _run() -> None:
+        runner._io_lock = asyncio.Lock()
+        for kind, value in (
+            (InputEventType.CEC_HOTPLUG, 0),
+            (InputEventType.CEC_STATE_CHANGE, 0xFFFF),
+            (InputEventType.CEC_HOTPLUG, 1),
+        ):
+            event = InputEvent(kind=kind, source="cec", key=kind.name, value=value)
+            await runner._handle_cec_event_async(adapter, event)
+        await asyncio.sleep(0.05)
+
+    asyncio.run(_run())
+
+    # Cached state goes out right away, then the reconcile reports the speaker's value.
+    assert adapter.sent_frames == ["50:7A:14", "50:7A:19"]
+    assert runner._cached_volume == 25
+
+
+def test_cec_handshake_is_answered_while_target_is_still_resolving(monkeypatch) -> None:
+    from devialetctl.application.deferred_gateway import DeferredVolumeGateway
+    from devialetctl.domain.events import InputEvent, InputEventType
+
+    class FakeGateway:
+        def __init__(self):
+            self.calls = []
+
+        async def get_volume_async(self):
+            return 30
+
+        async def get_mute_state_async(self):
+            return False
+
+        async def set_volume_async(self, volume):
+            self.calls.append(("set", volume))
+
+        async def volume_up_async(self):
+            self.calls.append("up")
+
+    inner = FakeGateway()
+
+    async def resolve():
+        await asyncio.sleep(0.1)
+        return inner
+
+    deferred = DeferredVolumeGateway(resolve=resolve)
+    sent: list[tuple[str, bool]] = []
+
+    class HandshakeAdapter:
+        def __init__(self, **kwargs):
+            pass
+
+        async def async_events(self):
+            for kind in (
+                InputEventType.GIVE_OSD_NAME,
+                InputEventType.SYSTEM_AUDIO_MODE_REQUEST,
+                InputEventType.VOLUME_UP,
+            ):
+                yield InputEvent(kind=kind, source="cec", key=kind.name)
+            while not inner.calls:
+                await asyncio.sleep(0.01)
+            raise KeyboardInterrupt()
+
+        def send_tx(self, frame: str) -> bool:
+            sent.append((frame, deferred.is_ready))
+            return True
+
+    monkeypatch.setattr("devialetctl.application.daemon.CecKernelAdapter", HandshakeAdapter)
+    cfg = DaemonConfig(target=RuntimeTarget(ip="10.0.0.2"), min_interval_s=0.0, dedupe_window_s=0.0)
+    runner = DaemonRunner(cfg=cfg, gateway=deferred)
+    try:
+        runner.run_cec_forever()
+    except KeyboardInterrupt:
+        pass
+
+    # Protocol replies went out before the speaker was known...
+    assert sent[:2] == [("50:47:44:65:76:69:61:6C:65:74", False), ("50:72:01", False)]
+    # ...and the queued key press was applied once the target resolved.
+    assert inner.calls == [("set", 31)]
+
+
+def test_target_resolution_failure_stops_the_daemon(monkeypatch) -> None:
+    from devialetctl.application.deferred_gateway import DeferredVolumeGateway
+
+    async def resolve():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("No service detected via mDNS/UPnP.")
+
+    class IdleAdapter:
+        def __init__(self, **kwargs):
+            pass
+
+        async def async_events(self):
+            await asyncio.Event().wait()
+            yield  # pragma: no cover
+
+        def send_tx(self, frame: str) -> bool:
+            return True
+
+    monkeypatch.setattr("devialetctl.application.daemon.CecKernelAdapter", IdleAdapter)
+    cfg = DaemonConfig(target=RuntimeTarget(ip="10.0.0.2"))
+    runner = DaemonRunner(cfg=cfg, gateway=DeferredVolumeGateway(resolve=resolve))
+
+    with pytest.raises(RuntimeError, match="No service detected"):
+        runner.run_cec_forever()
+
+
+def test_restored_audio_state_answers_first_requests_and_is_persisted(
+    monkeypatch, tmp_path
+) -> None:
+    import json
+
+    from devialetctl.domain.events import InputEvent, InputEventType
+
+    state_file = tmp_path / "state.json"
+    state_file.write_text(
+        json.dumps({"volume": 37, "muted": False, "vendor_state": 37, "target": "ip:10.0.0.2:80"})
+    )
+
+    class SlowGateway:
+        async def get_volume_async(self):
+            await asyncio.sleep(0.2)
+            return 40
+
+        async def get_mute_state_async(self):
+            return False
+
+    sent_frames: list[str] = []
+
+    class BootAdapter:
+        def __init__(self, **kwargs):
+            pass
+
+        async def async_events(self):
+            yield InputEvent(
+                kind=InputEventType.GIVE_AUDIO_STATUS, source="cec", key="GIVE_AUDIO_STATUS"
+            )
+            yield InputEvent(
+                kind=InputEventType.SAMSUNG_VENDOR_COMMAND,
+                source="cec",
+                key="SAMSUNG_VENDOR_COMMAND",
+                vendor_subcommand=0x95,
+                vendor_payload=(0x95, 0xFF),
+            )
+            raise KeyboardInterrupt()
+
+        def send_tx(self, frame: str) -> bool:
+            sent_frames.append(frame)
+            return True
+
+    monkeypatch.setattr("devialetctl.application.daemon.CecKernelAdapter", BootAdapter)
+    cfg = DaemonConfig(
+        target=RuntimeTarget(ip="10.0.0.2"),
+        cec_vendor_compat="samsung",
+        state_file=str(state_file),
+        state_target="ip:10.0.0.2:80",
+    )
+    runner = DaemonRunner(cfg=cfg, gateway=SlowGateway())
+    try:
+        runner.run_cec_forever()
+    except KeyboardInterrupt:
+        pass
+
+    # Answered from the restored state while the first speaker read was still in flight.
+    assert sent_frames == ["50:7A:25", "50:89:95:01:25"]
+    # The live read replaced the restored state and was saved on shutdown.
+    assert json.loads(state_file.read_text()) == {
+        "volume": 40,
+        "muted": False,
+        "vendor_state": 40,
+        "target": "ip:10.0.0.2:80",
+    }
+
+
+def test_saved_audio_state_of_another_target_is_not_restored(tmp_path) -> None:
+    import json
+
+    state_file = tmp_path / "state.json"
+    state_file.write_text(
+        json.dumps({"volume": 37, "muted": False, "vendor_state": 37, "target": "ip:10.0.0.2:80"})
+    )
+
+    def runner_for(state_target: str) -> DaemonRunner:
+        cfg = DaemonConfig(
+            target=RuntimeTarget(ip="10.0.0.2"),
+            state_file=str(state_file),
+            state_target=state_target,
+        )
+        return DaemonRunner(cfg=cfg, gateway=object())
+
+    assert runner_for("ip:10.0.0.2:80")._cached_volume == 37
+    other = runner_for("system:Bedroom")
+    assert other._cached_volume is None
+    assert other._audio_state_restored is False
+
+    other._store_live_audio_state(12, True)
+    other._persist_audio_state(force=True)
+    assert json.loads(state_file.read_text())["target"] == "system:Bedroom"
+
+
+def test_discovered_speaker_state_is_keyed_by_its_resolved_url(tmp_path) -> None:
+    import json
+
+    from devialetctl.application.deferred_gateway import DeferredVolumeGateway
+
+    class UrlGateway:
+        def __init__(self, base_url: str):
+            self.base_url = base_url
+
+    state_file = tmp_path / "state.json"
+    kitchen = "url:http://10.0.0.7:80/ipcontrol/v1"
+    state_file.write_text(
+        json.dumps({"volume": 37, "muted": False, "vendor_state": 37, "target": kitchen})
+    )
+    cfg = DaemonConfig(target=RuntimeTarget(), state_file=str(state_file))
+
+    def resolved_runner(base_url: str) -> DaemonRunner:
+        async def resolve():
+            return UrlGateway(base_url)
+
+        runner = DaemonRunner(cfg=cfg, gateway=DeferredVolumeGateway(resolve=resolve))
+        # Unknown speaker: nothing restored until discovery names it.
+        assert runner._cached_volume is None
+
+        async def _run() -> None:
+            with runner._abort_on_target_resolution_failure():
+                await runner.gateway.wait_ready()
+                await asyncio.sleep(0)
+
+        asyncio.run(_run())
+        return runner
+
+    other = resolved_runner("http://10.0.0.9:80/ipcontrol/v1")
+    assert other._cached_volume is None
+    same = resolved_runner("http://10.0.0.7:80/ipcontrol/v1")
+    assert (same._cached_volume, same._audio_state_restored) == (37, True)
+
+    other._store_live_audio_state(12, True)
+    other._persist_audio_state(force=True)
+    assert json.loads(state_file.read_text())["target"] == "url:http://10.0.0.9:80/ipcontrol/v1"
+
+
+def test_unpinned_target_without_a_gateway_url_neither_restores_nor_saves(tmp_path) -> None:
+    import json
+
+    state_file = tmp_path / "state.json"
+    saved = {"volume": 37, "muted": False, "vendor_state": 37, "target": None}
+    state_file.write_text(json.dumps(saved))
+    runner = DaemonRunner(
+        cfg=DaemonConfig(target=RuntimeTarget(), state_file=str(state_file)), gateway=object()
+    )
+
+    assert runner._cached_volume is None
+    runner._store_live_audio_state(12, True)
+    runner._persist_audio_state(force=True)
+    assert json.loads(state_file.read_text()) == saved
+
+
+def test_restored_audio_state_does_not_drive_absolute_volume_writes(tmp_path) -> None:
+    import json
+
+    state_file = tmp_path / "state.json"
+    state_file.write_text(
+        json.dumps({"volume": 37, "muted": False, "vendor_state": 37, "target": "ip:10.0.0.2:80"})
+    )
+
+    class FakeGateway:
+        def __init__(self):
+            self.calls = []
+
+        async def set_volume_async(self, volume):
+            self.calls.append(("set", volume))
+
+        async def volume_up_async(self):
+            self.calls.append("up")
+
+    gw = FakeGateway()
+    cfg = DaemonConfig(
+        target=RuntimeTarget(ip="10.0.0.2"),
+        state_file=str(state_file),
+        state_target="ip:10.0.0.2:80",
+    )
+    runner = DaemonRunner(cfg=cfg, gateway=gw)
+    assert runner._audio_state_restored is True
+
+    asyncio.run(runner._relative_step_async(delta=1, fallback=gw.volume_up_async))
+    runner._store_live_audio_state(37, False)
+    asyncio.run(runner._relative_step_async(delta=1, fallback=gw.volume_up_async))
+
+    assert gw.calls == ["up", ("set", 38)]
+
+
+def test_unreachable_speaker_pauses_polling_and_answers_from_cache() -> None:
+    from devialetctl.domain.events import InputEvent, InputEventType
+
+    class DownGateway:
+        available = False
+
+        def __init__(self):
+            self.calls = 0
+
+        async def get_volume_async(self):
+            self.calls += 1
+            await asyncio.sleep(2.5)
+            return 0
+
+        async def get_mute_state_async(self):
+            self.calls += 1
+            return False
+
+    class FakeAdapter:
+        def __init__(self):
+            self.sent_frames: list[str] = []
+
+        def send_tx(self, frame: str) -> bool:
+            self.sent_frames.append(frame)
+            return True
+
+    cfg = DaemonConfig(target=RuntimeTarget(ip="10.0.0.2"))
+    gw = DownGateway()
+    runner = DaemonRunner(cfg=cfg, gateway=gw)
+    runner._external_watch_interval_s = 0.01
+    adapter = FakeAdapter()
+    runner._cached_volume = 22
+    runner._cached_muted = False
+    give = InputEvent(kind=InputEventType.GIVE_AUDIO_STATUS, source="cec", key="GIVE")
+
+    async def _run() -> float:
+        runner._io_lock = asyncio.Lock()
+        stop = asyncio.Event()
+        watcher = asyncio.create_task(runner._watch_external_audio_state_async(adapter, stop))
+        await asyncio.sleep(0.05)
+        # Cold path (no mute state) would normally wait out the reply deadline.
+        runner._cached_muted = None
+        started = asyncio.get_running_loop().time()
+        await runner._handle_cec_event_async(adapter, give)
+        elapsed = asyncio.get_running_loop().time() - started
+        stop.set()
+        await watcher
+        return elapsed
+
+    elapsed = asyncio.run(_run())
+
+    assert gw.calls == 0
+    assert elapsed < 0.1
+    # Volume alone is no audio status: an unknown mute is aborted, not guessed.
+    assert adapter.sent_frames == ["50:00:71:01"]
+    assert runner.deadline_stats.feature_aborts == 1
+    assert runner.deadline_stats.fallback_replies == 0
@@ -0,0 +1,69 @@
+import asyncio
+import contextlib
+
+from devialetctl.application.deferred_gateway import DeferredVolumeGateway
+
+
+class _Gateway:
+    base_url = "http://10.0.0.2:80/ipcontrol/v1"
+
+    def __init__(self):
+        self.events: list[str] = []
+
+    @contextlib.asynccontextmanager
+    async def session(self):
+        self.events.append("open")
+        try:
+            yield self
+        finally:
+            self.events.append("close")
+
+    async def get_volume_async(self):
+        self.events.append("get")
+        return 42
+
+
+def test_calls_wait_for_resolution_and_share_the_resolved_session() -> None:
+    inner = _Gateway()
+    release = asyncio.Event()
+
+    async def resolve():
+        await release.wait()
+        return inner
+
+    async def _run() -> list[int]:
+        gateway = DeferredVolumeGateway(resolve=resolve)
+        async with gateway.session():
+            pending = [asyncio.ensure_future(gateway.get_volume_async()) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            assert not gateway.is_ready
+            assert gateway.base_url == "<resolving>"
+            assert inner.events == []
+            release.set()
+            volumes = await asyncio.gather(*pending)
+            assert gateway.base_url == inner.base_url
+        return volumes
+
+    assert asyncio.run(_run()) == [42, 42]
+    assert inner.events == ["open", "get", "get", "close"]
+
+
+def test_leaving_the_session_cancels_a_pending_resolution() -> None:
+    started = asyncio.Event()
+    cancelled: list[bool] = []
+
+    async def resolve():
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def _run() -> None:
+        gateway = DeferredVolumeGateway(resolve=resolve)
+        async with gateway.session():
+            await started.wait()
+
+    asyncio.run(_run())
+    assert cancelled == [True]
@@ -1,6 +1,6 @@
 import asyncio
 
-from devialetctl.infrastructure.devialet_gateway import DevialetHttpGateway
+from devialetctl.infrastructure.devialet_gateway import DevialetHttpGateway, SharedHttpPool
 
 
 def test_gateway_get_and_post_low_level(monkeypatch) -> None:
@@ -126,3 +126,180 @@ def test_gateway_mute_toggle_uses_group_unmute(monkeypatch) -> None:
     monkeypatch.setattr(gw, "_aget", fake_aget)
     asyncio.run(gw.mute_toggle_async())
     assert post_calls[0][0] == "/groups/current/sources/current/playback/unmute"
+
+
+def test_gateway_session_reuses_client_and_resets_after_transport_error(monkeypatch) -> None:
+    import httpx
+
+    from devialetctl.infrastructure import devialet_gateway
+
+    real_client = httpx.AsyncClient
+    created = []
+    fail_next = {"value": False}
+
+    def handler(request):
+        if fail_next["value"]:
+            fail_next["value"] = False
+            raise httpx.ConnectError("connection reset", request=request)
+        return httpx.Response(200, json={"volume": 17})
+
+    def client_factory(**kwargs):
+        client = real_client(transport=httpx.MockTransport(handler), **kwargs)
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(devialet_gateway.httpx, "AsyncClient", client_factory)
+    gw = DevialetHttpGateway(address="10.0.0.2")
+
+    async def _run() -> None:
+        async with gw.session():
+            assert await gw.get_volume_async() == 17
+            assert await gw.get_volume_async() == 17
+            assert len(created) == 1
+            fail_next["value"] = True
+            try:
+                await gw.get_volume_async()
+                assert False, "expected ConnectError"
+            except httpx.ConnectError:
+                pass
+            assert created[0].is_closed
+            assert await gw.get_volume_async() == 17
+            assert len(created) == 2
+        assert created[1].is_closed
+
+    asyncio.run(_run())
+
+
+def test_shared_pool_serves_several_gateways_with_one_client(monkeypatch) -> None:
+    import httpx
+
+    from devialetctl.infrastructure import devialet_gateway
+
+    real_client = httpx.AsyncClient
+    created = []
+    hosts = []
+
+    def handler(request):
+        hosts.append(request.url.host)
+        return httpx.Response(200, json={"volume": 17})
+
+    def client_factory(**kwargs):
+        client = real_client(transport=httpx.MockTransport(handler), **kwargs)
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(devialet_gateway.httpx, "AsyncClient", client_factory)
+    pool = devialet_gateway.SharedHttpPool()
+    living = pool.gateway("10.0.0.2")
+    bedroom = pool.gateway("10.0.0.3")
+
+    async def _run() -> None:
+        async with pool.session():
+            async with living.session():
+                assert await living.get_volume_async() == 17
+            # Leaving one gateway's session keeps the shared client open.
+            assert await bedroom.get_volume_async() == 17
+            assert not created[0].is_closed
+        assert created[0].is_closed
+
+    asyncio.run(_run())
+    assert len(created) == 1
+    assert hosts == ["10.0.0.2", "10.0.0.3"]
+
+
+def test_gateway_fails_fast_while_circuit_is_open_and_probes_recovery(monkeypatch) -> None:
+    import httpx
+    import pytest
+
+    from devialetctl.infrastructure import devialet_gateway
+    from devialetctl.infrastructure.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+    real_client = httpx.AsyncClient
+    requests: list[str] = []
+    down = {"value": True}
+
+    def handler(request):
+        requests.append(request.url.path)
+        if down["value"]:
+            raise httpx.ConnectTimeout("asleep", request=request)
+        return httpx.Response(200, json={"volume": 17})
+
+    monkeypatch.setattr(
+        devialet_gateway.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    now = {"t": 0.0}
+    gw = DevialetHttpGateway(
+        address="10.0.0.2",
+        breaker=CircuitBreaker(failure_threshold=2, reset_timeout_s=5.0, clock=lambda: now["t"]),
+    )
+
+    async def _run() -> None:
+        async with gw.session():
+            for _ in range(2):
+                with pytest.raises(httpx.ConnectTimeout):
+                    await gw.get_volume_async()
+            assert not gw.available
+            with pytest.raises(CircuitOpenError):
+                await gw.get_volume_async()
+            assert len(requests) == 2  # the open circuit did no I/O
+
+            now["t"] = 5.0
+            down["value"] = False
+            assert gw.available
+            assert await gw.get_volume_async() == 17
+
+    asyncio.run(_run())
+    volume_path = "/ipcontrol/v1/systems/current/sources/current/soundControl/volume"
+    assert requests[2:] == ["/ipcontrol/v1/devices/current", volume_path]
+
+
+def test_pooled_gateways_time_their_circuit_with_the_pool_clock() -> None:
+    now = {"t": 0.0}
+    pool = SharedHttpPool(clock=lambda: now["t"])
+    gw = pool.gateway("10.0.0.2")
+    for _ in range(gw.breaker.failure_threshold):
+        gw.breaker.record_failure()
+    assert not gw.available
+
+    now["t"] = gw.breaker.reset_timeout_s
+    assert gw.available
+
+
+def test_gateway_background_timeouts_do_not_open_the_circuit(monkeypatch) -> None:
+    import httpx
+    import pytest
+
+    from devialetctl.infrastructure import devialet_gateway
+    from devialetctl.infrastructure.adaptive_timeout import background_requests
+    from devialetctl.infrastructure.circuit_breaker import CircuitBreaker
+
+    real_client = httpx.AsyncClient
+
+    def handler(request):
+        raise httpx.ReadTimeout("slow", request=request)
+
+    monkeypatch.setattr(
+        devialet_gateway.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    gw = DevialetHttpGateway(address="10.0.0.2", breaker=CircuitBreaker(failure_threshold=2))
+
+    async def _run() -> None:
+        async with gw.session():
+            # A slow speaker missing the watcher's tight budget is not an unreachable one.
+            with background_requests():
+                for _ in range(3):
+                    with pytest.raises(httpx.ReadTimeout):
+                        await gw.get_volume_async()
+            assert gw.available
+            assert gw.breaker.failures == 0
+            # The same timeouts on a foreground request still count.
+            for _ in range(2):
+                with pytest.raises(httpx.ReadTimeout):
+                    await gw.get_volume_async()
+            assert not gw.available
+
+    asyncio.run(_run())
@@ -0,0 +1,46 @@
+import asyncio
+import sys
+
+import pytest
+
+from devialetctl.infrastructure import device_watcher
+from devialetctl.infrastructure.device_watcher import DeviceNodeWatcher
+
+
+def _create_later(path, delay_s: float) -> None:
+    asyncio.get_running_loop().call_later(delay_s, path.write_bytes, b"")
+
+
+def test_device_watcher_returns_immediately_when_node_exists(tmp_path) -> None:
+    node = tmp_path / "cec0"
+    node.write_bytes(b"")
+    watcher = DeviceNodeWatcher(str(node))
+    assert watcher.is_ready() is True
+    asyncio.run(asyncio.wait_for(watcher.wait_ready(), 0.5))
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_device_watcher_wakes_on_inotify_create(tmp_path) -> None:
+    node = tmp_path / "cec0"
+    # A long poll interval proves the wake-up comes from inotify, not from polling.
+    watcher = DeviceNodeWatcher(str(node), poll_interval_s=30.0)
+
+    async def _run() -> None:
+        _create_later(node, 0.05)
+        await asyncio.wait_for(watcher.wait_ready(), 2.0)
+
+    asyncio.run(_run())
+    assert watcher.is_ready() is True
+
+
+def test_device_watcher_falls_back_to_polling(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(device_watcher, "_inotify_watch", lambda _directory: None)
+    node = tmp_path / "cec0"
+    watcher = DeviceNodeWatcher(str(node), poll_interval_s=0.01)
+
+    async def _run() -> None:
+        _create_later(node, 0.05)
+        await asyncio.wait_for(watcher.wait_ready(), 2.0)
+
+    asyncio.run(_run())
+    assert watcher.is_ready() is True
@@ -0,0 +1,115 @@
+import asyncio
+
+from devialetctl.application.event_queue import CoalescingEventQueue
+from devialetctl.domain.events import InputEvent, InputEventType
+
+
+def _key(kind: InputEventType) -> InputEvent:
+    return InputEvent(kind=kind, source="cec", key=kind.name)
+
+
+def _level(value: int) -> InputEvent:
+    return InputEvent(
+        kind=InputEventType.SET_AUDIO_VOLUME_LEVEL,
+        source="cec",
+        key="SET_AUDIO_VOLUME_LEVEL",
+        value=value,
+        muted=False,
+    )
+
+
+def _drain(queue: CoalescingEventQueue) -> list[InputEvent]:
+    async def _run() -> list[InputEvent]:
+        queue.close()
+        events = []
+        while (item := await queue.get()) is not None:
+            events.append(item.event)
+        return events
+
+    return asyncio.run(_run())
+
+
+def test_queue_keeps_latest_set_audio_volume_level() -> None:
+    queue = CoalescingEventQueue(maxsize=8)
+    queue.put(_level(10), deadline=1.0)
+    queue.put(_key(InputEventType.MUTE), deadline=1.0)
+    queue.put(_level(20), deadline=2.0)
+    queue.put(_level(30), deadline=3.0)
+
+    assert queue.depth == 2
+    assert [(e.kind, e.value) for e in _drain(queue)] == [
+        (InputEventType.MUTE, None),
+        (InputEventType.SET_AUDIO_VOLUME_LEVEL, 30),
+    ]
+    assert queue.stats.coalesced == 2
+    assert queue.stats.dropped == 0
+
+
+def test_queue_keeps_latest_volume_level_after_earlier_relative_keys() -> None:
+    queue = CoalescingEventQueue(maxsize=8)
+    queue.put(_level(10), deadline=1.0)
+    queue.put(_key(InputEventType.VOLUME_UP), deadline=1.0)
+    queue.put(_level(20), deadline=2.0)
+
+    # The level set after the key press must win, so it is handled last.
+    assert [(e.kind, e.value) for e in _drain(queue)] == [
+        (InputEventType.VOLUME_UP, None),
+        (InputEventType.SET_AUDIO_VOLUME_LEVEL, 20),
+    ]
+
+
+def test_queue_merges_repeated_volume_keys_when_full_keeping_the_net_steps() -> None:
+    queue = CoalescingEventQueue(maxsize=3)
+    queue.put(_key(InputEventType.VOLUME_UP), deadline=1.0)
+    queue.put(_key(InputEventType.GIVE_AUDIO_STATUS), deadline=1.0)
+    queue.put(_key(InputEventType.VOLUME_DOWN), deadline=1.0)
+    for _ in range(4):
+        queue.put(_key(InputEventType.VOLUME_UP), deadline=1.0)
+    queue.put(_key(InputEventType.VOLUME_DOWN), deadline=1.0)
+
+    assert queue.depth == 3
+    assert queue.stats.coalesced == 5
+    assert queue.stats.dropped == 0
+    assert queue.stats.max_depth == 3
+
+    async def _items():
+        queue.close()
+        items = []
+        while (item := await queue.get()) is not None:
+            items.append((item.event.kind, item.repeats))
+        return items
+
+    items = asyncio.run(_items())
+    assert items == [
+        (InputEventType.VOLUME_UP, 5),
+        (InputEventType.GIVE_AUDIO_STATUS, 1),
+        (InputEventType.VOLUME_DOWN, 2),
+    ]
+    steps = {InputEventType.VOLUME_UP: 1, InputEventType.VOLUME_DOWN: -1}
+    assert sum(steps.get(kind, 0) * repeats for kind, repeats in items) == 5 - 2
+
+
+def test_queue_does_not_merge_a_key_ahead_of_a_later_volume_level() -> None:
+    queue = CoalescingEventQueue(maxsize=2)
+    queue.put(_key(InputEventType.VOLUME_UP), deadline=1.0)
+    queue.put(_level(20), deadline=1.0)
+    queue.put(_key(InputEventType.VOLUME_UP), deadline=1.0)
+
+    # Merging would apply the step before the level and lose it; the oldest goes instead.
+    assert [e.kind for e in _drain(queue)] == [
+        InputEventType.SET_AUDIO_VOLUME_LEVEL,
+        InputEventType.VOLUME_UP,
+    ]
+    assert queue.stats.dropped == 1
+    assert queue.stats.coalesced == 0
+
+
+def test_queue_drops_oldest_when_full_and_not_coalescible() -> None:
+    queue = CoalescingEventQueue(maxsize=2)
+    queue.put(_key(InputEventType.VOLUME_UP), deadline=1.0)
+    queue.put(_key(InputEventType.VOLUME_DOWN), deadline=1.0)
+    queue.put(_key(InputEventType.MUTE), deadline=1.0)
+
+    assert [e.kind for e in _drain(queue)] == [InputEventType.VOLUME_DOWN, InputEventType.MUTE]
+    assert queue.stats.dropped == 1
+    assert queue.stats.enqueued == 3
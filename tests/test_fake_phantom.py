@@ -0,0 +1,123 @@
+import asyncio
+import random
+import time
+
+import httpx
+import pytest
+
+from devialetctl.infrastructure.devialet_gateway import DevialetHttpGateway
+from devialetctl.infrastructure.fake_phantom import (
+    FakeDevice,
+    FakePhantomServer,
+    FakeSystem,
+    FaultRule,
+    fixed_latency,
+    lognormal_latency,
+)
+from devialetctl.interfaces.topology import build_topology_tree
+
+
+def _gateway(server: FakePhantomServer, index: int = 0) -> DevialetHttpGateway:
+    target = server.targets()[index]
+    return DevialetHttpGateway(address=target.address, port=target.port, base_path=target.base_path)
+
+
+def test_gateway_drives_fake_phantom_over_one_keep_alive_connection() -> None:
+    server = FakePhantomServer.single(volume=20)
+
+    async def scenario() -> tuple[int, bool]:
+        async with server.serve():
+            gateway = _gateway(server)
+            async with gateway.session():
+                await gateway.volume_up_async()
+                await gateway.volume_up_async()
+                await gateway.volume_down_async()
+                await gateway.set_volume_async(150)
+                await gateway.mute_toggle_async()
+                return await gateway.get_volume_async(), await gateway.get_mute_state_async()
+
+    assert asyncio.run(scenario()) == (100, True)
+    assert server.connections == 1
+    assert [request.path.rsplit("/", 1)[-1] for request in server.requests[:3]] == [
+        "volumeUp",
+        "volumeUp",
+        "volumeDown",
+    ]
+    assert all(request.status == 200 for request in server.requests)
+
+
+def test_topology_tree_from_multi_device_fake() -> None:
+    left = FakeDevice("dev-l", "Salon L", role="FrontLeft", serial="L1")
+    right = FakeDevice("dev-r", "Salon R", role="FrontRight", serial="R1", is_system_leader=False)
+    kitchen = FakeDevice("dev-k", "Kitchen", model="Phantom II")
+    server = FakePhantomServer(
+        systems=[
+            FakeSystem("sys-salon", "Salon", [left, right], group_id="g1"),
+            FakeSystem("sys-kitchen", "Kitchen", [kitchen], group_id="g2"),
+        ]
+    )
+
+    with server.serve_in_thread():
+        tree = build_topology_tree(server.targets())
+
+    assert tree["errors"] == []
+    systems = {
+        system["system_name"]: [device["device_name"] for device in system["devices"]]
+        for group in tree["groups"]
+        for system in group["systems"]
+    }
+    assert systems == {"Salon": ["Salon L", "Salon R"], "Kitchen": ["Kitchen"]}
+    assert {device.port for device in (left, right, kitchen)} == {
+        target.port for target in server.targets()
+    }
+
+
+def test_stereo_pair_devices_share_system_volume() -> None:
+    left = FakeDevice("dev-l", "L")
+    right = FakeDevice("dev-r", "R", is_system_leader=False)
+    server = FakePhantomServer(systems=[FakeSystem("sys", "Pair", [left, right], volume=10)])
+
+    async def scenario() -> int:
+        async with server.serve():
+            await _gateway(server, 0).set_volume_async(42)
+            return await _gateway(server, 1).get_volume_async()
+
+    assert asyncio.run(scenario()) == 42
+
+
+def test_fault_injection_status_drop_and_latency() -> None:
+    server = FakePhantomServer.single(
+        latency=fixed_latency(0.05),
+        faults=[
+            FaultRule(path="/systems", status=404),
+            FaultRule(method="POST", status=503, remaining=1),
+            FaultRule(path="/groups/current/sources/current", drop=True, remaining=1),
+        ],
+    )
+
+    async def scenario() -> None:
+        async with server.serve():
+            gateway = _gateway(server)
+            started = time.monotonic()
+            # /systems 404 falls back to /systems/current, as on older firmware.
+            assert (await gateway.systems_async())["systemName"] == "Living Room"
+            assert time.monotonic() - started >= 0.1
+            with pytest.raises(httpx.HTTPStatusError):
+                await gateway.volume_up_async()
+            await gateway.volume_up_async()
+            with pytest.raises(httpx.TransportError):
+                await gateway.get_mute_state_async()
+            assert await gateway.get_mute_state_async() is False
+
+    asyncio.run(scenario())
+    assert server.system.volume == 31
+    assert [request.status for request in server.requests] == [404, 200, 503, 200, 0, 200]
+
+
+def test_latency_models_are_reproducible_with_a_seed() -> None:
+    model = lognormal_latency(0.02, sigma=0.8, cap_s=0.5)
+    first, second = random.Random(7), random.Random(7)
+    samples = [model(first) for _ in range(500)]
+    assert samples == [model(second) for _ in range(500)]
+    assert all(0 < sample <= 0.5 for sample in samples)
+    assert 0.01 < sorted(samples)[250] < 0.04
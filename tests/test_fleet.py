@@ -0,0 +1,87 @@
+import asyncio
+import random
+
+from devialetctl.application.fleet import FleetMember, FleetPoller, FleetStateChange
+
+
+class _Gateway:
+    def __init__(self, volume=30, muted=False, delay_s=0.0, host_load=None):
+        self.volume = volume
+        self.muted = muted
+        self.delay_s = delay_s
+        self.host_load = host_load if host_load is not None else {"active": 0, "peak": 0}
+        self.polls = 0
+
+    async def get_volume_async(self):
+        self.polls += 1
+        if isinstance(self.volume, Exception):
+            raise self.volume
+        self.host_load["active"] += 1
+        self.host_load["peak"] = max(self.host_load["peak"], self.host_load["active"])
+        try:
+            await asyncio.sleep(self.delay_s)
+        finally:
+            self.host_load["active"] -= 1
+        return self.volume
+
+    async def get_mute_state_async(self):
+        return self.muted
+
+
+def test_fleet_slots_are_staggered_and_lag_does_not_burst() -> None:
+    now = {"t": 100.0}
+    members = [FleetMember(name=f"s{i}", host=f"h{i}", gateway=_Gateway()) for i in range(4)]
+    poller = FleetPoller(
+        members=members,
+        publish=lambda _c: None,
+        interval_s=2.0,
+        jitter=0.0,
+        clock=lambda: now["t"],
+    )
+    poller._seed_schedule()
+    assert sorted(due for due, _seq, _idx in poller._schedule) == [100.0, 100.5, 101.0, 101.5]
+
+    poller._schedule.clear()
+    poller._reschedule(0, due=100.0)
+    assert poller._schedule[0][0] == 102.0
+    # Far behind schedule: the next poll lands within one slot of now, not immediately.
+    now["t"] = 110.0
+    poller.rng = random.Random(1)
+    poller._schedule.clear()
+    poller._reschedule(0, due=100.0)
+    assert 110.0 <= poller._schedule[0][0] <= 110.5
+
+
+def test_fleet_caps_concurrency_per_host_and_publishes_changes_only() -> None:
+    host_load = {"active": 0, "peak": 0}
+    shared_host = [_Gateway(volume=10 + i, delay_s=0.03, host_load=host_load) for i in range(3)]
+    failing = _Gateway(volume=OSError("unreachable"))
+    members = [
+        FleetMember(name=f"room{i}", host="10.0.0.2", gateway=gw)
+        for i, gw in enumerate(shared_host)
+    ] + [FleetMember(name="garage", host="10.0.0.9", gateway=failing)]
+    published: list[FleetStateChange] = []
+    # Slots (20ms) are shorter than a poll (30ms): without the cap, polls would overlap.
+    poller = FleetPoller(
+        members=members, publish=published.append, interval_s=0.08, per_host_limit=1
+    )
+
+    async def _run() -> None:
+        stop = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.4, stop.set)
+        await poller.run(stop)
+
+    asyncio.run(_run())
+
+    assert host_load["peak"] == 1
+    assert all(gw.polls >= 2 for gw in shared_host)
+    assert failing.polls >= 2
+    # Repeated identical readings are published once per system.
+    assert sorted((c.name, c.volume, c.available) for c in published) == [
+        ("garage", None, False),
+        ("room0", 10, True),
+        ("room1", 11, True),
+        ("room2", 12, True),
+    ]
+    assert poller.stats.failures == failing.polls
+    assert poller.stats.changes == 4
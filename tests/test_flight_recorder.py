@@ -0,0 +1,143 @@
+import asyncio
+import json
+
+import httpx
+
+from devialetctl.application.daemon import DaemonRunner
+from devialetctl.infrastructure import cec_adapter, devialet_gateway
+from devialetctl.infrastructure.config import DaemonConfig, RuntimeTarget
+from devialetctl.infrastructure.devialet_gateway import DevialetHttpGateway
+from devialetctl.infrastructure.flight_recorder import FlightRecorder, RecordKind, recording
+from devialetctl.infrastructure.metrics_server import MetricsServer
+
+
+def test_ring_keeps_the_most_recent_records_oldest_first() -> None:
+    recorder = FlightRecorder(capacity=3)
+    for volume in range(5):
+        recorder.record_cec_rx(bytes([0x05, 0x7A, volume]), rx_ts_ns=volume)
+    assert len(recorder) == 3
+    assert recorder.total_recorded == 5
+    assert [record.payload[-1] for record in recorder.records()] == [2, 3, 4]
+
+
+def test_records_round_trip_frames_and_requests() -> None:
+    recorder = FlightRecorder()
+    recorder.record_cec_tx(b"\x50\x7a\x14", ok=True)
+    recorder.record_cec_tx_status(b"\x50\x7a\x14", tx_status=1, tx_ts_ns=123)
+    recorder.record_http("POST", "/mute", status=200, latency_s=0.25)
+    recorder.record_http("GET", "/volume", status=0, latency_s=1.5)
+    tx, tx_status, mute, volume = recorder.records()
+    assert (tx.kind, tx.status, tx.payload) == (RecordKind.CEC_TX, 1, b"\x50\x7a\x14")
+    assert tx_status.to_dict()["kernel_ts_ns"] == 123
+    assert mute.to_dict() == {
+        "ts_s": round(mute.ts_s, 6),
+        "kind": "http",
+        "endpoint": "POST /mute",
+        "status": 200,
+        "latency_s": 0.25,
+    }
+    assert (volume.endpoint, volume.status) == ("GET /volume", 0)
+
+
+def test_dump_writes_json_lines(tmp_path) -> None:
+    recorder = FlightRecorder()
+    recorder.record_cec_rx(b"\x05\x71", rx_ts_ns=7)
+    target = tmp_path / "dumps" / "fr.jsonl"
+    assert recorder.dump(str(target)) == 1
+    record = json.loads(target.read_text(encoding="utf-8"))
+    assert (record["kind"], record["frame"], record["kernel_ts_ns"]) == ("cec_rx", "05:71", 7)
+
+
+def test_kernel_adapter_records_rx_tx_and_tx_status(monkeypatch) -> None:
+    recorder = FlightRecorder()
+    adapter = cec_adapter.CecKernelAdapter(device="/dev/cec0", recorder=recorder)
+    adapter._fd = 7
+    received = []
+
+    def fake_ioctl(fd, request, arg=0, mutate_flag=True):
+        if request == cec_adapter.CEC_RECEIVE:
+            received.append(arg)
+            if len(received) == 1:
+                arg.sequence = 42
+                arg.tx_status = cec_adapter.CEC_TX_STATUS_OK
+                arg.tx_ts = 5_000
+                arg.len = 3
+                arg.msg[0], arg.msg[1], arg.msg[2] = 0x50, 0x7A, 0x1E
+            else:
+                arg.rx_status = 1
+                arg.rx_ts = 7_000
+                arg.len = 2
+                arg.msg[0], arg.msg[1] = 0x05, 0x71
+        return 0
+
+    monkeypatch.setattr(cec_adapter.fcntl, "ioctl", fake_ioctl)
+    assert adapter.send_tx("50:7A:1E") is True
+    adapter._receive_one_frame(7)
+    adapter._receive_one_frame(7)
+    tx, tx_status, rx = recorder.records()
+    assert (tx.kind, tx.payload, tx.status) == (RecordKind.CEC_TX, b"\x50\x7a\x1e", 1)
+    assert (tx_status.kind, tx_status.kernel_ts_ns) == (RecordKind.CEC_TX_STATUS, 5_000)
+    assert (rx.kind, rx.payload, rx.kernel_ts_ns) == (RecordKind.CEC_RX, b"\x05\x71", 7_000)
+
+
+def test_gateway_records_requests_only_while_recording(monkeypatch) -> None:
+    real_client = httpx.AsyncClient
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"volume": 12})
+
+    monkeypatch.setattr(
+        devialet_gateway.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    gateway = DevialetHttpGateway(address="10.0.0.2")
+    recorder = FlightRecorder()
+
+    async def _run() -> None:
+        async with gateway.session():
+            await gateway.get_volume_async()
+            with recording(recorder):
+                await gateway.get_volume_async()
+
+    asyncio.run(_run())
+    (record,) = recorder.records()
+    assert record.kind == RecordKind.HTTP
+    assert record.endpoint.startswith("GET ")
+    assert record.status == 200
+
+
+def test_daemon_dumps_recorder_to_file_and_debug_route(tmp_path) -> None:
+    cfg = DaemonConfig(
+        target=RuntimeTarget(ip="10.0.0.2"),
+        cec_device="/dev/cec1",
+        flight_recorder_size=16,
+        flight_recorder_dir=str(tmp_path),
+        metrics_port=0,
+    )
+    runner = DaemonRunner(cfg=cfg, gateway=object())
+    runner.flight_recorder.record_cec_rx(b"\x05\x71")
+    path = runner.dump_flight_recorder()
+    assert path is not None and path.startswith(str(tmp_path / "flight-recorder-cec1-"))
+    assert json.loads(open(path, encoding="utf-8").read())["kind"] == "cec_rx"
+
+    async def _get(server: MetricsServer) -> bytes:
+        async with server.serve():
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            writer.write(b"GET /debug/flight-recorder HTTP/1.0\r\n\r\n")
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            await writer.wait_closed()
+        return response
+
+    response = asyncio.run(_get(runner._metrics_server()))
+    assert response.startswith(b"HTTP/1.0 200 OK\r\n")
+    assert b'"frame": "05:71"' in response
+
+    disabled = DaemonRunner(
+        cfg=DaemonConfig(target=RuntimeTarget(ip="10.0.0.2"), flight_recorder_size=0),
+        gateway=object(),
+    )
+    assert disabled.flight_recorder is None
+    assert disabled.dump_flight_recorder() is None
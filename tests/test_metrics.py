@@ -0,0 +1,127 @@
+import asyncio
+
+from devialetctl.application.daemon import DaemonRunner
+from devialetctl.application.metrics import render_daemon_metrics
+from devialetctl.domain.events import InputEvent, InputEventType
+from devialetctl.infrastructure.cec_adapter import cec_opcode_label
+from devialetctl.infrastructure.config import DaemonConfig, RuntimeTarget
+from devialetctl.infrastructure.devialet_gateway import DevialetHttpGateway
+from devialetctl.infrastructure.latency_histogram import LatencyHistogram
+from devialetctl.infrastructure.metrics_server import MetricsServer
+
+
+def test_latency_histogram_buckets_are_cumulative() -> None:
+    histogram = LatencyHistogram(bounds_s=(0.01, 0.1))
+    for value in (0.005, 0.01, 0.05, 3.0):
+        histogram.observe(value)
+    assert histogram.cumulative() == [(0.01, 2), (0.1, 3), (float("inf"), 4)]
+    assert histogram.count == 4
+
+
+def test_cec_opcode_label_names_known_opcodes() -> None:
+    assert cec_opcode_label("05:71") == "GIVE_AUDIO_STATUS"
+    assert cec_opcode_label("05:89:95:01") == "SAMSUNG_VENDOR_COMMAND"
+    assert cec_opcode_label("05:FE") == "OPCODE_0xFE"
+    assert cec_opcode_label("05") == "POLL"
+
+
+def test_render_daemon_metrics_exposes_runner_and_gateway_stats() -> None:
+    gateway = DevialetHttpGateway(address="10.0.0.2")
+    gateway.latency_histogram("GET", "/devices/current").observe(0.02)
+    gateway.request_errors[("GET", "/devices/current")] = 1
+    runner = DaemonRunner(
+        cfg=DaemonConfig(target=RuntimeTarget(ip="10.0.0.2"), cec_device="/dev/cec1"),
+        gateway=gateway,
+    )
+    runner.cec_stats.record_rx("05:71")
+    runner.cec_stats.record_tx("50:7A:14", ok=True)
+    runner.cec_stats.record_tx("50:7A:14", ok=False)
+    runner.activity_stats.audio_status_cache_hits = 3
+    runner.activity_stats.audio_status_cache_misses = 1
+    runner.activity_stats.skip_watcher_poll("suspended")
+    runner.restart_counts["cec reader"] = 2
+
+    text = render_daemon_metrics([runner])
+
+    assert "# TYPE devialetctl_cec_rx_frames_total counter" in text
+    assert (
+        'devialetctl_cec_rx_frames_total{device="/dev/cec1",opcode="GIVE_AUDIO_STATUS"} 1' in text
+    )
+    assert (
+        'devialetctl_cec_tx_failures_total{device="/dev/cec1",opcode="REPORT_AUDIO_STATUS"} 1'
+        in text
+    )
+    assert 'devialetctl_audio_status_cache_hit_ratio{device="/dev/cec1"} 0.75' in text
+    assert 'devialetctl_watcher_skips_total{device="/dev/cec1",reason="suspended"} 1' in text
+    assert (
+        'devialetctl_component_restarts_total{device="/dev/cec1",component="cec reader"} 2' in text
+    )
+    labels = 'target="10.0.0.2:80",method="GET",endpoint="/devices/current"'
+    assert f'devialetctl_http_request_duration_seconds_bucket{{{labels},le="0.025"}} 1' in text
+    assert f"devialetctl_http_request_duration_seconds_count{{{labels}}} 1" in text
+    assert f"devialetctl_http_request_errors_total{{{labels}}} 1" in text
+    assert 'devialetctl_circuit_open{target="10.0.0.2:80"} 0' in text
+    # One HELP/TYPE header per family, however many samples it has.
+    assert text.count("# TYPE devialetctl_http_request_duration_seconds histogram") == 1
+
+
+def test_daemon_counts_policy_drops_and_cache_hits() -> None:
+    class FakeGateway:
+        async def get_volume_async(self):
+            return 20
+
+        async def get_mute_state_async(self):
+            return False
+
+        async def volume_up_async(self):
+            return None
+
+        async def volume_down_async(self):
+            return None
+
+    class FakeAdapter:
+        def send_tx(self, frame):
+            return True
+
+    cfg = DaemonConfig(target=RuntimeTarget(ip="10.0.0.2"), min_interval_s=10.0)
+    runner = DaemonRunner(cfg=cfg, gateway=FakeGateway())
+    adapter = FakeAdapter()
+    key = InputEvent(kind=InputEventType.VOLUME_UP, source="cec", key="VOLUME_UP")
+    give = InputEvent(kind=InputEventType.GIVE_AUDIO_STATUS, source="cec", key="GIVE_AUDIO_STATUS")
+
+    async def _run() -> None:
+        runner._io_lock = asyncio.Lock()
+        await runner._handle_cec_event_async(adapter, give)
+        await runner._handle_cec_event_async(adapter, give)
+        await runner._handle_cec_event_async(adapter, key)
+        await runner._handle_cec_event_async(adapter, key)
+
+    asyncio.run(_run())
+    stats = runner.activity_stats
+    assert (stats.audio_status_cache_misses, stats.audio_status_cache_hits) == (1, 1)
+    assert stats.policy_drops == 1
+
+
+def test_metrics_server_serves_scrapes_and_rejects_other_paths() -> None:
+    async def _get(port: int, path: str) -> bytes:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        await writer.wait_closed()
+        return response
+
+    async def _run() -> tuple[bytes, bytes, int]:
+        server = MetricsServer(render=lambda: "devialetctl_up 1\n", port=0)
+        async with server.serve():
+            ok = await _get(server.port, "/metrics")
+            missing = await _get(server.port, "/")
+        return ok, missing, server.scrapes
+
+    ok, missing, scrapes = asyncio.run(_run())
+    assert ok.startswith(b"HTTP/1.0 200 OK\r\n")
+    assert b"text/plain; version=0.0.4" in ok
+    assert ok.endswith(b"\r\n\r\ndevialetctl_up 1\n")
+    assert missing.startswith(b"HTTP/1.0 404")
+    assert scrapes == 1
@@ -0,0 +1,92 @@
+import json
+import sys
+
+import pytest
+
+from devialetctl.interfaces import cli
+from devialetctl.interfaces.microbench import (
+    MICRO_BENCHMARKS,
+    compare_microbenchmarks,
+    render_microbenchmark_lines,
+    run_microbenchmarks,
+    synthetic_topology,
+)
+from devialetctl.interfaces.topology import build_topology_tree
+
+
+def _report(**rows: tuple[float, float]) -> dict:
+    return {
+        "results": [
+            {"name": name, "ops_per_s": ops, "alloc_bytes_per_op": alloc}
+            for name, (ops, alloc) in rows.items()
+        ]
+    }
+
+
+def test_every_microbenchmark_reports_throughput_and_allocations() -> None:
+    report = run_microbenchmarks(min_time_s=0.005, repeat=2)
+
+    assert [row["name"] for row in report["results"]] == [b.name for b in MICRO_BENCHMARKS]
+    for row in report["results"]:
+        assert row["ops_per_s"] > 0
+        assert row["ns_per_op"] > 0
+        assert row["alloc_bytes_per_op"] >= 0
+    with pytest.raises(ValueError, match="nope"):
+        run_microbenchmarks(["nope"])
+
+
+def test_render_shows_a_dash_for_unmeasurable_throughput() -> None:
+    row = {"name": "noop", "ops_per_s": None, "ns_per_op": 0.0, "alloc_bytes_per_op": 0.0}
+    (line,) = render_microbenchmark_lines({"results": [row]})
+    assert line.split() == ["noop", "-", "ops/s", "0", "ns/op", "0", "B/op"]
+
+
+def test_synthetic_topology_builds_stereo_pairs() -> None:
+    targets, answers = synthetic_topology(100)
+
+    class CannedGateway:
+        def __init__(self, address, port, base_path):
+            self.address = address
+
+        async def fetch_json_async(self, path):
+            return answers[self.address][path]
+
+    tree = build_topology_tree(targets, gateway_factory=CannedGateway)
+    assert len(tree["groups"]) == 10
+    systems = [system for group in tree["groups"] for system in group["systems"]]
+    assert len(systems) == 50
+    assert all(len(system["devices"]) == 2 for system in systems)
+
+
+def test_compare_flags_slower_or_hungrier_benchmarks() -> None:
+    baseline = _report(fast=(1000.0, 100.0), slow=(1000.0, 100.0), fat=(1000.0, 100.0))
+    current = _report(fast=(1500.0, 100.0), slow=(700.0, 100.0), fat=(1000.0, 130.0), new=(1, 1))
+
+    rows = {row["name"]: row for row in compare_microbenchmarks(current, baseline, 0.2)}
+    assert rows["fast"]["speedup"] == 1.5
+    assert rows["fast"]["regressed"] is False
+    assert rows["slow"]["regressed"] is True
+    assert rows["fat"]["alloc_ratio"] == 1.3
+    assert rows["fat"]["regressed"] is True
+    assert rows["new"] == {"name": "new", "speedup": None, "regressed": False}
+
+
+def test_cli_bench_micro_saves_and_compares_baseline(monkeypatch, tmp_path, capsys) -> None:
+    baseline = tmp_path / "baseline.json"
+    argv = ["devialetctl", "--config", str(tmp_path / "missing.toml"), "bench", "micro"]
+    options = ["--only", "parse_cec_frame", "--min-time", "0.005"]
+    monkeypatch.setattr(sys, "argv", [*argv, *options, "--save", str(baseline)])
+    cli.main()
+    saved = json.loads(baseline.read_text())
+    assert [row["name"] for row in saved["results"]] == ["parse_cec_frame"]
+    capsys.readouterr()
+
+    # A baseline ten times faster than anything measurable: the run must fail.
+    saved["results"][0]["ops_per_s"] *= 10
+    baseline.write_text(json.dumps(saved))
+    monkeypatch.setattr(sys, "argv", [*argv, *options, "--baseline", str(baseline), "--json"])
+    with pytest.raises(SystemExit) as exc:
+        cli.main()
+    assert exc.value.code == 1
+    report = json.loads(capsys.readouterr().out)
+    assert report["comparison"][0]["regressed"] is True
@@ -0,0 +1,86 @@
+import asyncio
+import contextlib
+
+from devialetctl.application.daemon import DaemonRunner
+from devialetctl.application.multi_daemon import MultiDaemonRunner
+from devialetctl.domain.events import InputEvent, InputEventType
+from devialetctl.infrastructure.config import CecBinding, DaemonConfig, RuntimeTarget
+
+
+class _FakeGateway:
+    def __init__(self, volume: int):
+        self.volume = volume
+        self.calls: list[tuple[str, int]] = []
+
+    async def get_volume_async(self):
+        return self.volume
+
+    async def get_mute_state_async(self):
+        return False
+
+    async def set_volume_async(self, volume):
+        self.calls.append(("set", volume))
+
+    async def volume_up_async(self):
+        self.calls.append(("up", 0))
+
+
+def test_bindings_run_on_one_loop_with_separate_state(monkeypatch) -> None:
+    sent: dict[str, list[str]] = {}
+    loops: set[asyncio.AbstractEventLoop] = set()
+
+    class FakeAdapter:
+        def __init__(self, device, **kwargs):
+            self.device = device
+            sent[device] = []
+
+        async def async_events(self):
+            loops.add(asyncio.get_running_loop())
+            yield InputEvent(kind=InputEventType.GIVE_OSD_NAME, source="cec", key="OSD")
+            await asyncio.sleep(0.05)
+            yield InputEvent(kind=InputEventType.VOLUME_UP, source="cec", key="VOLUME_UP")
+            await asyncio.Event().wait()
+
+        def send_tx(self, frame: str) -> bool:
+            sent[self.device].append(frame)
+            return True
+
+    monkeypatch.setattr("devialetctl.application.daemon.CecKernelAdapter", FakeAdapter)
+    base = DaemonConfig(
+        target=RuntimeTarget(ip="10.0.0.2"), min_interval_s=0.0, dedupe_window_s=0.0
+    )
+    gateways = {"/dev/cec0": _FakeGateway(20), "/dev/cec1": _FakeGateway(60)}
+    runners = [
+        DaemonRunner(
+            cfg=base.for_binding(CecBinding(cec_device=device, cec_osd_name=name)),
+            gateway=gateways[device],
+        )
+        for device, name in (("/dev/cec0", "A"), ("/dev/cec1", "B"))
+    ]
+    sessions: list[str] = []
+
+    @contextlib.asynccontextmanager
+    async def shared_session():
+        sessions.append("open")
+        try:
+            yield
+        finally:
+            sessions.append("close")
+
+    multi = MultiDaemonRunner(runners=runners, shared_session=shared_session)
+
+    async def _run() -> None:
+        try:
+            await asyncio.wait_for(multi._run_async(), 0.3)
+        except asyncio.TimeoutError:
+            pass
+
+    asyncio.run(_run())
+
+    assert len(loops) == 1
+    assert sessions == ["open", "close"]
+    # Each binding answered with its own OSD name and stepped its own speaker.
+    assert sent["/dev/cec0"][0] == "50:47:41"
+    assert sent["/dev/cec1"][0] == "50:47:42"
+    assert gateways["/dev/cec0"].calls == [("set", 21)]
+    assert gateways["/dev/cec1"].calls == [("set", 61)]
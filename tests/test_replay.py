@@ -0,0 +1,164 @@
+import asyncio
+import json
+import math
+import sys
+
+import pytest
+
+from devialetctl.application.daemon import DaemonRunner
+from devialetctl.application.replay import (
+    InMemorySpeaker,
+    compare_replies,
+    replay_session,
+    run_replay,
+)
+from devialetctl.infrastructure import cec_replay
+from devialetctl.infrastructure.capture_file import CaptureWriter
+from devialetctl.infrastructure.cec_replay import (
+    CecReplayAdapter,
+    ReplayFrame,
+    load_replay_frames,
+)
+from devialetctl.infrastructure.config import DaemonConfig, RuntimeTarget
+from devialetctl.interfaces import cli
+
+_SAMSUNG = DaemonConfig(target=RuntimeTarget(ip="10.0.0.2"), cec_vendor_compat="samsung")
+
+
+def _record_session(path, replies: list[str]) -> None:
+    now = {"t": 100.0}
+    writer = CaptureWriter(str(path), clock=lambda: now["t"])
+    inbound = ["05:71", "05:44:41", "05:45", "05:73:20", "05:89:95:01"]
+    for step, frame in enumerate(inbound):
+        now["t"] = 100.0 + step * 0.1
+        writer.record_cec_rx(bytes.fromhex(frame.replace(":", "")))
+    writer.record_http("GET", "/volume", 200, 0.01)
+    for reply in replies:
+        writer.record_cec_tx(bytes.fromhex(reply.replace(":", "")), ok=True)
+    writer.record_cec_tx(b"\x50\x7a\x00", ok=False)  # refused by the kernel: never on the bus
+    writer.close()
+
+
+_REPLIES = ["50:7A:1E", "50:7A:1F", "50:7A:20", "50:89:95:01:20"]
+
+
+def test_load_replay_frames_keeps_spacing_and_sent_replies(tmp_path) -> None:
+    path = tmp_path / "session.bin"
+    _record_session(path, _REPLIES)
+    inbound, sent = load_replay_frames(str(path))
+    assert [frame.frame for frame in inbound] == [
+        "05:71",
+        "05:44:41",
+        "05:45",
+        "05:73:20",
+        "05:89:95:01",
+    ]
+    assert [round(frame.offset_s, 6) for frame in inbound] == [0.0, 0.1, 0.2, 0.3, 0.4]
+    assert [frame.frame for frame in sent] == _REPLIES
+
+
+def test_replay_reproduces_recorded_replies(tmp_path) -> None:
+    path = tmp_path / "session.bin"
+    _record_session(path, _REPLIES)
+    inbound, expected = load_replay_frames(str(path))
+    speaker = InMemorySpeaker(volume=30)
+
+    report = replay_session(
+        _SAMSUNG, inbound, expected, gateway=speaker, speed=math.inf, settle_s=0.1
+    )
+
+    assert report.ok, report.to_dict()
+    assert report.sent == _REPLIES
+    assert speaker.volume == 32  # one key step, then SET_AUDIO_VOLUME_LEVEL 0x20
+    assert len(report.reply_latencies_s) == len(_REPLIES)
+    assert report.speaker_calls == len(speaker.calls)
+
+
+def test_replay_paces_frames_by_speed() -> None:
+    frames = [ReplayFrame(0.0, "05:71"), ReplayFrame(0.4, "05:71")]
+    report = replay_session(_SAMSUNG, frames, speed=4.0, settle_s=0.0)
+    assert 0.09 <= report.duration_s < 0.4
+    assert report.expected == [] and report.ok
+
+
+def test_replay_rejects_non_positive_speed() -> None:
+    with pytest.raises(ValueError, match="greater than 0"):
+        CecReplayAdapter([ReplayFrame(0.0, "05:71")], speed=0.0)
+
+
+def test_replay_acks_are_stamped_with_the_daemon_clock() -> None:
+    runner, adapter = run_replay(
+        _SAMSUNG,
+        [ReplayFrame(0.0, "05:71")],
+        InMemorySpeaker(),
+        settle_s=0.0,
+        virtual_time=True,
+    )
+    assert adapter.clock == runner.clock
+
+    results = []
+    adapter.bind(clock=lambda: 12.5, tx_listener=results.append)
+
+    async def _send() -> None:
+        adapter.send_tx("50:7a:1e")
+        await asyncio.sleep(0)
+
+    asyncio.run(_send())
+    assert [result.tx_ts_ns for result in results] == [12_500_000_000]
+
+
+def test_replay_adapter_error_ends_the_run_without_reconnecting(monkeypatch) -> None:
+    def broken_parse(frame: str, source: str = "cec"):
+        raise RuntimeError(f"cannot parse {frame}")
+
+    def no_device_wait(self):
+        raise AssertionError("a replay must not wait for the CEC device node")
+
+    monkeypatch.setattr(cec_replay, "parse_cec_frame", broken_parse)
+    monkeypatch.setattr(DaemonRunner, "_wait_for_cec_device_return", no_device_wait)
+    with pytest.raises(RuntimeError, match="cannot parse 05:71"):
+        replay_session(_SAMSUNG, [ReplayFrame(0.0, "05:71")], speed=math.inf, settle_s=0.0)
+
+
+def test_cli_trace_replay_rejects_zero_speed(tmp_path, monkeypatch, capsys) -> None:
+    path = tmp_path / "session.bin"
+    _record_session(path, _REPLIES)
+    monkeypatch.setattr(sys, "argv", ["devialetctl", "trace", "replay", str(path), "--speed", "0"])
+    with pytest.raises(SystemExit) as exc:
+        cli.main()
+    assert exc.value.code == 2
+    assert "must be greater than 0" in capsys.readouterr().err
+
+
+def test_compare_replies_reports_missing_and_unexpected_in_order() -> None:
+    missing, unexpected = compare_replies(
+        ["50:7A:1E", "50:7A:1F", "50:72:01"], ["50:7A:1E", "50:7A:2F", "50:72:01"]
+    )
+    assert missing == ["50:7A:1F"]
+    assert unexpected == ["50:7A:2F"]
+
+
+def test_cli_trace_replay_exits_non_zero_on_divergence(tmp_path, monkeypatch, capsys) -> None:
+    path = tmp_path / "session.bin"
+    _record_session(path, ["50:7A:1E", "50:7A:7F"])
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "devialetctl",
+            "trace",
+            "replay",
+            str(path),
+            "--speed",
+            "inf",
+            "--cec-vendor-compat",
+            "samsung",
+            "--json",
+        ],
+    )
+    with pytest.raises(SystemExit) as exc:
+        cli.main()
+    assert exc.value.code == 1
+    report = json.loads(capsys.readouterr().out)
+    assert "50:7A:7F" in report["missing"]
+    assert report["ok"] is False
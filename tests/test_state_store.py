@@ -0,0 +1,28 @@
+from devialetctl.infrastructure.state_store import AudioStateSnapshot, AudioStateStore
+
+
+def test_state_store_round_trips_snapshot(tmp_path) -> None:
+    store = AudioStateStore(str(tmp_path / "nested" / "state.json"))
+    snapshot = AudioStateSnapshot(volume=42, muted=True, vendor_state=42)
+    assert store.save(snapshot) is True
+    assert store.load() == snapshot
+    assert [p.name for p in (tmp_path / "nested").iterdir()] == ["state.json"]
+
+
+def test_state_store_ignores_missing_corrupt_or_out_of_range_files(tmp_path) -> None:
+    path = tmp_path / "state.json"
+    store = AudioStateStore(str(path))
+    assert store.load() is None
+    path.write_text("{not json", encoding="utf-8")
+    assert store.load() is None
+    path.write_text('{"volume": 140, "muted": false}', encoding="utf-8")
+    assert store.load() is None
+    path.write_text('{"volume": 12, "muted": false}', encoding="utf-8")
+    assert store.load() == AudioStateSnapshot(volume=12, muted=False, vendor_state=12)
+
+
+def test_state_store_round_trips_target_identity(tmp_path) -> None:
+    store = AudioStateStore(str(tmp_path / "state.json"))
+    snapshot = AudioStateSnapshot(volume=9, muted=False, vendor_state=9, target="system:Bedroom")
+    assert store.save(snapshot) is True
+    assert store.load() == snapshot
@@ -5,6 +5,7 @@ from devialetctl.interfaces.topology import (
     build_topology_tree,
     pick_target_by_system_name,
     render_topology_tree_lines,
+    system_targets,
 )
 
 
@@ -96,3 +97,33 @@ def test_pick_target_by_system_name_raises_when_system_has_no_devices(monkeypatc
 
     with pytest.raises(RuntimeError, match="has no reachable devices"):
         pick_target_by_system_name([_svc("d1", "10.0.0.2")], "TV")
+
+
+def test_system_targets_picks_one_leader_per_system() -> None:
+    def dev(address, leader):
+        return {"address": address, "port": 80, "is_system_leader": leader}
+
+    tree = {
+        "groups": [
+            {
+                "group_id": "g1",
+                "systems": [
+                    {
+                        "system_name": "Living",
+                        "devices": [dev("10.0.0.2", False), dev("10.0.0.3", True)],
+                    },
+                    {"system_name": "Empty", "devices": []},
+                ],
+            },
+            {
+                "group_id": "g2",
+                "systems": [{"system_name": "Office", "devices": [dev("10.0.0.7", False)]}],
+            },
+        ],
+        "ungrouped_devices": [],
+        "errors": [],
+    }
+    assert [(t.name, t.address) for t in system_targets(tree)] == [
+        ("Living", "10.0.0.3"),
+        ("Office", "10.0.0.7"),
+    ]
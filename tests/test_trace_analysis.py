@@ -0,0 +1,129 @@
+import json
+import sys
+
+import pytest
+
+from devialetctl.infrastructure.capture_file import CaptureWriter
+from devialetctl.interfaces import cli, trace_analysis
+
+
+def _write_capture(path) -> None:
+    now = {"t": 0.0}
+    writer = CaptureWriter(str(path), clock=lambda: now["t"])
+
+    def at(ts_s: float):
+        now["t"] = ts_s
+        return writer
+
+    at(0.0).record_cec_rx(b"\x05\x44\x41")  # VOLUME_UP pressed
+    at(0.01).record_cec_rx(b"\x05\x44\x41")  # repeat, coalesced into the same write
+    at(0.05).record_http("POST", "/volumeUp", 200, 0.03)
+    at(0.06).record_cec_tx(b"\x50\x7a\x14", ok=True)
+    at(0.07).record_cec_tx_status(b"\x50\x7a\x14", tx_status=0x05, tx_ts_ns=1)  # OK after NACK
+    at(1.0).record_cec_rx(b"\x05\x73\x20")  # SET_AUDIO_VOLUME_LEVEL
+    at(1.2).record_http("POST", "/volume", 200, 0.1)
+    at(1.3).record_cec_tx_status(b"\x50\x7a\x14", tx_status=0x01, tx_ts_ns=2)
+    at(1.5).record_cec_rx(b"\x05\x89\x95\x01")
+    at(1.6).record_cec_rx(b"\x05\x89\x95\x01")
+    at(1.7).record_cec_rx(b"\x05\x89\x96\x10")
+    at(2.0).record_http("GET", "/volume", 200, 0.02)
+    at(3.0).record_http("GET", "/volume", 0, 2.5)
+    writer.close()
+
+
+def test_analyze_capture_reports_latency_retransmits_and_vendor_commands(tmp_path) -> None:
+    path = tmp_path / "capture.bin"
+    _write_capture(path)
+
+    report = trace_analysis.analyze_capture(str(path))
+
+    assert report["records"] == 13
+    key = report["key_to_speaker"]
+    assert key["count"] == 2
+    assert key["p50_s"] == pytest.approx(0.125)
+    assert key["histogram"][-1] == [float("inf"), 2]
+    assert report["cec_tx"]["REPORT_AUDIO_STATUS"] == {
+        "submitted": 1,
+        "refused": 0,
+        "reports": 2,
+        "retransmitted": 1,
+        "failed": 0,
+        "retransmit_rate": 0.5,
+    }
+    assert report["cec_rx"]["USER_CONTROL_PRESSED"] == 2
+    assert report["vendor_commands"] == {"TV": {"SYNC_TV_VOLUME_REQUEST": 2, "SYNC_TV_VOLUME": 1}}
+    http = report["http"]
+    assert http["endpoints"]["GET /volume"]["errors"] == 1
+    assert http["polling"]["get_requests"] == 2
+    assert http["polling"]["get_per_minute"] == 40.0
+    assert http["polling"]["get_share_of_http_time"] == pytest.approx(2.52 / 2.65, abs=1e-4)
+
+
+def _append_restarted_session(path) -> None:
+    # A later daemon run: its monotonic clock restarted below the first run's timestamps.
+    now = {"t": 0.0}
+    writer = CaptureWriter(str(path), clock=lambda: now["t"])
+    for ts_s in (0.5, 1.5, 2.5):
+        now["t"] = ts_s
+        writer.record_http("GET", "/volume", 200, 0.02)
+    writer.close()
+
+
+def test_duration_and_poll_rate_are_measured_per_session(tmp_path) -> None:
+    path = tmp_path / "capture.bin"
+    _write_capture(path)
+    _append_restarted_session(path)
+
+    report = trace_analysis.analyze_capture(str(path))
+
+    assert report["records"] == 16
+    assert report["duration_s"] == 5.0  # 3s + 2s, not max - min across both runs
+    assert report["http"]["polling"]["get_requests"] == 5
+    assert report["http"]["polling"]["get_per_minute"] == 60.0
+
+
+def test_numpy_and_pure_python_reports_agree(tmp_path, monkeypatch) -> None:
+    pytest.importorskip("numpy")
+    path = tmp_path / "capture.bin"
+    _write_capture(path)
+    _append_restarted_session(path)
+
+    vectorized = trace_analysis.analyze_capture(str(path))
+    monkeypatch.setattr(trace_analysis, "np", None)
+    pure = trace_analysis.analyze_capture(str(path))
+
+    assert (vectorized.pop("backend"), pure.pop("backend")) == ("numpy", "python")
+    assert vectorized == pure
+    assert json.dumps(vectorized, sort_keys=True) == json.dumps(pure, sort_keys=True)
+
+
+def test_pure_python_percentiles_match_numpy_linear_interpolation() -> None:
+    ordered = [0.01, 0.02, 0.03, 0.04]
+    assert trace_analysis._interpolate(ordered, 50.0) == pytest.approx(0.025)
+    assert trace_analysis._interpolate(ordered, 99.0) == pytest.approx(0.0397)
+    assert trace_analysis._interpolate([0.5], 99.0) == 0.5
+
+
+def test_cli_trace_analyze_prints_json_and_text(tmp_path, monkeypatch, capsys) -> None:
+    path = tmp_path / "capture.bin"
+    _write_capture(path)
+
+    monkeypatch.setattr(sys, "argv", ["devialetctl", "trace", "analyze", str(path), "--json"])
+    cli.main()
+    (report,) = json.loads(capsys.readouterr().out)
+    assert report["key_to_speaker"]["count"] == 2
+
+    monkeypatch.setattr(sys, "argv", ["devialetctl", "trace", "analyze", str(path)])
+    cli.main()
+    out = capsys.readouterr().out
+    assert "key -> speaker: n=2" in out
+    assert "tx REPORT_AUDIO_STATUS: submitted=1 failed=0 retransmit=50.0%" in out
+
+
+def test_cli_trace_analyze_rejects_foreign_files(tmp_path, monkeypatch, capsys) -> None:
+    path = tmp_path / "not-a-capture.txt"
+    path.write_text("CEC RX frame: 10:44:41\n", encoding="utf-8")
+    monkeypatch.setattr(sys, "argv", ["devialetctl", "trace", "analyze", str(path)])
+    with pytest.raises(SystemExit):
+        cli.main()
+    assert "not a devialetctl capture file" in capsys.readouterr().err
@@ -0,0 +1,185 @@
+import asyncio
+import json
+
+from devialetctl.application.daemon import DaemonRunner
+from devialetctl.domain.events import InputEvent, InputEventType
+from devialetctl.infrastructure import cec_adapter
+from devialetctl.infrastructure.config import DaemonConfig, RuntimeTarget
+from devialetctl.infrastructure.tracing import (
+    EventTracer,
+    JsonlTraceSink,
+    TraceStageStats,
+    current_trace,
+    trace_span,
+)
+
+_MUTE = InputEvent(kind=InputEventType.MUTE, source="cec", key="MUTE", rx_ts_ns=10_000_000_000)
+
+
+def test_trace_span_is_a_no_op_without_an_active_trace() -> None:
+    assert current_trace() is None
+    with trace_span("GET /volume"):
+        pass
+    assert current_trace() is None
+
+
+def test_tracer_exports_once_handled_and_tx_status_reported(tmp_path) -> None:
+    now = {"t": 10.001}
+    stages = TraceStageStats()
+    exported = []
+    tracer = EventTracer(
+        sinks=[stages, exported.append, JsonlTraceSink(str(tmp_path / "t.jsonl"))],
+        clock=lambda: now["t"],
+        kernel_tx_results=True,
+    )
+    trace = tracer.begin(_MUTE)
+    now["t"] = 10.002
+    tracer.mark_dequeued(trace)
+    with tracer.activate(trace):
+        with trace_span("POST /mute"):  # timed by the tracer's clock
+            now["t"] = 10.012
+        tracer.record_tx_submit("50:7a:8b")
+    now["t"] = 10.013
+    tracer.record_tx_sent("50:7A:8B", ok=True)
+    tracer.finish(trace)
+    assert exported == []  # still waiting for the kernel TX status
+
+    tracer.record_tx_result("50:7A:8B", tx_status=1, tx_ts_ns=10_020_000_000, ok=True)
+    assert exported == [trace]
+    durations = trace.stage_durations()
+    assert round(durations["kernel_to_daemon"], 6) == 0.001
+    assert round(durations["queue_wait"], 6) == 0.001
+    assert round(durations["gateway"], 6) == 0.01
+    assert round(durations["rx_to_tx"], 6) == 0.012
+    assert round(durations["kernel_rx_to_tx"], 6) == 0.02
+    assert stages.stages["kernel_rx_to_tx"].count == 1
+    record = json.loads((tmp_path / "t.jsonl").read_text(encoding="utf-8"))
+    assert record["kind"] == "mute"
+    assert record["spans"][0]["name"] == "POST /mute"
+    assert record["tx"][0]["tx_ts_ns"] == 10_020_000_000
+
+
+def test_tracer_exports_without_tx_status_after_wait_and_drops_abandoned() -> None:
+    now = {"t": 0.0}
+    exported = []
+    tracer = EventTracer(
+        sinks=[exported.append], clock=lambda: now["t"], kernel_tx_results=True, abandon_s=5.0
+    )
+    handled = tracer.begin(_MUTE)
+    tracer.begin(_MUTE)  # coalesced away in the queue: never handled
+    with tracer.activate(handled):
+        tracer.record_tx_submit("50:7A:8B")
+    tracer.record_tx_sent("50:7A:8B", ok=True)
+    tracer.finish(handled)
+    assert exported == []
+    now["t"] = 1.0
+    tracer.flush()
+    assert exported == [handled]
+    now["t"] = 6.0
+    tracer.flush()
+    assert tracer.stats.dropped == 1
+    assert tracer.stats.exported == 1
+
+
+def test_kernel_adapter_reports_tx_status_and_rx_timestamp(monkeypatch) -> None:
+    results = []
+    adapter = cec_adapter.CecKernelAdapter(device="/dev/cec0", tx_listener=results.append)
+    adapter._fd = 7
+    received = []
+
+    def fake_ioctl(fd, request, arg=0, mutate_flag=True):
+        if request == cec_adapter.CEC_TRANSMIT:
+            arg.sequence = 42
+        elif request == cec_adapter.CEC_RECEIVE:
+            received.append(arg)
+            if len(received) == 1:
+                arg.sequence = 42
+                arg.tx_status = cec_adapter.CEC_TX_STATUS_OK
+                arg.tx_ts = 5_000
+            else:
+                arg.rx_status = 1
+                arg.rx_ts = 7_000
+                arg.len = 2
+                arg.msg[0] = 0x05
+                arg.msg[1] = 0x71
+        return 0
+
+    monkeypatch.setattr(cec_adapter.fcntl, "ioctl", fake_ioctl)
+    assert adapter.send_tx("50:7A:1E") is True
+    assert adapter._receive_one_frame(7) == ""
+    assert results == [
+        cec_adapter.CecTxResult(sequence=42, frame="50:7A:1E", tx_status=1, tx_ts_ns=5_000)
+    ]
+    assert results[0].ok
+    assert adapter._receive_one_frame(7) == "05:71"
+    assert adapter._last_rx_ts_ns == 7_000
+
+
+def test_daemon_traces_event_through_gateway_to_tx(monkeypatch, tmp_path) -> None:
+    class FakeGateway:
+        async def get_volume_async(self):
+            with trace_span("GET volume"):
+                return 11
+
+        async def get_mute_state_async(self):
+            with trace_span("GET mute"):
+                return False
+
+        async def mute_toggle_async(self):
+            with trace_span("POST mute"):
+                await asyncio.sleep(0.01)
+
+        async def volume_up_async(self):
+            return None
+
+        async def volume_down_async(self):
+            return None
+
+    class OneShotAdapter:
+        def __init__(self, **kwargs):
+            self.tx_listener = kwargs.get("tx_listener")
+            self.sent = []
+
+        async def async_events(self):
+            yield _MUTE
+            await asyncio.sleep(0.05)
+            for frame in self.sent:
+                self.tx_listener(
+                    cec_adapter.CecTxResult(
+                        sequence=1, frame=frame, tx_status=1, tx_ts_ns=10_030_000_000
+                    )
+                )
+            raise KeyboardInterrupt()
+
+        def send_tx(self, frame: str) -> bool:
+            self.sent.append(frame)
+            return True
+
+    monkeypatch.setattr("devialetctl.application.daemon.CecKernelAdapter", OneShotAdapter)
+    trace_file = tmp_path / "trace.jsonl"
+    cfg = DaemonConfig(
+        target=RuntimeTarget(ip="10.0.0.2"),
+        min_interval_s=0.0,
+        dedupe_window_s=0.0,
+        state_file="",
+        trace_file=str(trace_file),
+    )
+    runner = DaemonRunner(cfg=cfg, gateway=FakeGateway())
+    # Keep the watcher out of the way; only the event's own calls belong to its trace.
+    runner._external_watch_suspend_s = 10.0
+    runner._suspend_external_watch_for_push()
+    try:
+        runner.run_cec_forever()
+    except KeyboardInterrupt:
+        pass
+
+    records = [json.loads(line) for line in trace_file.read_text(encoding="utf-8").splitlines()]
+    assert len(records) == 1
+    record = records[0]
+    assert record["kind"] == "mute"
+    assert record["rx_ts_ns"] == 10_000_000_000
+    assert [span["name"] for span in record["spans"]] == ["POST mute", "GET volume", "GET mute"]
+    assert record["tx"][0]["frame"] == "50:7A:0B"
+    assert record["tx"][0]["tx_ts_ns"] == 10_030_000_000
+    assert record["stages"]["kernel_rx_to_tx"] == 0.03
+    assert runner.trace_stats.stages["gateway"].count == 1
@@ -0,0 +1,135 @@
+import asyncio
+
+from devialetctl.application.tx_scheduler import CecTxScheduler, TxOutcome, TxPriority
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_tx_scheduler_sends_immediately_within_budget() -> None:
+    sent: list[str] = []
+    scheduler = CecTxScheduler(send=lambda f: sent.append(f) or True, burst=2, clock=FakeClock())
+
+    assert scheduler.submit("50:72:01") is TxOutcome.SENT
+    assert scheduler.submit("50:7E:01") is TxOutcome.SENT
+
+    assert sent == ["50:72:01", "50:7E:01"]
+    assert scheduler.depth == 0
+    assert scheduler.stats.sent == 2
+
+
+def test_tx_scheduler_reports_immediate_send_failure() -> None:
+    scheduler = CecTxScheduler(send=lambda _f: False, clock=FakeClock())
+    assert scheduler.submit("50:C0") is TxOutcome.FAILED
+    assert scheduler.stats.failed == 1
+
+
+def test_tx_scheduler_prioritizes_replies_and_coalesces_reports() -> None:
+    sent: list[str] = []
+    clock = FakeClock()
+    scheduler = CecTxScheduler(
+        send=lambda f: sent.append(f) or True,
+        frames_per_s=4.0,
+        burst=1,
+        clock=clock,
+    )
+
+    assert scheduler.submit("50:7A:10", TxPriority.REPORT, coalesce_key="50:7A") is TxOutcome.SENT
+    assert scheduler.submit("50:7A:11", TxPriority.REPORT, coalesce_key="50:7A") is TxOutcome.QUEUED
+    scheduler.submit("50:7A:12", TxPriority.REPORT, coalesce_key="50:7A")
+    scheduler.submit("50:47:41", TxPriority.REPLY)
+    scheduler.submit("50:7A:13", TxPriority.REPORT, coalesce_key="50:7A")
+
+    assert sent == ["50:7A:10"]
+    assert scheduler.depth == 2
+    assert scheduler.stats.coalesced == 2
+
+    clock.now += 0.25
+    scheduler._pump()
+    assert sent == ["50:7A:10", "50:47:41"]
+
+    clock.now += 0.25
+    scheduler._pump()
+    assert sent == ["50:7A:10", "50:47:41", "50:7A:13"]
+
+
+def test_tx_scheduler_reply_supersedes_pending_report_with_same_key() -> None:
+    sent: list[str] = []
+    clock = FakeClock()
+    scheduler = CecTxScheduler(send=lambda f: sent.append(f) or True, burst=1, clock=clock)
+
+    scheduler.submit("50:90:00", TxPriority.REPLY)
+    scheduler.submit("50:47:41", TxPriority.REPLY)
+    scheduler.submit("50:7A:10", TxPriority.REPORT, coalesce_key="50:7A")
+    scheduler.submit("50:7A:20", TxPriority.REPLY, coalesce_key="50:7A")
+    while scheduler.depth:
+        clock.now += 1.0
+        scheduler._pump()
+
+    assert sent == ["50:90:00", "50:47:41", "50:7A:20"]
+
+
+def test_tx_scheduler_run_drains_when_budget_refills() -> None:
+    sent: list[str] = []
+    scheduler = CecTxScheduler(
+        send=lambda f: sent.append(f) or True,
+        frames_per_s=200.0,
+        burst=1,
+    )
+
+    async def _run() -> None:
+        task = asyncio.create_task(scheduler.run())
+        for frame in ("50:72:01", "50:7E:01", "50:C0"):
+            scheduler.submit(frame)
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+    asyncio.run(_run())
+    assert sent == ["50:72:01", "50:7E:01", "50:C0"]
+    assert scheduler.stats.deferred == 2
+
+
+def test_tx_scheduler_survives_a_raising_send() -> None:
+    sent: list[str] = []
+
+    def send(frame: str) -> bool:
+        if frame == "50:C0":
+            raise OSError("bad file descriptor")
+        sent.append(frame)
+        return True
+
+    scheduler = CecTxScheduler(send=send, frames_per_s=200.0, burst=1)
+
+    async def _run() -> None:
+        task = asyncio.create_task(scheduler.run())
+        for frame in ("50:72:01", "50:C0", "50:7E:01"):
+            scheduler.submit(frame)
+        await asyncio.sleep(0.05)
+        assert not task.done()
+        task.cancel()
+
+    asyncio.run(_run())
+    assert sent == ["50:72:01", "50:7E:01"]
+    assert scheduler.stats.failed == 1
+
+
+def test_tx_scheduler_drop_pending_forgets_queued_frames() -> None:
+    sent: list[str] = []
+    scheduler = CecTxScheduler(send=lambda f: sent.append(f) or True, burst=1, clock=FakeClock())
+
+    scheduler.submit("50:72:01")
+    assert scheduler.submit("50:7A:10", TxPriority.REPORT, coalesce_key="50:7A") is TxOutcome.QUEUED
+    assert scheduler.submit("50:C0") is TxOutcome.QUEUED
+
+    assert scheduler.drop_pending() == 2
+    assert scheduler.depth == 0
+    assert sent == ["50:72:01"]
+    assert scheduler.stats.dropped == 2
+    # A dropped keyed frame no longer absorbs new reports.
+    assert scheduler.submit("50:7A:11", TxPriority.REPORT, coalesce_key="50:7A") is TxOutcome.QUEUED
+    assert scheduler.depth == 1
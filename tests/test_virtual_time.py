@@ -0,0 +1,101 @@
+import asyncio
+import time
+
+from devialetctl.application.replay import InMemorySpeaker, offline_config, run_replay
+from devialetctl.domain.events import InputEvent, InputEventType
+from devialetctl.domain.policy import EventPolicy
+from devialetctl.infrastructure.cec_replay import ReplayFrame
+from devialetctl.infrastructure.config import DaemonConfig, RuntimeTarget
+from devialetctl.infrastructure.virtual_time import VirtualClock, run_virtual
+
+_CFG = offline_config(DaemonConfig(target=RuntimeTarget(ip="10.0.0.2")))
+
+
+def test_virtual_loop_jumps_to_each_timer_in_order() -> None:
+    fired: list[tuple[str, float]] = []
+
+    async def scenario() -> float:
+        loop = asyncio.get_running_loop()
+        loop.call_later(7200.0, lambda: fired.append(("late", loop.time())))
+        loop.call_later(0.25, lambda: fired.append(("early", loop.time())))
+        await asyncio.sleep(3600.0)
+        try:
+            await asyncio.wait_for(asyncio.Event().wait(), 5.0)
+        except asyncio.TimeoutError:
+            fired.append(("timeout", loop.time()))
+        await asyncio.sleep(3600.0)
+        return loop.time()
+
+    started = time.perf_counter()
+    assert run_virtual(scenario(), start_s=100.0) == 7305.0
+    assert time.perf_counter() - started < 1.0
+    assert fired == [("early", 100.25), ("timeout", 3705.0), ("late", 7300.0)]
+
+
+def test_event_policy_reads_the_injected_clock() -> None:
+    clock = VirtualClock()
+    policy = EventPolicy(dedupe_window_s=0.08, min_interval_s=0.12, clock=clock)
+    event = InputEvent(kind=InputEventType.VOLUME_UP, source="cec", key="VOLUME_UP")
+
+    assert policy.should_emit(event) is True
+    clock.advance(0.1)
+    assert policy.should_emit(event) is False
+    clock.advance(0.12)
+    assert policy.should_emit(event) is True
+
+
+class _TimedSpeaker(InMemorySpeaker):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.writes: list[float] = []
+
+    async def set_volume_async(self, volume: int) -> None:
+        await super().set_volume_async(volume)
+        self.writes.append(asyncio.get_running_loop().time())
+
+
+def _holds(count: int, gap_s: float, presses: int = 5, repeat_s: float = 0.2) -> list[ReplayFrame]:
+    # Alternate up/down holds so the volume never clamps.
+    frames = []
+    for hold in range(count):
+        start_s = 1.0 + hold * gap_s
+        key = "05:44:41" if hold % 2 == 0 else "05:44:42"
+        frames += [ReplayFrame(start_s + i * repeat_s, key) for i in range(presses)]
+        frames.append(ReplayFrame(start_s + presses * repeat_s, "05:45"))
+    return frames
+
+
+def _soak(frames: list[ReplayFrame]) -> tuple[_TimedSpeaker, object, object]:
+    speaker = _TimedSpeaker(volume=50, latency_s=0.03)
+    runner, adapter = run_replay(_CFG, frames, speaker, settle_s=1.0, virtual_time=True)
+    return speaker, runner, adapter
+
+
+def test_eight_hour_session_with_hundreds_of_holds_runs_in_seconds() -> None:
+    frames = _holds(300, gap_s=96.0)
+    started = time.perf_counter()
+    speaker, runner, adapter = _soak(frames)
+
+    assert time.perf_counter() - started < 30.0
+    assert adapter.finished_s - adapter.started_s == frames[-1].offset_s == 28706.0
+    # Every held repeat is 200 ms apart (above min_interval_s), so each one is a step.
+    assert runner.activity_stats.policy_drops == 0
+    assert speaker.volume == 50
+    assert len(speaker.writes) == 1500
+    # The watcher polls every 0.5 s (plus two 30 ms reads) except while keys suspend it.
+    assert 45_000 < runner.activity_stats.watcher_polls < 52_000
+
+
+def test_virtual_sessions_are_exactly_reproducible() -> None:
+    frames = _holds(12, gap_s=61.7)
+    first, first_runner, _ = _soak(frames)
+    second, second_runner, _ = _soak(frames)
+
+    assert first.writes == second.writes
+    assert first.calls == second.calls
+    assert first_runner.activity_stats == second_runner.activity_stats
+    # A write lands one speaker latency after its key unless a watcher poll holds the
+    # I/O lock: never sooner, never more than one poll (two reads) later.
+    keys = [frame.offset_s for frame in frames if frame.frame != "05:45"]
+    for key_s, write_s in zip(keys, first.writes):
+        assert 0.03 - 1e-9 <= write_s - key_s <= 0.09 + 1e-9